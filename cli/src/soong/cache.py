@@ -0,0 +1,93 @@
+"""On-disk TTL cache for Lambda API responses."""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install soong[fast]
+    orjson = None
+
+CACHE_DIR = Path.home() / ".config" / "gpu-dashboard" / "cache"
+
+
+def _cache_file(name: str) -> Path:
+    return CACHE_DIR / f"{name}.json"
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _key_digest(key: str) -> str:
+    # Never store the API key itself, only enough of a hash to tell accounts apart
+    return hashlib.sha256(str(key).encode()).hexdigest()[:16]
+
+
+def read_cache(name: str, key: str, ttl: float) -> Optional[Any]:
+    """
+    Read a cached value if it is fresh and belongs to the same API key.
+
+    Args:
+        name: Cache name (file stem)
+        key: API key the value was fetched with
+        ttl: Maximum age in seconds
+
+    Returns:
+        Cached data, or None if missing, stale, or unreadable
+    """
+    try:
+        with open(_cache_file(name), 'rb') as f:
+            entry = _loads(f.read())
+    except (ValueError, OSError):
+        return None
+
+    if not isinstance(entry, dict) or entry.get("key") != _key_digest(key):
+        return None
+
+    age = time.time() - entry.get("fetched_at", 0)
+    if age < 0 or age > ttl:
+        return None
+
+    return entry.get("data")
+
+
+def write_cache(name: str, key: str, data: Any) -> None:
+    """
+    Store a value in the cache. Failures are ignored; the cache is best-effort.
+
+    Args:
+        name: Cache name (file stem)
+        key: API key the value was fetched with
+        data: JSON-serializable data
+    """
+    entry = {"key": _key_digest(key), "fetched_at": time.time(), "data": data}
+    try:
+        payload = _dumps(entry)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_cache_file(name), 'wb') as f:
+            f.write(payload)
+    except (TypeError, ValueError, OSError):
+        # A partial write leaves invalid JSON, which read_cache treats as a miss
+        pass
+
+
+def clear_cache(name: str) -> None:
+    """
+    Remove a cached value.
+
+    Args:
+        name: Cache name (file stem)
+    """
+    _cache_file(name).unlink(missing_ok=True)
@@ -1,24 +1,28 @@
 """CLI interface for GPU session management."""
 
 import click
+import functools
+import re
 import typer
-import secrets
-import questionary
 from pathlib import Path
-from typing import Optional, Dict
+from typing import TYPE_CHECKING, Optional, Dict
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.style import Style
+from rich.text import Text
 from rich import print as rprint
 from datetime import datetime, timezone
 
-import requests
-
 from .config import Config, ConfigManager, LambdaConfig, StatusDaemonConfig, DefaultsConfig, SSHConfig, CloudflareConfig, TunnelConfig, validate_custom_model
-from .pending import save_pending_event, sync_pending_events
-from .lambda_api import LambdaAPI, LambdaAPIError, InstanceType
-from .mock import MockLambdaAPI
-from .instance import InstanceManager
+from .lambda_api import LambdaAPI, LambdaAPIError, InstanceType, parse_timestamp
+from .instance import InstanceManager, WaiterConfig, read_cached_instance
+from .cache import read_cache, write_cache
+from .session import http_session as _http_session
+
+if TYPE_CHECKING:
+    # requests costs ~90ms to import; commands that talk HTTP import it locally
+    import requests
 
 
 # Mock mode flag - set by SOONG_MOCK=1 env var or hidden --mock CLI option
@@ -27,6 +31,12 @@ import os
 _mock_mode: bool = os.environ.get("SOONG_MOCK", "").lower() in ("1", "true", "yes")
 
 
+@functools.lru_cache(maxsize=4)
+def _api_for(api_key: str) -> LambdaAPI:
+    """One API client, and so one keep-alive session, per key per process."""
+    return LambdaAPI(api_key)
+
+
 def get_api(config) -> LambdaAPI:
     """Get API client, using mock if --mock flag was passed.
 
@@ -35,15 +45,86 @@ def get_api(config) -> LambdaAPI:
     realistic state transitions (booting -> active -> terminated).
     """
     if _mock_mode:
+        from .mock import MockLambdaAPI
         return MockLambdaAPI(config.lambda_config.api_key)
-    return LambdaAPI(config.lambda_config.api_key)
-from .validation import LaunchValidator
+    return _api_for(config.lambda_config.api_key)
+
+
+# Seconds to reuse the on-disk instance list between commands
+INSTANCE_CACHE_TTL = 15
+
+
+def get_instance_manager(api) -> InstanceManager:
+    """Get instance manager, sharing a short-lived instance list cache.
+
+    The cache is disabled in mock mode, where state lives in the mock file.
+    """
+    return InstanceManager(api, cache_ttl=0 if _mock_mode else INSTANCE_CACHE_TTL)
+
+
+# Seconds to reuse the Lambda account's SSH key names
+SSH_KEYS_CACHE_TTL = 3600
+
+
+def get_ssh_key_names(api, refresh: bool = False) -> list[str]:
+    """List Lambda SSH key names, cached on disk for SSH_KEYS_CACHE_TTL.
+
+    An empty cached list counts as a miss, so a key added after a failed
+    launch is picked up straight away. Use 'soong configure --refresh-keys'
+    after removing a key.
+    """
+    if not _mock_mode and not refresh:
+        cached = read_cache("ssh_keys", api.api_key, SSH_KEYS_CACHE_TTL)
+        if cached:
+            return cached
+
+    keys = api.list_ssh_keys()
+    if not _mock_mode:
+        write_cache("ssh_keys", api.api_key, keys)
+    return keys
+
+
+# Seconds to reuse the instance type list. Regional capacity moves quickly,
+# but prices for the status cost columns change far less often.
+INSTANCE_TYPES_CACHE_TTL = 60
+PRICING_CACHE_TTL = 900
+
+
+def get_instance_types(
+    api, refresh: bool = False, ttl: float = INSTANCE_TYPES_CACHE_TTL
+) -> list[InstanceType]:
+    """List instance types, served from the on-disk cache while younger than ttl."""
+    if not _mock_mode and not refresh:
+        cached = read_cache("instance_types", api.api_key, ttl)
+        if cached is not None:
+            return [InstanceType(**item) for item in cached]
+
+    instance_types = api.list_instance_types()
+    if not _mock_mode:
+        from dataclasses import asdict
+        write_cache("instance_types", api.api_key, [asdict(t) for t in instance_types])
+    return instance_types
+
+
+def _resolve_instance(api, instance_mgr: InstanceManager, instance_id: Optional[str]):
+    """Look up an explicit instance ID, or fall back to the active instance.
+
+    Both paths reuse the instance list a recent command cached, so chained
+    commands like ``status`` then ``ssh`` make one API call between them.
+    """
+    if instance_id:
+        cached = None if _mock_mode else read_cached_instance(api.api_key, instance_id, INSTANCE_CACHE_TTL)
+        return cached or api.get_instance(instance_id)
+    return instance_mgr.get_active_instance()
+
+
+# (connect, read) timeout for status daemon requests
+STATUS_DAEMON_TIMEOUT = (3.05, 10)
+
 from .ssh import SSHTunnelManager
-from .provision import provision_instance, ProvisionConfig
-from .worker import deploy_worker, worker_status, worker_logs, destroy_worker
 from .models import (
     KNOWN_MODELS, KNOWN_GPUS, ModelConfig, Quantization,
-    get_model_config, get_recommended_gpu, estimate_vram, format_model_info
+    get_model_config, get_recommended_gpu, get_smallest_gpu, estimate_vram, format_model_info
 )
 
 
@@ -153,26 +234,120 @@ def main_callback(
     global _mock_mode
     if mock:
         _mock_mode = True  # --mock flag sets it (env var already checked at module load)
+    ctx.obj = Services()
     if ctx.invoked_subcommand is None and not help:
         # No command specified, show help
         full_help_callback(ctx, None, True)
 
 
-console = Console()
+# Output is explicit markup only: skip the repr highlighter and emoji code
+# scan that would otherwise run on every printed string
+console = Console(highlight=False, emoji=False)
+
+# Created on first use so --help never touches the config directory
+config_manager: Optional[ConfigManager] = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Get the shared ConfigManager, creating it on first use."""
+    global config_manager
+    if config_manager is None:
+        config_manager = ConfigManager()
+    return config_manager
+
+# Table layouts as (header, style) pairs; styles are parsed once at import
+STATUS_COLUMNS = [
+    (name, Style.parse(style)) for name, style in (
+        ("ID", "cyan"),
+        ("Name", "magenta"),
+        ("Status", "green"),
+        ("IP", "blue"),
+        ("GPU", "yellow"),
+        ("Uptime", "white"),
+        ("Time Left", "white"),
+        ("Cost Now", "yellow"),
+        ("Est. Total", "yellow"),
+    )
+]
+AVAILABLE_COLUMNS = [
+    (name, Style.parse(style)) for name, style in (
+        ("GPU Type", "cyan"),
+        ("Description", "dim"),
+        ("Price", "yellow"),
+        ("Regions", "green"),
+    )
+]
+HISTORY_COLUMNS = [
+    (name, Style.parse(style)) for name, style in (
+        ("Time", "cyan"),
+        ("Instance ID", "magenta"),
+        ("Reason", "yellow"),
+        ("Uptime", "blue"),
+        ("GPU", "green"),
+        ("Region", "white"),
+    )
+]
+STOPPED_COLUMNS = [
+    (name, Style.parse(style)) for name, style in (
+        ("Instance ID", "cyan"),
+        ("Name", "magenta"),
+        ("Status", "red"),
+        ("GPU", "yellow"),
+        ("Region", "white"),
+        ("Created At", "blue"),
+    )
+]
 
-config_manager = ConfigManager()
 
+# VRAM in an instance type description, e.g. "1x A10 (24 GB PCIe)"
+VRAM_RE = re.compile(r'\((\d+)\s*GB')
+CLOUDFLARE_ACCOUNT_ID_RE = re.compile(r'^[a-f0-9]{32}$', re.IGNORECASE)
 
-def show_gpu_size_warning(console, selected_vram, min_vram_needed, viable_gpus, selected_gpu):
-    """Show warning if selected GPU is larger than minimum needed."""
-    if selected_vram > min_vram_needed and min_vram_needed > 0:
-        # Find cheapest viable GPU
-        cheapest_viable = None
-        for g in viable_gpus:
-            if g['available']:
-                cheapest_viable = g
-                break
+# VRAM of each known GPU, by instance type name
+KNOWN_GPU_VRAM = {name: gpu['vram_gb'] for name, gpu in KNOWN_GPUS.items()}
+
+
+OUTPUT_FORMATS = ("table", "json")
+
+
+def check_output_format(output_format: str) -> None:
+    """Exit with an error for an unknown --format value."""
+    if output_format not in OUTPUT_FORMATS:
+        console.print(f"[red]Error: --format must be one of: {', '.join(OUTPUT_FORMATS)}[/red]")
+        raise typer.Exit(1)
 
+
+def print_json(data) -> None:
+    """Write data to stdout as JSON, bypassing Rich rendering."""
+    import json
+    typer.echo(json.dumps(data, indent=2))
+
+
+def make_table(title: str, columns) -> Table:
+    """Create a table with the given (header, style) columns."""
+    table = Table(title=title)
+    for name, style in columns:
+        table.add_column(name, style=style)
+    return table
+
+
+def format_time_left(seconds: float) -> Text:
+    """Render remaining lease time as a styled cell (red once expired)."""
+    if seconds < 0:
+        return Text("EXPIRED", style="red")
+    hours, rest = divmod(int(seconds), 3600)
+    if hours < 1:
+        return Text(f"{rest // 60}m", style="yellow")
+    return Text(f"{hours}h {rest // 60}m", style="green")
+
+
+def show_gpu_size_warning(console, selected_vram, min_vram_needed, cheapest_viable, selected_gpu):
+    """Show warning if selected GPU is larger than minimum needed.
+
+    ``cheapest_viable`` is the cheapest available GPU option that fits the
+    model, or None if there isn't one.
+    """
+    if selected_vram > min_vram_needed and min_vram_needed > 0:
         if cheapest_viable and cheapest_viable['type'].name != selected_gpu:
             console.print(
                 f"[dim]Note: {cheapest_viable['type'].description} "
@@ -183,13 +358,53 @@ def show_gpu_size_warning(console, selected_vram, min_vram_needed, viable_gpus,
 
 def get_config() -> Config:
     """Load configuration or exit if not configured."""
-    config = config_manager.load()
+    config = get_config_manager().load()
     if config is None:
         console.print("[red]Error: Not configured. Run 'gpu-session configure' first.[/red]")
         raise typer.Exit(1)
     return config
 
 
+class Services:
+    """Config and API clients shared by the command being run.
+
+    Created once per invocation by main_callback and reached through
+    ``ctx.obj``. Each member is built on first access, so commands that
+    never talk to Lambda don't pay for a session.
+    """
+
+    @functools.cached_property
+    def config(self) -> Config:
+        return get_config()
+
+    @functools.cached_property
+    def api(self) -> LambdaAPI:
+        return get_api(self.config)
+
+    @functools.cached_property
+    def instance_mgr(self) -> InstanceManager:
+        return get_instance_manager(self.api)
+
+
+def get_services(ctx: typer.Context) -> Services:
+    """Get the invocation's shared services, creating them if needed."""
+    return ctx.ensure_object(Services)
+
+
+def handle_api_errors(action: str):
+    """Decorate a command to report LambdaAPIError as "Error <action>" and exit 1."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except LambdaAPIError as e:
+                console.print(f"[red]Error {action}: {e}[/red]")
+                raise typer.Exit(1)
+        return wrapper
+    return decorator
+
+
 def log_launch_event(config: Config, instance_id: str, gpu_type: str, region: str) -> None:
     """
     Log instance launch event to Worker.
@@ -219,8 +434,10 @@ def log_launch_event(config: Config, instance_id: str, gpu_type: str, region: st
         "metrics": None,
     }
 
+    import requests
+
     try:
-        response = requests.post(
+        response = _http_session().post(
             f"{config.cloudflare.worker_url}/event",
             json=event,
             headers={"Authorization": f"Bearer {config.status_daemon.token}"},
@@ -242,11 +459,13 @@ def log_launch_event(config: Config, instance_id: str, gpu_type: str, region: st
 
 def fetch_status_daemon_metrics(instance_ip: str, status_token: str) -> Optional[dict]:
     """Fetch metrics from status daemon before termination."""
+    import requests
+
     try:
-        response = requests.get(
+        response = _http_session().get(
             f"http://{instance_ip}:8080/status",
             headers={"Authorization": f"Bearer {status_token}"},
-            timeout=(5, 10),
+            timeout=STATUS_DAEMON_TIMEOUT,
         )
         response.raise_for_status()
         data = response.json()
@@ -291,8 +510,11 @@ def log_terminate_event(
         "metrics": metrics,
     }
 
+    import requests
+    from .pending import save_pending_event
+
     try:
-        response = requests.post(
+        response = _http_session().post(
             f"{config.cloudflare.worker_url}/event",
             json=event,
             headers={"Authorization": f"Bearer {config.status_daemon.token}"},
@@ -307,8 +529,22 @@ def log_terminate_event(
 
 
 @app.command()
-def configure():
+def configure(
+    refresh_keys: bool = typer.Option(False, "--refresh-keys", help="Refresh the cached Lambda SSH key list and exit"),
+):
     """Interactive configuration wizard."""
+    if refresh_keys:
+        config = get_config()
+        try:
+            keys = get_ssh_key_names(get_api(config), refresh=True)
+        except LambdaAPIError as e:
+            console.print(f"[red]Error listing SSH keys: {e}[/red]")
+            raise typer.Exit(1)
+        console.print(f"[green]Refreshed SSH keys: {', '.join(keys) or 'none'}[/green]")
+        return
+
+    import questionary
+
     console.print(Panel(
         "[bold]GPU Session Configuration Wizard[/bold]\n\n"
         "This will guide you through setting up your Lambda Labs credentials and defaults.",
@@ -327,7 +563,7 @@ def configure():
 
     # Validate API key by fetching instance types
     console.print("[cyan]Validating API key...[/cyan]")
-    api = LambdaAPI(api_key)
+    api = _api_for(api_key)
     try:
         instance_types = api.list_instance_types()
         console.print("[green]API key valid.[/green]\n")
@@ -344,6 +580,7 @@ def configure():
     if status_token is None:
         raise typer.Exit(1)
     if not status_token.strip():
+        import secrets
         status_token = secrets.token_urlsafe(32)
         console.print(f"[cyan]Generated token:[/cyan] {status_token}\n")
     else:
@@ -371,8 +608,7 @@ def configure():
             raise typer.Exit(1)
 
         # Validate account ID format (32-character hex)
-        import re
-        if cloudflare_account_id and not re.match(r'^[a-f0-9]{32}$', cloudflare_account_id, re.IGNORECASE):
+        if cloudflare_account_id and not CLOUDFLARE_ACCOUNT_ID_RE.match(cloudflare_account_id):
             console.print("[yellow]Warning: Account ID should be a 32-character hex string[/yellow]")
             console.print("[dim]Continuing anyway, you can fix this later with 'soong configure'[/dim]\n")
     else:
@@ -382,14 +618,13 @@ def configure():
     console.print("[bold]Step 4: Select default model[/bold]")
     console.print("[dim]The model determines minimum GPU requirements.[/dim]\n")
 
-    model_choices = []
-    for model_id, model in KNOWN_MODELS.items():
-        rec_gpu = get_recommended_gpu(model_id)
-        gpu_info = KNOWN_GPUS.get(rec_gpu, {})
-        vram = model.estimated_vram_gb
-        label = f"{model.name} ({model.params_billions:.0f}B {model.default_quantization.value.upper()}) - needs {vram:.0f}GB+ VRAM"
-        model_choices.append(questionary.Choice(title=label, value=model_id))
-
+    model_choices = [
+        questionary.Choice(
+            title=f"{model.name} ({model.params_billions:.0f}B {model.default_quantization.value.upper()}) - needs {model.estimated_vram_gb:.0f}GB+ VRAM",
+            value=model_id,
+        )
+        for model_id, model in KNOWN_MODELS.items()
+    ]
     model_choices.append(questionary.Choice(title="Custom model (enter manually)", value="_custom"))
 
     default_model = questionary.select(
@@ -406,6 +641,7 @@ def configure():
     # Handle custom model
     recommended_gpu = None
     model_config = None
+    vram_info = None
     if default_model == "_custom":
         default_model = questionary.text("Enter model name/path:").ask()
         if not default_model:
@@ -430,11 +666,7 @@ def configure():
             console.print(f"\n[cyan]Estimated VRAM:[/cyan] {vram_info['total_estimated_gb']:.1f} GB")
             console.print(f"[cyan]Minimum GPU:[/cyan] {vram_info['min_vram_gb']} GB\n")
 
-            # Find recommended GPU
-            for gpu_name, gpu_info in sorted(KNOWN_GPUS.items(), key=lambda x: x[1]['vram_gb']):
-                if gpu_info['vram_gb'] >= vram_info['min_vram_gb']:
-                    recommended_gpu = gpu_name
-                    break
+            recommended_gpu = get_smallest_gpu(vram_info['min_vram_gb'])
         except (ValueError, TypeError):
             console.print("[yellow]Could not parse specs, will select GPU manually.[/yellow]")
     else:
@@ -455,55 +687,59 @@ def configure():
     min_vram_needed = 0
     if model_config:
         min_vram_needed = model_config.estimated_vram_gb
-    elif 'vram_info' in dir() and vram_info:
+    elif vram_info:
         min_vram_needed = vram_info.get('total_estimated_gb', 0)
 
     if instance_types:
-        # Build GPU list with VRAM info from our known GPUs
+        # Build GPU list with VRAM info from our known GPUs, indexed by name
         gpu_options = []
+        gpu_index = {}
         for t in instance_types:
-            known_gpu = KNOWN_GPUS.get(t.name, {})
-            vram = known_gpu.get('vram_gb', 0)
+            vram = KNOWN_GPU_VRAM.get(t.name, 0)
 
             # Try to infer VRAM from description if not in our list
             if vram == 0:
-                import re
-                match = re.search(r'\((\d+)\s*GB', t.description)
+                match = VRAM_RE.search(t.description)
                 if match:
                     vram = int(match.group(1))
 
-            gpu_options.append({
+            option = {
                 'type': t,
                 'vram': vram,
                 'available': len(t.regions_available) > 0,
-            })
+            }
+            gpu_options.append(option)
+            gpu_index[t.name] = option
 
         # Sort by price
         gpu_options.sort(key=lambda x: x['type'].price_cents_per_hour)
 
-        # Separate viable vs non-viable GPUs
-        viable_gpus = [g for g in gpu_options if g['vram'] >= min_vram_needed]
-        small_gpus = [g for g in gpu_options if g['vram'] < min_vram_needed and g['vram'] > 0]
+        # Separate viable vs non-viable GPUs; unknown-size GPUs only count as viable with no minimum
+        viable_gpus = []
+        small_gpus = []
+        for g in gpu_options:
+            if g['vram'] >= min_vram_needed:
+                viable_gpus.append(g)
+            elif g['vram'] > 0:
+                small_gpus.append(g)
 
         if min_vram_needed > 0:
             console.print(f"[dim]Model needs ~{min_vram_needed:.0f}GB VRAM. Showing compatible GPUs first.[/dim]\n")
 
         choices = []
         default_idx = 0
-        cheapest_available_idx = None
+
+        # Cheapest available option; viable_gpus is already sorted by price
+        cheapest_viable = next((g for g in viable_gpus if g['available']), None)
 
         # Add viable GPUs first
-        for i, g in enumerate(viable_gpus):
+        for g in viable_gpus:
             t = g['type']
             vram = g['vram']
             avail = "available" if g['available'] else "no capacity"
 
-            # Find cheapest available option
-            if g['available'] and cheapest_available_idx is None:
-                cheapest_available_idx = i
-
             marker = ""
-            if cheapest_available_idx == i:
+            if g is cheapest_viable:
                 marker = " ⟵ RECOMMENDED"
 
             label = f"{t.description} ({vram}GB) - {t.format_price()} ({avail}){marker}"
@@ -527,8 +763,8 @@ def configure():
 
         # Set default to cheapest available viable option
         default_val = None
-        if cheapest_available_idx is not None and viable_gpus:
-            default_val = viable_gpus[cheapest_available_idx]['type'].name
+        if cheapest_viable is not None:
+            default_val = cheapest_viable['type'].name
 
         default_gpu = questionary.select(
             "GPU type:",
@@ -543,9 +779,10 @@ def configure():
         if not default_gpu or default_gpu == "_separator":
             raise typer.Exit(1)
 
-        selected_type = next((t for t in instance_types if t.name == default_gpu), None)
+        selected = gpu_index.get(default_gpu)
+        selected_type = selected['type'] if selected else None
         if selected_type:
-            selected_vram = next((g['vram'] for g in gpu_options if g['type'].name == default_gpu), 0)
+            selected_vram = selected['vram']
             console.print(f"[green]Selected:[/green] {selected_type.description} ({selected_vram}GB) @ {selected_type.format_price()}\n")
 
             # Warn if selected GPU is too small
@@ -557,7 +794,7 @@ def configure():
                 console=console,
                 selected_vram=selected_vram,
                 min_vram_needed=min_vram_needed,
-                viable_gpus=viable_gpus,
+                cheapest_viable=cheapest_viable,
                 selected_gpu=default_gpu,
             )
     else:
@@ -598,19 +835,17 @@ def configure():
 
     # Step 8: Default lease hours (with cost estimates)
     console.print("[bold]Step 8: Default lease duration[/bold]")
+    lease_options = ((2, ""), (4, " - recommended"), (6, ""), (8, " - maximum"))
     if selected_type:
+        rate = selected_type.price_per_hour
         lease_choices = [
-            questionary.Choice(title=f"2 hours (${selected_type.price_per_hour * 2:.2f})", value=2),
-            questionary.Choice(title=f"4 hours (${selected_type.price_per_hour * 4:.2f}) - recommended", value=4),
-            questionary.Choice(title=f"6 hours (${selected_type.price_per_hour * 6:.2f})", value=6),
-            questionary.Choice(title=f"8 hours (${selected_type.price_per_hour * 8:.2f}) - maximum", value=8),
+            questionary.Choice(title=f"{hours} hours (${rate * hours:.2f}){suffix}", value=hours)
+            for hours, suffix in lease_options
         ]
     else:
         lease_choices = [
-            questionary.Choice(title="2 hours", value=2),
-            questionary.Choice(title="4 hours - recommended", value=4),
-            questionary.Choice(title="6 hours", value=6),
-            questionary.Choice(title="8 hours - maximum", value=8),
+            questionary.Choice(title=f"{hours} hours{suffix}", value=hours)
+            for hours, suffix in lease_options
         ]
     lease_hours = questionary.select(
         "Default lease duration:",
@@ -649,7 +884,7 @@ def configure():
         ssh=SSHConfig(key_path=ssh_key_path),
     )
 
-    config_manager.save(config)
+    get_config_manager().save(config)
 
     # Show summary
     console.print()
@@ -661,7 +896,7 @@ def configure():
         f"Model: {default_model}\n"
         f"Lease: {lease_hours} hours\n"
         f"Filesystem: {filesystem_name}\n\n"
-        f"Config file: {config_manager.config_file}",
+        f"Config file: {get_config_manager().config_file}",
         title="[cyan]Summary[/cyan]",
         border_style="green",
     ))
@@ -669,6 +904,8 @@ def configure():
 
 def show_cost_estimate(instance_type: InstanceType, hours: int, action: str = "launch") -> bool:
     """Show cost estimate and get confirmation."""
+    import questionary
+
     estimated_cost = instance_type.estimate_cost(hours)
 
     console.print()
@@ -692,7 +929,9 @@ def show_cost_estimate(instance_type: InstanceType, hours: int, action: str = "l
 
 
 @app.command()
+@handle_api_errors("launching instance")
 def start(
+    ctx: typer.Context,
     model: Optional[str] = typer.Option(None, help="Model to load (overrides default)"),
     gpu: Optional[str] = typer.Option(None, help="GPU type (overrides default)"),
     region: Optional[str] = typer.Option(None, help="Region (overrides default)"),
@@ -702,14 +941,18 @@ def start(
     yes: bool = typer.Option(False, "-y", "--yes", help="Skip cost confirmation"),
     skip_validation: bool = typer.Option(False, "--skip-validation", help="Skip pre-launch validation"),
     skip_provision: bool = typer.Option(False, "--skip-provision", help="Skip Ansible provisioning"),
+    poll_interval: Optional[float] = typer.Option(None, "--poll-interval", hidden=True, help="Fixed status poll interval in seconds"),
 ):
     """Launch new GPU instance and provision services."""
-    config = get_config()
-    api = get_api(config)
-    instance_mgr = InstanceManager(api)
+    services = get_services(ctx)
+    config = services.config
+    api = services.api
+    instance_mgr = services.instance_mgr
 
     # Attempt to sync pending events if Worker is configured (skip in mock mode)
     if config.cloudflare.worker_url and not _mock_mode:
+        from .pending import sync_pending_events
+
         successes, failures = sync_pending_events(
             config.cloudflare.worker_url,
             config.status_daemon.token,
@@ -725,134 +968,156 @@ def start(
     region = region or config.lambda_config.default_region
     hours = hours or config.defaults.lease_hours
 
-    console.print(f"[cyan]Preparing to launch instance...[/cyan]")
-    console.print(f"  Model: {model}")
-    console.print(f"  GPU: {gpu}")
-    console.print(f"  Region: {region}")
-    console.print(f"  Lease: {hours} hours")
+    console.print(
+        "[cyan]Preparing to launch instance...[/cyan]\n"
+        f"  Model: {model}\n"
+        f"  GPU: {gpu}\n"
+        f"  Region: {region}\n"
+        f"  Lease: {hours} hours"
+    )
 
-    try:
-        # Get pricing info for cost estimate
-        instance_type = api.get_instance_type(gpu)
-        if instance_type and not yes:
-            if not show_cost_estimate(instance_type, hours, "launch"):
-                console.print("[yellow]Launch cancelled.[/yellow]")
+    # Get pricing info for cost estimate
+    instance_type = api.get_instance_type(gpu)
+    if instance_type and not yes:
+        if not show_cost_estimate(instance_type, hours, "launch"):
+            console.print("[yellow]Launch cancelled.[/yellow]")
+            raise typer.Exit(0)
+    elif not instance_type:
+        console.print(f"[yellow]Could not fetch pricing for {gpu}[/yellow]")
+        if not yes:
+            confirm = typer.confirm("Proceed without cost estimate?", default=True)
+            if not confirm:
                 raise typer.Exit(0)
-        elif not instance_type:
-            console.print(f"[yellow]Could not fetch pricing for {gpu}[/yellow]")
-            if not yes:
-                confirm = typer.confirm("Proceed without cost estimate?", default=True)
-                if not confirm:
-                    raise typer.Exit(0)
-
-        # Get SSH keys
-        ssh_keys = api.list_ssh_keys()
-        if not ssh_keys:
-            console.print("[red]Error: No SSH keys found in Lambda account[/red]")
-            console.print("Add an SSH key at: https://cloud.lambda.ai/ssh-keys")
-            raise typer.Exit(1)
-
-        # Pre-launch validation (skip in mock mode)
-        if not skip_validation and not _mock_mode:
-            console.print("\n[cyan]Validating launch parameters...[/cyan]")
-            validator = LaunchValidator(api)
-            result = validator.validate(
-                gpu_type=gpu,
-                region=region,
-                filesystem_name=config.lambda_config.filesystem_name,
-                ssh_key_names=ssh_keys,
-                model_id=model,
-            )
-
-            # Show warnings first
-            if result.warnings:
-                for w in result.warnings:
-                    console.print(f"[yellow]Warning:[/yellow] {w.message}")
-                    console.print(f"  [dim]{w.suggestion}[/dim]")
-                console.print()
-
-            # Show errors and exit if any
-            if not result.can_launch:
-                for e in result.errors:
-                    console.print(f"[red]Error:[/red] {e.message}")
-                    console.print(f"  [dim]{e.suggestion}[/dim]")
-                raise typer.Exit(1)
-
-            console.print("[green]Validation passed[/green]")
 
-        console.print(f"\n[cyan]Launching instance...[/cyan]")
+    # Get SSH keys
+    ssh_keys = get_ssh_key_names(api)
+    if not ssh_keys:
+        console.print("[red]Error: No SSH keys found in Lambda account[/red]")
+        console.print("Add an SSH key at: https://cloud.lambda.ai/ssh-keys")
+        raise typer.Exit(1)
 
-        # Launch instance
-        instance_id = api.launch_instance(
+    # Pre-launch validation (skip in mock mode)
+    if not skip_validation and not _mock_mode:
+        console.print("\n[cyan]Validating launch parameters...[/cyan]")
+        from .validation import LaunchValidator
+        validator = LaunchValidator(api)
+        result = validator.validate(
+            gpu_type=gpu,
             region=region,
-            instance_type=gpu,
+            filesystem_name=config.lambda_config.filesystem_name,
             ssh_key_names=ssh_keys,
-            filesystem_names=[config.lambda_config.filesystem_name],
-            name=name,
+            model_id=model,
         )
 
-        console.print(f"[green]Instance launched: {instance_id}[/green]")
+        # Show warnings first
+        if result.warnings:
+            for w in result.warnings:
+                console.print(f"[yellow]Warning:[/yellow] {w.message}")
+                console.print(f"  [dim]{w.suggestion}[/dim]")
+            console.print()
+
+        # Show errors and exit if any
+        if not result.can_launch:
+            for e in result.errors:
+                console.print(f"[red]Error:[/red] {e.message}")
+                console.print(f"  [dim]{e.suggestion}[/dim]")
+            raise typer.Exit(1)
+
+        console.print("[green]Validation passed[/green]")
+
+    console.print(f"\n[cyan]Launching instance...[/cyan]")
+
+    # Launch instance
+    instance_id = api.launch_instance(
+        region=region,
+        instance_type=gpu,
+        ssh_key_names=ssh_keys,
+        filesystem_names=[config.lambda_config.filesystem_name],
+        name=name,
+    )
+    instance_mgr.invalidate_cache()
+
+    console.print(f"[green]Instance launched: {instance_id}[/green]")
+
+    # Log launch event to Worker (skip in mock mode, hard fail if Worker configured but unreachable)
+    if not _mock_mode:
+        try:
+            log_launch_event(config, instance_id, gpu, region)
+        except RuntimeError:
+            # Hard fail: abort launch and clean up
+            console.print(
+                "\n[red]Launch aborted due to Worker logging failure[/red]\n"
+                "[yellow]Attempting to terminate instance...[/yellow]"
+            )
 
-        # Log launch event to Worker (skip in mock mode, hard fail if Worker configured but unreachable)
-        if not _mock_mode:
+            # Best-effort cleanup: terminate the instance
             try:
-                log_launch_event(config, instance_id, gpu, region)
-            except RuntimeError:
-                # Hard fail: abort launch and clean up
-                console.print("\n[red]Launch aborted due to Worker logging failure[/red]")
-                console.print("[yellow]Attempting to terminate instance...[/yellow]")
-
-                # Best-effort cleanup: terminate the instance
-                try:
-                    api.terminate_instance(instance_id)
-                    console.print("[green]Instance terminated successfully[/green]")
-                except Exception as cleanup_error:
-                    console.print(f"[red]Warning: Failed to terminate instance: {cleanup_error}[/red]")
-                    console.print(f"[yellow]Please manually terminate instance {instance_id} via Lambda dashboard[/yellow]")
+                api.terminate_instance(instance_id)
+                console.print("[green]Instance terminated successfully[/green]")
+            except Exception as cleanup_error:
+                console.print(f"[red]Warning: Failed to terminate instance: {cleanup_error}[/red]")
+                console.print(f"[yellow]Please manually terminate instance {instance_id} via Lambda dashboard[/yellow]")
 
-                raise typer.Exit(1)
+            raise typer.Exit(1)
 
-        if wait:
-            instance = instance_mgr.wait_for_ready(instance_id, timeout_seconds=600)
-            if instance:
-                console.print(f"[green]Instance ready![/green]\n")
-
-                ip = instance.ip
-
-                # Provision the instance with services (skip in mock mode)
-                if _mock_mode:
-                    console.print("[dim]Mock mode: skipping provisioning[/dim]")
-                elif not skip_provision:
-                    console.print("[cyan]Provisioning instance...[/cyan]")
-                    provision_config = ProvisionConfig(
-                        instance_ip=ip,
-                        ssh_key_path=str(Path(config.ssh.key_path).expanduser()),
-                        lambda_api_key=config.lambda_config.api_key,
-                        status_token=config.status_daemon.token,
-                        model=model,
-                        lease_hours=hours,
-                        worker_url=config.cloudflare.worker_url or None,
-                    )
+    if wait:
+        if poll_interval:
+            waiter = WaiterConfig(initial=poll_interval, max=poll_interval)
+        else:
+            # Poll quickly while booting, then back off towards 20s
+            waiter = WaiterConfig(initial=2, max=20, multiplier=1.5)
+        # Once an IP is assigned, wait on sshd directly (provisioning and
+        # the tunnel both need it); mock IPs are not reachable
+        instance = instance_mgr.wait_for_ready(
+            instance_id,
+            timeout_seconds=600,
+            waiter=waiter,
+            probe_port=None if _mock_mode else 22,
+        )
+        if instance:
+            console.print(f"[green]Instance ready![/green]\n")
+
+            ip = instance.ip
+
+            # Provision the instance with services (skip in mock mode)
+            if _mock_mode:
+                console.print("[dim]Mock mode: skipping provisioning[/dim]")
+            elif not skip_provision:
+                console.print("[cyan]Provisioning instance...[/cyan]")
+                from .provision import provision_instance, ProvisionConfig
+                provision_config = ProvisionConfig(
+                    instance_ip=ip,
+                    ssh_key_path=str(Path(config.ssh.key_path).expanduser()),
+                    lambda_api_key=config.lambda_config.api_key,
+                    status_token=config.status_daemon.token,
+                    model=model,
+                    lease_hours=hours,
+                    worker_url=config.cloudflare.worker_url or None,
+                )
 
-                    if not provision_instance(provision_config):
-                        console.print("[yellow]Warning: Provisioning failed. Services may not be available.[/yellow]")
-                        console.print("[dim]You can SSH in and set up manually, or try 'soong provision'[/dim]\n")
-                    else:
-                        # Wait for services to be healthy
-                        console.print("\n[cyan]Waiting for services to start...[/cyan]")
-                        ssh_key_path = str(Path(config.ssh.key_path).expanduser())
-                        if not instance_mgr.wait_for_services(ip, ssh_key_path, timeout_seconds=300):
-                            console.print("[yellow]Warning: Services health check timed out[/yellow]")
-                            console.print("[dim]Services may still be starting. Check 'soong status' in a minute.[/dim]\n")
+                if not provision_instance(provision_config):
+                    console.print(
+                        "[yellow]Warning: Provisioning failed. Services may not be available.[/yellow]\n"
+                        "[dim]You can SSH in and set up manually, or try 'soong provision'[/dim]\n"
+                    )
                 else:
-                    console.print("[dim]Skipping provisioning (--skip-provision)[/dim]")
-
-                # Auto-start SSH tunnel (skip in mock mode)
-                if _mock_mode:
-                    console.print("[dim]Mock mode: skipping SSH tunnel[/dim]")
-                    # Show simplified panel for mock mode
-                    console.print(Panel(
-                        f"""[bold]Instance:[/bold] {instance_id[:8]}...
+                    # Wait for services to be healthy
+                    console.print("\n[cyan]Waiting for services to start...[/cyan]")
+                    ssh_key_path = str(Path(config.ssh.key_path).expanduser())
+                    if not instance_mgr.wait_for_services(ip, ssh_key_path, timeout_seconds=300):
+                        console.print(
+                            "[yellow]Warning: Services health check timed out[/yellow]\n"
+                            "[dim]Services may still be starting. Check 'soong status' in a minute.[/dim]\n"
+                        )
+            else:
+                console.print("[dim]Skipping provisioning (--skip-provision)[/dim]")
+
+            # Auto-start SSH tunnel (skip in mock mode)
+            if _mock_mode:
+                console.print("[dim]Mock mode: skipping SSH tunnel[/dim]")
+                # Show simplified panel for mock mode
+                console.print(Panel(
+                    f"""[bold]Instance:[/bold] {instance_id[:8]}...
 [bold]IP Address:[/bold] {ip}
 [bold]Region:[/bold] {region}
 [bold]GPU:[/bold] {gpu}
@@ -863,32 +1128,27 @@ def start(
 [bold cyan]Quick Commands[/bold cyan]
   soong status    [dim]# Check instance status[/dim]
   soong stop -y   [dim]# Terminate instance[/dim]""",
-                        title="Instance Ready",
-                        border_style="green",
-                    ))
-                    return
-
-                console.print("\n[cyan]Starting SSH tunnel...[/cyan]")
-                try:
-                    lambda_keys = api.list_ssh_keys()
-                except LambdaAPIError:
-                    lambda_keys = []
-
-                ssh_mgr = SSHTunnelManager(config.ssh.key_path, lambda_key_names=lambda_keys)
-                tunnel_ports = ssh_mgr.start_tunnel(
-                    ip,
-                    local_ports=[
-                        config.tunnel.sglang_port,
-                        config.tunnel.n8n_port,
-                        config.tunnel.status_port,
-                    ],
-                    remote_ports=[8000, 5678, 8080],
-                )
+                    title="Instance Ready",
+                    border_style="green",
+                ))
+                return
+
+            console.print("\n[cyan]Starting SSH tunnel...[/cyan]")
+            ssh_mgr = SSHTunnelManager(config.ssh.key_path, lambda_key_names=ssh_keys)
+            tunnel_ports = ssh_mgr.start_tunnel(
+                ip,
+                local_ports=[
+                    config.tunnel.sglang_port,
+                    config.tunnel.n8n_port,
+                    config.tunnel.status_port,
+                ],
+                remote_ports=[8000, 5678, 8080],
+            )
 
-                if tunnel_ports:
-                    # Show connection details with localhost URLs
-                    console.print(Panel(
-                        f"""[bold]Instance:[/bold] {instance_id[:8]}...
+            if tunnel_ports:
+                # Show connection details with localhost URLs
+                console.print(Panel(
+                    f"""[bold]Instance:[/bold] {instance_id[:8]}...
 [bold]IP Address:[/bold] {ip}
 [bold]Region:[/bold] {region}
 [bold]GPU:[/bold] {gpu}
@@ -910,13 +1170,13 @@ def start(
 
 [bold cyan]Documentation[/bold cyan]
   https://axiomantic.github.io/soong/""",
-                        title="Instance Ready",
-                        border_style="green",
-                    ))
-                else:
-                    # Tunnel failed, show remote URLs
-                    console.print(Panel(
-                        f"""[bold]Instance:[/bold] {instance_id[:8]}...
+                    title="Instance Ready",
+                    border_style="green",
+                ))
+            else:
+                # Tunnel failed, show remote URLs
+                console.print(Panel(
+                    f"""[bold]Instance:[/bold] {instance_id[:8]}...
 [bold]IP Address:[/bold] {ip}
 [bold]Region:[/bold] {region}
 [bold]GPU:[/bold] {gpu}
@@ -934,21 +1194,27 @@ def start(
 
 [bold cyan]Direct Access[/bold cyan]
   ssh ubuntu@{ip}""",
-                        title="Instance Ready",
-                        border_style="yellow",
-                    ))
-            else:
-                console.print("[yellow]Instance launch timed out[/yellow]")
-                console.print("Check status with: soong status")
+                    title="Instance Ready",
+                    border_style="yellow",
+                ))
         else:
-            console.print("\nCheck status with: soong status")
+            console.print("[yellow]Instance launch timed out[/yellow]")
+            console.print("Check status with: soong status")
+    else:
+        console.print("\nCheck status with: soong status")
 
-    except LambdaAPIError as e:
-        console.print(f"[red]Error launching instance: {e}[/red]")
-        raise typer.Exit(1)
+
+# Default cap on history table rows; 0 shows everything
+HISTORY_LIMIT = 200
 
 
-def display_worker_history(config: Config, hours: int = 24) -> None:
+def print_truncated(shown: int, total: int) -> None:
+    """Note how many rows a limited table left out."""
+    if total > shown:
+        console.print(f"[dim]... {total - shown} more not shown, pass --limit 0 to show all[/dim]")
+
+
+def display_worker_history(config: Config, hours: int = 24, limit: int = HISTORY_LIMIT) -> None:
     """Query and display instance history from Worker."""
     if not config.cloudflare.worker_url:
         console.print("[red]Worker not deployed. Run 'soong worker deploy' first[/red]")
@@ -956,8 +1222,10 @@ def display_worker_history(config: Config, hours: int = 24) -> None:
 
     console.print(f"[cyan]Fetching instance history (last {hours} hours)...[/cyan]\n")
 
+    import requests
+
     try:
-        response = requests.get(
+        response = _http_session().get(
             f"{config.cloudflare.worker_url}/events",
             params={"hours": hours},
             timeout=(5, 15),
@@ -973,6 +1241,9 @@ def display_worker_history(config: Config, hours: int = 24) -> None:
     except requests.exceptions.HTTPError as e:
         console.print(f"[red]Worker HTTP error {e.response.status_code}[/red]")
         raise typer.Exit(1)
+    except requests.exceptions.RequestException as e:
+        console.print(f"[red]Worker request failed: {e}[/red]")
+        raise typer.Exit(1)
 
     events = data.get("events", [])
 
@@ -990,7 +1261,8 @@ def display_worker_history(config: Config, hours: int = 24) -> None:
     table.add_column("Duration", justify="right")
     table.add_column("Cost", justify="right")
 
-    for event in events:
+    shown = events[:limit] if limit > 0 else events
+    for event in shown:
         timestamp = event["timestamp"][:19].replace("T", " ")
         instance_id_short = event["instance_id"][:12] if event.get("instance_id") else "-"
         event_type = event.get("event_type", "-")
@@ -1010,6 +1282,7 @@ def display_worker_history(config: Config, hours: int = 24) -> None:
         table.add_row(timestamp, instance_id_short, event_type, gpu_type, duration, cost)
 
     console.print(table)
+    print_truncated(len(shown), len(events))
 
     # Show summary for terminate events
     terminate_events = [e for e in events if e.get("event_type") in ["terminate", "idle_shutdown", "watchdog"]]
@@ -1019,38 +1292,35 @@ def display_worker_history(config: Config, hours: int = 24) -> None:
         console.print(f"\n[bold]Summary:[/bold] {len(terminate_events)} sessions, {total_minutes // 60}h {total_minutes % 60}m total, ${total_cost:.2f}")
 
 
-def show_termination_history(events: list, hours: int):
+# First matching keyword decides the colour of a termination reason
+REASON_STYLES = (
+    ("watchdog", "red"),
+    ("idle", "yellow"),
+    ("timeout", "yellow"),
+    ("lease", "orange1"),
+    ("expired", "orange1"),
+)
+
+
+def reason_style(reason: str) -> str:
+    """Pick the display style for a termination reason."""
+    reason = reason.lower()
+    return next((style for keyword, style in REASON_STYLES if keyword in reason), "white")
+
+
+def show_termination_history(events: list, hours: int, limit: int = HISTORY_LIMIT):
     """Display termination history in a rich table."""
     if not events:
         console.print(f"[yellow]No termination events found in the last {hours} hours[/yellow]")
         return
 
-    table = Table(title=f"Termination History (Last {hours} Hours)")
-    table.add_column("Time", style="cyan")
-    table.add_column("Instance ID", style="magenta")
-    table.add_column("Reason", style="yellow")
-    table.add_column("Uptime", style="blue")
-    table.add_column("GPU", style="green")
-    table.add_column("Region", style="white")
-
-    for event in events:
-        # Color code reason
-        reason_text = event.reason
-        if "watchdog" in event.reason.lower():
-            reason_style = "red"
-        elif "idle" in event.reason.lower() or "timeout" in event.reason.lower():
-            reason_style = "yellow"
-        elif "lease" in event.reason.lower() or "expired" in event.reason.lower():
-            reason_style = "orange1"
-        else:
-            reason_style = "white"
+    table = make_table(f"Termination History (Last {hours} Hours)", HISTORY_COLUMNS)
 
+    shown = events[:limit] if limit > 0 else events
+    for event in shown:
         # Format timestamp
-        try:
-            timestamp = datetime.fromisoformat(event.timestamp.replace('Z', '+00:00'))
-            time_str = timestamp.strftime("%Y-%m-%d %H:%M")
-        except (ValueError, AttributeError):
-            time_str = event.timestamp
+        timestamp = parse_timestamp(event.timestamp)
+        time_str = timestamp.strftime("%Y-%m-%d %H:%M") if timestamp else event.timestamp
 
         # Format uptime
         hours_up = event.uptime_minutes // 60
@@ -1060,38 +1330,35 @@ def show_termination_history(events: list, hours: int):
         table.add_row(
             time_str,
             event.instance_id[:8],
-            f"[{reason_style}]{reason_text}[/{reason_style}]",
+            # Text skips markup parsing and keeps brackets in reasons literal
+            Text(event.reason, style=reason_style(event.reason)),
             uptime_str,
             event.gpu_type,
             event.region,
         )
 
     console.print(table)
+    print_truncated(len(shown), len(events))
+
+
+# Instance statuses shown by --stopped rather than the default view
+STOPPED_STATES = frozenset(("terminated", "stopped"))
 
 
 def show_stopped_instances(instances: list):
     """Display stopped instances grouped by termination reason."""
-    stopped = [i for i in instances if i.status in ["terminated", "stopped"]]
+    stopped = [i for i in instances if i.status in STOPPED_STATES]
 
     if not stopped:
         console.print("[yellow]No stopped instances found[/yellow]")
         return
 
-    table = Table(title="Stopped Instances")
-    table.add_column("Instance ID", style="cyan")
-    table.add_column("Name", style="magenta")
-    table.add_column("Status", style="red")
-    table.add_column("GPU", style="yellow")
-    table.add_column("Region", style="white")
-    table.add_column("Created At", style="blue")
+    table = make_table("Stopped Instances", STOPPED_COLUMNS)
 
     for instance in stopped:
         # Format created_at
-        try:
-            created = datetime.fromisoformat(instance.created_at.replace('Z', '+00:00'))
-            created_str = created.strftime("%Y-%m-%d %H:%M")
-        except (ValueError, AttributeError):
-            created_str = instance.created_at
+        created = parse_timestamp(instance.created_at)
+        created_str = created.strftime("%Y-%m-%d %H:%M") if created else instance.created_at
 
         table.add_row(
             instance.id[:8],
@@ -1106,178 +1373,165 @@ def show_stopped_instances(instances: list):
 
 
 @app.command()
+@handle_api_errors("getting status")
 def status(
+    ctx: typer.Context,
     instance_id: Optional[str] = typer.Option(None, help="Instance ID (uses active if not specified)"),
     history: bool = typer.Option(False, "--history", "-h", help="Show termination history"),
     stopped: bool = typer.Option(False, "--stopped", "-s", help="Show stopped instances"),
     history_hours: int = typer.Option(24, help="Hours of history to show"),
+    limit: int = typer.Option(HISTORY_LIMIT, "--limit", help="Maximum history rows to show (0 for all)"),
+    refresh: bool = typer.Option(False, "--refresh", help="Bypass the cached instance list and pricing"),
+    output_format: str = typer.Option("table", "--format", "-o", help="Output format: table or json"),
 ):
     """Show status of running instances."""
-    config = get_config()
-    api = get_api(config)
+    check_output_format(output_format)
+    if history and output_format == "json":
+        console.print("[red]Error: --format json is not supported with --history[/red]")
+        raise typer.Exit(1)
 
-    try:
-        # Show termination history if requested
-        if history:
-            display_worker_history(config, history_hours)
-            return
+    services = get_services(ctx)
+    config = services.config
+    api = services.api
+    instance_mgr = services.instance_mgr
+
+    # Show termination history if requested
+    if history:
+        display_worker_history(config, history_hours, limit)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with console.status("[cyan]Fetching instances...[/cyan]"), ThreadPoolExecutor(max_workers=1) as pool:
+        # The running table needs pricing; fetch it alongside the instance list
+        pricing = None
+        if output_format == "table" and not stopped:
+            pricing = pool.submit(get_instance_types, api, refresh, PRICING_CACHE_TTL)
 
         if instance_id:
             instances = [api.get_instance(instance_id)]
-            if instances[0] is None:
-                console.print(f"[red]Instance {instance_id} not found[/red]")
-                raise typer.Exit(1)
         else:
-            instances = api.list_instances()
+            instances = instance_mgr.list_instances(refresh=refresh)
 
-        if not instances:
-            console.print("[yellow]No instances found[/yellow]")
-            return
+    if instance_id and instances[0] is None:
+        console.print(f"[red]Instance {instance_id} not found[/red]")
+        raise typer.Exit(1)
 
-        # Show stopped instances if requested
-        if stopped:
-            show_stopped_instances(instances)
-            return
+    if output_format == "json":
+        from dataclasses import asdict
+        # Same selection as the tables: running by default, stopped with --stopped
+        print_json([
+            asdict(i) for i in instances
+            if (i.status in STOPPED_STATES) == stopped
+        ])
+        return
 
-        # Filter to running instances only for default view
-        running_instances = [i for i in instances if i.status not in ["terminated", "stopped"]]
+    if not instances:
+        console.print("[yellow]No instances found[/yellow]")
+        return
 
-        if not running_instances:
-            console.print("[yellow]No running instances found[/yellow]")
-            console.print("\nUse --stopped to see terminated instances")
-            console.print("Use --history to see termination history")
-            return
+    # Show stopped instances if requested
+    if stopped:
+        show_stopped_instances(instances)
+        return
 
-        # Fetch pricing for all instance types (cache for efficiency)
-        pricing_cache: Dict[str, InstanceType] = {}
-        try:
-            for itype in api.list_instance_types():
-                pricing_cache[itype.name] = itype
-        except LambdaAPIError:
-            pass  # Continue without pricing if API fails
-
-        # Create table
-        table = Table(title="GPU Instances")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="magenta")
-        table.add_column("Status", style="green")
-        table.add_column("IP", style="blue")
-        table.add_column("GPU", style="yellow")
-        table.add_column("Uptime", style="white")
-        table.add_column("Time Left", style="white")
-        table.add_column("Cost Now", style="yellow")
-        table.add_column("Est. Total", style="yellow")
-
-        for instance in running_instances:
-            now = datetime.utcnow()
-
-            # Calculate uptime
-            uptime_text = "-"
-            uptime_hours = 0.0
-            try:
-                created = datetime.fromisoformat(instance.created_at.replace('Z', '+00:00'))
-                now_tz = now.replace(tzinfo=created.tzinfo)
-                uptime = now_tz - created
-                uptime_hours = uptime.total_seconds() / 3600
-                hours_up = int(uptime_hours)
-                mins_up = int((uptime.total_seconds() % 3600) // 60)
-                uptime_text = f"{hours_up}h {mins_up}m"
-            except (ValueError, AttributeError):
-                pass
-
-            # Calculate time left and total lease duration
-            time_left_text = "-"
-            total_lease_hours = 0.0
-            is_expired = False
-            if instance.lease_expires_at:
-                try:
-                    expires_at = datetime.fromisoformat(instance.lease_expires_at.replace('Z', '+00:00'))
-                    created = datetime.fromisoformat(instance.created_at.replace('Z', '+00:00'))
-                    now_tz = now.replace(tzinfo=expires_at.tzinfo)
-                    time_left = expires_at - now_tz
-                    total_lease = expires_at - created
-                    total_lease_hours = total_lease.total_seconds() / 3600
-
-                    hours_left = int(time_left.total_seconds() // 3600)
-                    mins_left = int((time_left.total_seconds() % 3600) // 60)
-
-                    if time_left.total_seconds() < 0:
-                        time_left_text = "[red]EXPIRED[/red]"
-                        is_expired = True
-                    elif hours_left < 1:
-                        time_left_text = f"[yellow]{mins_left}m[/yellow]"
-                    else:
-                        time_left_text = f"[green]{hours_left}h {mins_left}m[/green]"
-                except (ValueError, AttributeError):
-                    pass
-
-            # Calculate costs
-            current_cost_text = "-"
-            total_cost_text = "-"
-            instance_type = pricing_cache.get(instance.instance_type)
-            if instance_type:
-                current_cost = instance_type.price_per_hour * uptime_hours
-                current_cost_text = f"${current_cost:.2f}"
-
-                if total_lease_hours > 0:
-                    total_cost = instance_type.price_per_hour * total_lease_hours
-                    total_cost_text = f"${total_cost:.2f}"
-
-                # Highlight in red if expired (cost is still accruing!)
-                if is_expired:
-                    current_cost_text = f"[red]{current_cost_text}[/red]"
-
-            table.add_row(
-                instance.id[:8],
-                instance.name or "-",
-                instance.status,
-                instance.ip or "-",
-                instance.instance_type,
-                uptime_text,
-                time_left_text,
-                current_cost_text,
-                total_cost_text,
-            )
+    # Filter to running instances only for default view
+    running_instances = [i for i in instances if i.status not in STOPPED_STATES]
 
-        console.print(table)
-
-        # Show total cost summary if multiple instances
-        if len(running_instances) > 1:
-            total_current = 0.0
-            for instance in running_instances:
-                instance_type = pricing_cache.get(instance.instance_type)
-                if instance_type:
-                    try:
-                        created = datetime.fromisoformat(instance.created_at.replace('Z', '+00:00'))
-                        now_tz = datetime.utcnow().replace(tzinfo=created.tzinfo)
-                        uptime_hours = (now_tz - created).total_seconds() / 3600
-                        total_current += instance_type.price_per_hour * uptime_hours
-                    except (ValueError, AttributeError):
-                        pass
-            if total_current > 0:
-                console.print(f"\n[bold]Total current cost: [yellow]${total_current:.2f}[/yellow][/bold]")
+    if not running_instances:
+        console.print("[yellow]No running instances found[/yellow]")
+        console.print("\nUse --stopped to see terminated instances")
+        console.print("Use --history to see termination history")
+        return
 
-    except LambdaAPIError as e:
-        console.print(f"[red]Error getting status: {e}[/red]")
-        raise typer.Exit(1)
+    # Index pricing by instance type name
+    try:
+        pricing_cache: Dict[str, InstanceType] = {t.name: t for t in pricing.result()}
+    except LambdaAPIError:
+        pricing_cache = {}  # Continue without pricing if API fails
+
+    # Create table
+    table = make_table("GPU Instances", STATUS_COLUMNS)
+
+    now = datetime.now(timezone.utc)
+    total_current = 0.0
+    for instance in running_instances:
+        created = parse_timestamp(instance.created_at)
+
+        # Calculate uptime
+        uptime_text = "-"
+        uptime_hours = 0.0
+        if created:
+            uptime = now - created
+            uptime_hours = uptime.total_seconds() / 3600
+            hours_up = int(uptime_hours)
+            mins_up = int((uptime.total_seconds() % 3600) // 60)
+            uptime_text = f"{hours_up}h {mins_up}m"
+
+        # Calculate time left and total lease duration
+        time_left_text = "-"
+        total_lease_hours = 0.0
+        is_expired = False
+        expires_at = parse_timestamp(instance.lease_expires_at)
+        if expires_at and created:
+            time_left = expires_at - now
+            total_lease = expires_at - created
+            total_lease_hours = total_lease.total_seconds() / 3600
+
+            is_expired = time_left.total_seconds() < 0
+            time_left_text = format_time_left(time_left.total_seconds())
+
+        # Calculate costs
+        current_cost_text = "-"
+        total_cost_text = "-"
+        instance_type = pricing_cache.get(instance.instance_type)
+        if instance_type:
+            current_cost = instance_type.price_per_hour * uptime_hours
+            current_cost_text = f"${current_cost:.2f}"
+            total_current += current_cost
+
+            if total_lease_hours > 0:
+                total_cost = instance_type.price_per_hour * total_lease_hours
+                total_cost_text = f"${total_cost:.2f}"
+
+            # Highlight in red if expired (cost is still accruing!)
+            if is_expired:
+                current_cost_text = Text(current_cost_text, style="red")
+
+        table.add_row(
+            instance.id[:8],
+            instance.name or "-",
+            instance.status,
+            instance.ip or "-",
+            instance.instance_type,
+            uptime_text,
+            time_left_text,
+            current_cost_text,
+            total_cost_text,
+        )
+
+    console.print(table)
+
+    # Show total cost summary if multiple instances
+    if len(running_instances) > 1 and total_current > 0:
+        console.print(f"\n[bold]Total current cost: [yellow]${total_current:.2f}[/yellow][/bold]")
 
 
 @app.command()
 def extend(
+    ctx: typer.Context,
     hours: int = typer.Argument(..., help="Hours to extend lease"),
     instance_id: Optional[str] = typer.Option(None, help="Instance ID (uses active if not specified)"),
     yes: bool = typer.Option(False, "-y", "--yes", help="Skip cost confirmation"),
 ):
     """Extend instance lease."""
-    config = get_config()
-    api = get_api(config)
-    instance_mgr = InstanceManager(api)
+    services = get_services(ctx)
+    config = services.config
+    api = services.api
+    instance_mgr = services.instance_mgr
 
     # Get instance
-    if instance_id:
-        instance = api.get_instance(instance_id)
-    else:
-        instance = instance_mgr.get_active_instance()
+    instance = _resolve_instance(api, instance_mgr, instance_id)
 
     if not instance:
         console.print("[red]No instance found[/red]")
@@ -1305,6 +1559,7 @@ def extend(
             ))
             console.print()
 
+            import questionary
             confirm = questionary.confirm(
                 f"Extend lease by {hours} hours?",
                 default=True,
@@ -1314,15 +1569,16 @@ def extend(
                 console.print("[yellow]Extension cancelled.[/yellow]")
                 raise typer.Exit(0)
 
-    # Make request to status daemon
     import requests
+
+    # Make request to status daemon
     try:
         url = f"http://{instance.ip}:{config.status_daemon.port}/extend"
-        resp = requests.post(
+        resp = _http_session().post(
             url,
             headers={"Authorization": f"Bearer {config.status_daemon.token}"},
             data={"hours": hours},
-            timeout=10,
+            timeout=STATUS_DAEMON_TIMEOUT,
         )
         resp.raise_for_status()
         result = resp.json()
@@ -1336,21 +1592,21 @@ def extend(
 
 
 @app.command()
+@handle_api_errors("terminating instance")
 def stop(
+    ctx: typer.Context,
     instance_id: Optional[str] = typer.Option(None, help="Instance ID (uses active if not specified)"),
     confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
     wait: bool = typer.Option(True, help="Wait for instance to be terminated"),
 ):
     """Terminate instance."""
-    config = get_config()
-    api = get_api(config)
-    instance_mgr = InstanceManager(api)
+    services = get_services(ctx)
+    config = services.config
+    api = services.api
+    instance_mgr = services.instance_mgr
 
     # Get instance
-    if instance_id:
-        instance = api.get_instance(instance_id)
-    else:
-        instance = instance_mgr.get_active_instance()
+    instance = _resolve_instance(api, instance_mgr, instance_id)
 
     if not instance:
         console.print("[red]No instance found[/red]")
@@ -1370,9 +1626,9 @@ def stop(
     duration_minutes = 0
     cost_dollars = 0.0
     try:
-        # Check if created_at exists and is a string
-        if hasattr(instance, 'created_at') and isinstance(instance.created_at, str):
-            created = datetime.fromisoformat(instance.created_at.replace('Z', '+00:00'))
+        # Mock instances may carry no created_at at all
+        created = parse_timestamp(getattr(instance, 'created_at', None))
+        if created:
             now = datetime.now(timezone.utc)
             duration = now - created
             duration_minutes = int(duration.total_seconds() / 60)
@@ -1385,43 +1641,39 @@ def stop(
     except (ValueError, AttributeError, LambdaAPIError):
         pass  # Continue with zero values if calculation fails
 
-    try:
-        api.terminate_instance(instance.id)
-        console.print(f"[cyan]Terminating instance {instance.id}...[/cyan]")
+    api.terminate_instance(instance.id)
+    instance_mgr.invalidate_cache()
+    console.print(f"[cyan]Terminating instance {instance.id}...[/cyan]")
 
-        if wait:
-            instance_mgr.wait_for_terminated(instance.id, timeout_seconds=120)
+    if wait:
+        instance_mgr.wait_for_terminated(instance.id, timeout_seconds=120)
 
-        # Log termination event (skip in mock mode, does not raise on failure)
-        if not _mock_mode:
-            log_terminate_event(config, instance, duration_minutes, cost_dollars, metrics)
-    except LambdaAPIError as e:
-        console.print(f"[red]Error terminating instance: {e}[/red]")
-        raise typer.Exit(1)
+    # Log termination event (skip in mock mode, does not raise on failure)
+    if not _mock_mode:
+        log_terminate_event(config, instance, duration_minutes, cost_dollars, metrics)
 
 
 @app.command()
 def ssh(
+    ctx: typer.Context,
     instance_id: Optional[str] = typer.Option(None, help="Instance ID (uses active if not specified)"),
 ):
     """SSH into instance."""
-    config = get_config()
-    api = get_api(config)
-    instance_mgr = InstanceManager(api)
+    services = get_services(ctx)
+    config = services.config
+    api = services.api
+    instance_mgr = services.instance_mgr
 
     # Get Lambda SSH keys for better error messages
     try:
-        lambda_keys = api.list_ssh_keys()
+        lambda_keys = get_ssh_key_names(api)
     except LambdaAPIError:
         lambda_keys = []
 
     ssh_mgr = SSHTunnelManager(config.ssh.key_path, lambda_key_names=lambda_keys)
 
     # Get instance
-    if instance_id:
-        instance = api.get_instance(instance_id)
-    else:
-        instance = instance_mgr.get_active_instance()
+    instance = _resolve_instance(api, instance_mgr, instance_id)
 
     if not instance:
         console.print("[red]No instance found[/red]")
@@ -1431,44 +1683,48 @@ def ssh(
         console.print("[red]Instance has no IP address[/red]")
         raise typer.Exit(1)
 
-    ssh_mgr.connect_ssh(instance.ip)
+    ssh_mgr.connect_ssh(instance.ip, replace_process=True)
 
 
 @app.command()
-def available():
+@handle_api_errors("getting GPU types")
+def available(
+    ctx: typer.Context,
+    refresh: bool = typer.Option(False, "--refresh", help="Bypass the cached GPU type list"),
+    output_format: str = typer.Option("table", "--format", "-o", help="Output format: table or json"),
+):
     """Show available GPU types and models."""
-    config = get_config()
-    api = get_api(config)
+    check_output_format(output_format)
+    api = get_services(ctx).api
 
-    try:
-        instance_types = api.list_instance_types()
+    with console.status("[cyan]Fetching GPU types...[/cyan]"):
+        instance_types = get_instance_types(api, refresh=refresh)
 
-        # Create table
-        table = Table(title="Available GPU Types")
-        table.add_column("GPU Type", style="cyan")
-        table.add_column("Description", style="dim")
-        table.add_column("Price", style="yellow")
-        table.add_column("Regions", style="green")
-
-        for gpu in instance_types:
-            regions_str = ", ".join(gpu.regions_available) if gpu.regions_available else "[dim]-[/dim]"
-            table.add_row(
-                gpu.name,
-                gpu.description,
-                gpu.format_price(),
-                regions_str,
-            )
+    if output_format == "json":
+        from dataclasses import asdict
+        print_json([asdict(t) for t in instance_types])
+        return
 
-        console.print(table)
+    # Create table
+    table = make_table("Available GPU Types", AVAILABLE_COLUMNS)
+
+    add_row = table.add_row
+    for gpu in instance_types:
+        add_row(
+            gpu.name,
+            gpu.description,
+            gpu.format_price(),
+            ", ".join(gpu.regions_available) or "[dim]-[/dim]",
+        )
 
-        # Show recommended models
-        console.print("\n[cyan]Recommended Models:[/cyan]")
-        console.print("  deepseek-r1-70b (requires A100 80GB)")
-        console.print("  qwen2.5-coder-32b (works on RTX 6000)")
+    console.print(table)
 
-    except LambdaAPIError as e:
-        console.print(f"[red]Error getting GPU types: {e}[/red]")
-        raise typer.Exit(1)
+    # Show recommended models
+    console.print("\n[cyan]Recommended Models:[/cyan]")
+    for model_id in ("deepseek-r1-70b", "qwen2.5-coder-32b"):
+        gpu = get_recommended_gpu(model_id)
+        gpu_desc = KNOWN_GPUS.get(gpu, {}).get('description', gpu)
+        console.print(f"  {model_id}: {gpu_desc} or larger")
 
 
 # Models subcommand group
@@ -1483,7 +1739,7 @@ def models_list(ctx: typer.Context):
     if ctx.invoked_subcommand is not None:
         return
 
-    config = get_config()
+    config = get_services(ctx).config
 
     # Create table
     table = Table(
@@ -1547,11 +1803,14 @@ def models_list(ctx: typer.Context):
 
 
 @models_app.command("info")
-def models_info(model_id: str = typer.Argument(..., help="Model ID to display info for")):
+def models_info(
+    ctx: typer.Context,
+    model_id: str = typer.Argument(..., help="Model ID to display info for"),
+):
     """Display detailed information about a specific model."""
     from .models import MODEL_INFO, estimate_vram
 
-    config = get_config()
+    config = get_services(ctx).config
 
     # Check known models first
     model_config = get_model_config(model_id)
@@ -1588,7 +1847,11 @@ def models_info(model_id: str = typer.Argument(..., help="Model ID to display in
     vram_breakdown = estimate_vram(
         model_config.params_billions,
         model_config.default_quantization,
-        model_config.context_length
+        model_config.context_length,
+        kv_quantization=model_config.kv_quantization,
+        n_layers=model_config.n_layers,
+        n_kv_heads=model_config.n_kv_heads,
+        head_dim=model_config.head_dim,
     )
 
     # Display model information
@@ -1620,7 +1883,7 @@ def models_info(model_id: str = typer.Argument(..., help="Model ID to display in
 
         # Try to get pricing from API
         try:
-            api = get_api(config)
+            api = get_services(ctx).api
             instance_type = api.get_instance_type(recommended_gpu)
             if instance_type:
                 console.print(f"  Price: {instance_type.format_price()}")
@@ -1649,6 +1912,7 @@ def models_info(model_id: str = typer.Argument(..., help="Model ID to display in
 
 @models_app.command("add")
 def models_add(
+    ctx: typer.Context,
     name: Optional[str] = typer.Option(None, "--name", help="Model name/ID"),
     hf_path: Optional[str] = typer.Option(None, "--hf-path", help="HuggingFace model path"),
     params: Optional[float] = typer.Option(None, "--params", help="Parameter count in billions"),
@@ -1656,13 +1920,15 @@ def models_add(
     context: Optional[int] = typer.Option(None, "--context", help="Context length"),
 ):
     """Add a custom model to configuration."""
-    config = get_config()
+    config = get_services(ctx).config
 
     # Determine if we're in interactive or flag mode
     interactive = name is None
 
     if interactive:
         # Interactive mode using questionary
+        import questionary
+
         console.print("[bold]Add Custom Model[/bold]\n")
 
         name = questionary.text("Model name/ID:").ask()
@@ -1733,18 +1999,19 @@ def models_add(
     config.custom_models[name] = model_data
 
     # Save config
-    config_manager.save(config)
+    get_config_manager().save(config)
 
     console.print(f"[green]Model '{name}' added successfully![/green]")
 
 
 @models_app.command("remove")
 def models_remove(
+    ctx: typer.Context,
     model_id: str = typer.Argument(..., help="Model ID to remove"),
     yes: bool = typer.Option(False, "-y", "--yes", help="Skip confirmation"),
 ):
     """Remove a custom model from configuration."""
-    config = get_config()
+    config = get_services(ctx).config
 
     # Check if trying to remove built-in model
     if model_id in KNOWN_MODELS:
@@ -1758,6 +2025,7 @@ def models_remove(
 
     # Confirm removal unless --yes flag provided
     if not yes:
+        import questionary
         confirmed = questionary.confirm(
             f"Remove custom model '{model_id}'?",
             default=False,
@@ -1771,7 +2039,7 @@ def models_remove(
     del config.custom_models[model_id]
 
     # Save updated config
-    config_manager.save(config)
+    get_config_manager().save(config)
 
     console.print(f"[green]Custom model '{model_id}' removed.[/green]")
 
@@ -1783,10 +2051,11 @@ app.add_typer(worker_app, name="worker")
 
 @worker_app.command("deploy")
 def worker_deploy_cmd(
+    ctx: typer.Context,
     force: bool = typer.Option(False, "--force", "-f", help="Force redeploy even if already deployed"),
 ):
     """Deploy or update the Cloudflare Worker watchdog."""
-    config = get_config()
+    config = get_services(ctx).config
 
     # Validate Cloudflare credentials
     if not config.cloudflare.api_token or not config.cloudflare.account_id:
@@ -1800,23 +2069,27 @@ def worker_deploy_cmd(
         console.print("Use --force to redeploy")
         raise typer.Exit(0)
 
+    from .worker import deploy_worker
+
     try:
-        updated_config = deploy_worker(config, config_manager)
+        updated_config = deploy_worker(config, get_config_manager())
     except RuntimeError as e:
         console.print(f"[red]Deployment failed: {e}[/red]")
         raise typer.Exit(1)
 
 
 @worker_app.command("status")
-def worker_status_cmd():
+def worker_status_cmd(ctx: typer.Context):
     """Check Worker health status."""
-    config = get_config()
+    config = get_services(ctx).config
 
     if not config.cloudflare.worker_url:
         console.print("[red]Worker not deployed[/red]")
         console.print("Run 'soong worker deploy' first")
         raise typer.Exit(1)
 
+    from .worker import worker_status
+
     try:
         status = worker_status(config)
 
@@ -1835,15 +2108,17 @@ def worker_status_cmd():
 
 
 @worker_app.command("logs")
-def worker_logs_cmd():
+def worker_logs_cmd(ctx: typer.Context):
     """Stream Worker logs (real-time)."""
-    config = get_config()
+    config = get_services(ctx).config
 
     if not config.cloudflare.worker_url:
         console.print("[red]Worker not deployed[/red]")
         console.print("Run 'soong worker deploy' first")
         raise typer.Exit(1)
 
+    from .worker import worker_logs
+
     try:
         worker_logs()
     except RuntimeError as e:
@@ -1853,13 +2128,16 @@ def worker_logs_cmd():
 
 @worker_app.command("destroy")
 def worker_destroy_cmd(
+    ctx: typer.Context,
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ):
     """Destroy Worker deployment and KV namespace."""
-    config = get_config()
+    config = get_services(ctx).config
+
+    from .worker import destroy_worker
 
     try:
-        updated_config = destroy_worker(config, config_manager, force=force)
+        updated_config = destroy_worker(config, get_config_manager(), force=force)
     except RuntimeError as e:
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
@@ -1871,15 +2149,17 @@ app.add_typer(tunnel_app, name="tunnel")
 
 
 def _start_tunnel(
+    ctx: typer.Context,
     instance_id: Optional[str] = None,
     sglang_port: Optional[int] = None,
     n8n_port: Optional[int] = None,
     status_port: Optional[int] = None,
 ):
     """Shared tunnel start logic."""
-    config = get_config()
-    api = get_api(config)
-    instance_mgr = InstanceManager(api)
+    services = get_services(ctx)
+    config = services.config
+    api = services.api
+    instance_mgr = services.instance_mgr
 
     # Use config defaults if not specified
     sglang_port = sglang_port if sglang_port is not None else config.tunnel.sglang_port
@@ -1888,17 +2168,14 @@ def _start_tunnel(
 
     # Get Lambda SSH keys for better error messages
     try:
-        lambda_keys = api.list_ssh_keys()
+        lambda_keys = get_ssh_key_names(api)
     except LambdaAPIError:
         lambda_keys = []
 
     ssh_mgr = SSHTunnelManager(config.ssh.key_path, lambda_key_names=lambda_keys)
 
     # Get instance
-    if instance_id:
-        instance = api.get_instance(instance_id)
-    else:
-        instance = instance_mgr.get_active_instance()
+    instance = _resolve_instance(api, instance_mgr, instance_id)
 
     if not instance:
         console.print("[red]No instance found[/red]")
@@ -1935,24 +2212,25 @@ def tunnel_default(
 ):
     """Start SSH tunnels to instance services (default: start)."""
     if ctx.invoked_subcommand is None:
-        _start_tunnel(instance_id, sglang_port, n8n_port, status_port)
+        _start_tunnel(ctx, instance_id, sglang_port, n8n_port, status_port)
 
 
 @tunnel_app.command("start")
 def tunnel_start(
+    ctx: typer.Context,
     instance_id: Optional[str] = typer.Option(None, help="Instance ID (uses active if not specified)"),
     sglang_port: Optional[int] = typer.Option(None, help="Local port for SGLang (default: from config)"),
     n8n_port: Optional[int] = typer.Option(None, help="Local port for n8n (default: from config)"),
     status_port: Optional[int] = typer.Option(None, help="Local port for status daemon (default: from config)"),
 ):
     """Start SSH tunnel to instance."""
-    _start_tunnel(instance_id, sglang_port, n8n_port, status_port)
+    _start_tunnel(ctx, instance_id, sglang_port, n8n_port, status_port)
 
 
 @tunnel_app.command("stop")
-def tunnel_stop():
+def tunnel_stop(ctx: typer.Context):
     """Stop SSH tunnel."""
-    config = get_config()
+    config = get_services(ctx).config
     ssh_mgr = SSHTunnelManager(config.ssh.key_path)
 
     if not ssh_mgr.stop_tunnel():
@@ -1960,9 +2238,9 @@ def tunnel_stop():
 
 
 @tunnel_app.command("status")
-def tunnel_status():
+def tunnel_status(ctx: typer.Context):
     """Check tunnel status."""
-    config = get_config()
+    config = get_services(ctx).config
     ssh_mgr = SSHTunnelManager(config.ssh.key_path)
 
     if ssh_mgr.is_tunnel_running():
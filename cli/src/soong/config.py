@@ -1,10 +1,16 @@
 """Configuration management for GPU session CLI."""
 
+import copy
 import os
 import yaml
 from pathlib import Path
 from typing import Optional, Dict
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
+
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
 
 
 def validate_custom_model(model_data: dict) -> None:
@@ -41,8 +47,29 @@ def validate_custom_model(model_data: dict) -> None:
     if not isinstance(context, int) or context < 512:
         raise ValueError("context_length must be an integer >= 512")
 
+    # Validate optional attention shape (used to size the KV cache exactly)
+    for name in ("n_layers", "n_kv_heads", "head_dim"):
+        value = model_data.get(name)
+        if value is not None and (not isinstance(value, int) or value <= 0):
+            raise ValueError(f"{name} must be a positive integer")
+
+    kv_quant = model_data.get("kv_quantization")
+    if kv_quant is not None and str(kv_quant).lower() not in valid_quants:
+        raise ValueError(
+            f"Invalid kv_quantization '{kv_quant}'. "
+            f"Must be one of: {', '.join(valid_quants)}"
+        )
+
+
+def _section_dict(section) -> dict:
+    """Flat dict of a config section's fields.
 
-@dataclass
+    Sections hold only scalars, so this skips the deep copy asdict makes.
+    """
+    return {f.name: getattr(section, f.name) for f in fields(section)}
+
+
+@dataclass(slots=True)
 class LambdaConfig:
     """Lambda Labs API configuration."""
     api_key: str
@@ -50,14 +77,14 @@ class LambdaConfig:
     filesystem_name: str = "coding-stack"
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusDaemonConfig:
     """Status daemon configuration."""
     token: str
     port: int = 8080
 
 
-@dataclass
+@dataclass(slots=True)
 class DefaultsConfig:
     """Default session settings."""
     model: str = "deepseek-r1-70b"
@@ -65,13 +92,13 @@ class DefaultsConfig:
     lease_hours: int = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class SSHConfig:
     """SSH configuration."""
     key_path: str = "~/.ssh/id_rsa"
 
 
-@dataclass
+@dataclass(slots=True)
 class CloudflareConfig:
     """Cloudflare API configuration."""
     api_token: str = ""
@@ -81,7 +108,7 @@ class CloudflareConfig:
     worker_name: str = "gpu-watchdog"
 
 
-@dataclass
+@dataclass(slots=True)
 class TunnelConfig:
     """SSH tunnel port configuration."""
     sglang_port: int = 8000
@@ -89,7 +116,7 @@ class TunnelConfig:
     status_port: int = 8080
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Complete configuration."""
     lambda_config: LambdaConfig
@@ -116,27 +143,44 @@ class Config:
 class ConfigManager:
     """Manage configuration file."""
 
+    # (path, st_mtime_ns, st_size, parsed YAML) of the last file read
+    _cache = None
+
     def __init__(self):
         self.config_dir = Path.home() / ".config" / "gpu-dashboard"
         self.config_file = self.config_dir / "config.yaml"
 
     def load(self) -> Optional[Config]:
-        """Load configuration from file."""
-        if not self.config_file.exists():
+        """Load configuration from file.
+
+        The parsed YAML is reused while the file's mtime and size are
+        unchanged; each call still returns a fresh Config, so callers may
+        mutate it freely.
+        """
+        try:
+            stat = os.stat(self.config_file)
+        except FileNotFoundError:
             return None
 
-        with open(self.config_file) as f:
-            data = yaml.safe_load(f)
+        key = (self.config_file, stat.st_mtime_ns, stat.st_size)
+        if self._cache and self._cache[:3] == key:
+            data = copy.deepcopy(self._cache[3])
+        else:
+            with open(self.config_file) as f:
+                data = yaml.load(f, Loader=YamlLoader)
+
+            # Validate custom models once per file change
+            for model_id, model_data in data.get("custom_models", {}).items():
+                try:
+                    validate_custom_model(model_data)
+                except ValueError as e:
+                    # Log warning but don't fail load
+                    import logging
+                    logging.warning(f"Invalid custom model '{model_id}': {e}")
+
+            self._cache = (*key, copy.deepcopy(data))
 
-        # Load custom_models and validate each one
         custom_models = data.get("custom_models", {})
-        for model_id, model_data in custom_models.items():
-            try:
-                validate_custom_model(model_data)
-            except ValueError as e:
-                # Log warning but don't fail load
-                import logging
-                logging.warning(f"Invalid custom model '{model_id}': {e}")
 
         return Config(
             lambda_config=LambdaConfig(**data.get("lambda", {})),
@@ -153,20 +197,21 @@ class ConfigManager:
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
         data = {
-            "lambda": asdict(config.lambda_config),
-            "status_daemon": asdict(config.status_daemon),
-            "defaults": asdict(config.defaults),
-            "ssh": asdict(config.ssh),
-            "cloudflare": asdict(config.cloudflare),
-            "tunnel": asdict(config.tunnel),
+            "lambda": _section_dict(config.lambda_config),
+            "status_daemon": _section_dict(config.status_daemon),
+            "defaults": _section_dict(config.defaults),
+            "ssh": _section_dict(config.ssh),
+            "cloudflare": _section_dict(config.cloudflare),
+            "tunnel": _section_dict(config.tunnel),
             "custom_models": config.custom_models,
         }
 
         with open(self.config_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False)
+            yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False)
 
         # Secure permissions
         os.chmod(self.config_file, 0o600)
+        self._cache = None
 
     def exists(self) -> bool:
         """Check if configuration file exists."""
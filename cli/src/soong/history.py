@@ -4,11 +4,18 @@ import json
 import requests
 from pathlib import Path
 from typing import List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta, timezone
 
+from .session import http_session
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install soong[fast]
+    orjson = None
+
+
+@dataclass(slots=True)
 class HistoryEvent:
     """Represents a history event (instance termination)."""
     timestamp: str
@@ -21,7 +28,8 @@ class HistoryEvent:
 
     def to_dict(self):
         """Convert to dictionary."""
-        return asdict(self)
+        # Flat fields only, so this skips the deep copy asdict makes
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
     @classmethod
     def from_dict(cls, data: dict) -> "HistoryEvent":
@@ -29,6 +37,30 @@ class HistoryEvent:
         return cls(**data)
 
 
+def _is_after(timestamp: str, cutoff: datetime, cutoff_prefix: str) -> bool:
+    """
+    Check whether an ISO 8601 timestamp is later than the cutoff.
+
+    UTC timestamps as the worker writes them ("2025-01-15T08:30:00.000Z")
+    sort the same as strings, so they are compared on their seconds prefix
+    without parsing. Other formats, and ties within the cutoff second, are
+    parsed.
+
+    Args:
+        timestamp: Event timestamp
+        cutoff: Cutoff time (timezone-aware)
+        cutoff_prefix: cutoff formatted as "%Y-%m-%dT%H:%M:%S" in UTC
+
+    Returns:
+        True if the event happened after the cutoff
+    """
+    if len(timestamp) >= 20 and timestamp[-1] == 'Z' and timestamp[10] == 'T' and timestamp[19] in '.Z':
+        prefix = timestamp[:19]
+        if prefix != cutoff_prefix:
+            return prefix > cutoff_prefix
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')) > cutoff
+
+
 class HistoryManager:
     """Manager for instance termination history."""
 
@@ -52,19 +84,17 @@ class HistoryManager:
             return []
 
         try:
-            with open(self.history_file, 'r') as f:
-                data = json.load(f)
-
-            events = [HistoryEvent.from_dict(event) for event in data]
+            with open(self.history_file, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-            # Filter by time window
+            # Filter by time window before building events
             cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-            filtered = [
-                event for event in events
-                if datetime.fromisoformat(event.timestamp.replace('Z', '+00:00')) > cutoff
+            cutoff_prefix = cutoff.strftime('%Y-%m-%dT%H:%M:%S')
+            return [
+                HistoryEvent.from_dict(event) for event in data
+                if _is_after(event['timestamp'], cutoff, cutoff_prefix)
             ]
-
-            return filtered
         except (json.JSONDecodeError, KeyError, ValueError, TypeError):
             return []
 
@@ -75,6 +105,12 @@ class HistoryManager:
         Args:
             events: List of history events to save
         """
+        if orjson is not None:
+            # orjson serializes dataclasses natively
+            with open(self.history_file, 'wb') as f:
+                f.write(orjson.dumps(events, option=orjson.OPT_INDENT_2))
+            return
+
         with open(self.history_file, 'w') as f:
             json.dump([event.to_dict() for event in events], f, indent=2)
 
@@ -92,7 +128,7 @@ class HistoryManager:
             List of history events or None if fetch failed
         """
         try:
-            response = requests.get(
+            response = http_session().get(
                 f"{worker_url}/history",
                 params={"hours": hours},
                 timeout=10,
@@ -1,13 +1,17 @@
 """Instance lifecycle management."""
 
+import socket
 import subprocess
 import time
-from typing import Optional
+from dataclasses import asdict, dataclass
+from typing import List, Optional
 from rich.console import Console
 from rich.live import Live
 from rich.text import Text
 
+from .cache import clear_cache, read_cache, write_cache
 from .lambda_api import LambdaAPI, Instance, LambdaAPIError
+from .ssh import ssh_control_options
 
 console = Console(force_terminal=True)
 
@@ -16,6 +20,9 @@ def check_service_health(ip: str, ssh_key_path: str, timeout: int = 5) -> bool:
     """
     Check if services are healthy via SSH.
 
+    Checks share a multiplexed SSH connection, so only the first one pays
+    for the handshake.
+
     Args:
         ip: Instance IP address
         ssh_key_path: Path to SSH private key
@@ -32,6 +39,7 @@ def check_service_health(ip: str, ssh_key_path: str, timeout: int = 5) -> bool:
                 "-o", "UserKnownHostsFile=/dev/null",
                 "-o", "ConnectTimeout=5",
                 "-o", "BatchMode=yes",
+                *ssh_control_options(),
                 "-i", ssh_key_path,
                 f"ubuntu@{ip}",
                 "curl -sf http://localhost:8080/health",
@@ -45,48 +53,154 @@ def check_service_health(ip: str, ssh_key_path: str, timeout: int = 5) -> bool:
         return False
 
 
+def is_port_open(ip: str, port: int, timeout: float = 2) -> bool:
+    """
+    Check whether a TCP connection to ip:port can be opened.
+
+    Args:
+        ip: Host IP address
+        port: TCP port
+        timeout: Connect timeout in seconds
+
+    Returns:
+        True if the connection succeeded
+    """
+    try:
+        with socket.create_connection((ip, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def read_cached_instance(api_key: str, instance_id: str, ttl: float) -> Optional[Instance]:
+    """
+    Look up an instance in the cached instance list without calling the API.
+
+    Args:
+        api_key: API key the list was fetched with
+        instance_id: Instance ID
+        ttl: Maximum age of the cached list in seconds
+
+    Returns:
+        Instance, or None if it is not in a fresh cached list
+    """
+    for item in read_cache("instances", api_key, ttl) or ():
+        if item["id"] == instance_id:
+            return Instance(**item)
+    return None
+
+
 class StatusDisplay:
-    """Dynamic status display that updates elapsed time on each render."""
+    """Dynamic status display that updates elapsed time on each render.
+
+    The spinner advances with the clock rather than once per render, so
+    repeated renders within the same tick return the same Text.
+    """
 
     SPINNER_CHARS = "|/-\\"
+    REFRESH_PER_SECOND = 2  # one spinner frame per refresh
 
     def __init__(self, start_time: float):
         self.start_time = start_time
         self.status = "booting"
-        self.frame = 0
         self._time_func = time.time  # Capture reference before any mocking
+        self._rendered_key = None
+        self._rendered = None
 
     def __rich__(self):
-        elapsed = int(self._time_func() - self.start_time)
-        spinner_char = self.SPINNER_CHARS[self.frame % len(self.SPINNER_CHARS)]
-        self.frame += 1
-        return Text(f"{spinner_char} Status: {self.status} (elapsed: {elapsed}s)")
+        tick = int((self._time_func() - self.start_time) * self.REFRESH_PER_SECOND)
+        key = (tick, self.status)
+        if key != self._rendered_key:
+            elapsed = tick // self.REFRESH_PER_SECOND
+            spinner_char = self.SPINNER_CHARS[tick % len(self.SPINNER_CHARS)]
+            self._rendered = Text(f"{spinner_char} Status: {self.status} (elapsed: {elapsed}s)")
+            self._rendered_key = key
+        return self._rendered
+
+
+@dataclass
+class WaiterConfig:
+    """Polling schedule for waiters.
+
+    The interval starts at ``initial`` seconds and is multiplied by
+    ``multiplier`` after every poll, capped at ``max``. The defaults
+    reproduce a fixed 10 second interval.
+    """
+
+    initial: float = 10
+    max: float = 10
+    multiplier: float = 1.0
+
+    def next_interval(self, current: float) -> float:
+        """Return the interval to use after a poll that waited ``current``."""
+        return min(self.max, current * self.multiplier)
 
 
 class InstanceManager:
     """Manage Lambda instance lifecycle."""
 
-    def __init__(self, api: LambdaAPI):
+    PROBE_INTERVAL = 2  # seconds between direct port probes
+    HEALTH_INTERVAL = 3  # seconds between multiplexed health checks
+
+    def __init__(self, api: LambdaAPI, cache_ttl: float = 0):
         self.api = api
+        self.cache_ttl = cache_ttl  # seconds to reuse the on-disk instance list (0 disables)
+
+    def list_instances(self, refresh: bool = False) -> List[Instance]:
+        """
+        List instances, served from the on-disk cache while it is fresh.
+
+        Args:
+            refresh: Bypass the cache and fetch from the API
+
+        Returns:
+            List of instances
+        """
+        if self.cache_ttl and not refresh:
+            cached = read_cache("instances", self.api.api_key, self.cache_ttl)
+            if cached is not None:
+                return [Instance(**item) for item in cached]
+
+        instances = self.api.list_instances()
+        if self.cache_ttl:
+            write_cache("instances", self.api.api_key, [asdict(i) for i in instances])
+        return instances
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached instance list after launching or terminating."""
+        clear_cache("instances")
 
     def wait_for_ready(
-        self, instance_id: str, timeout_seconds: int = 600
+        self,
+        instance_id: str,
+        timeout_seconds: int = 600,
+        waiter: Optional[WaiterConfig] = None,
+        probe_port: Optional[int] = None,
     ) -> Optional[Instance]:
         """
         Wait for instance to reach 'active' status and have an IP.
 
+        With probe_port set, fast API polling stops as soon as the instance has
+        an IP; readiness is then decided by connecting to that port directly,
+        with the API re-checked every waiter.max seconds so a terminated
+        instance still aborts the wait.
+
         Args:
             instance_id: Instance ID to wait for
             timeout_seconds: Maximum time to wait (default 10 minutes)
+            waiter: Polling schedule (default: fixed 10 second interval)
+            probe_port: TCP port to probe once an IP is assigned (e.g. 22)
 
         Returns:
             Instance object when ready, or None if timeout
         """
+        waiter = waiter or WaiterConfig()
         start_time = time.time()
-        poll_interval = 10  # seconds between API calls
+        poll_interval = waiter.initial  # seconds between API calls
         status_display = StatusDisplay(start_time)
+        probing = None  # instance whose IP is being probed
 
-        with Live(status_display, console=console, refresh_per_second=4) as live:
+        with Live(status_display, console=console, refresh_per_second=StatusDisplay.REFRESH_PER_SECOND) as live:
             while True:
                 current_time = time.time()
                 elapsed = current_time - start_time
@@ -97,6 +211,33 @@ class InstanceManager:
                     )
                     return None
 
+                if probing is not None:
+                    if current_time - last_checked >= waiter.max:
+                        # Still check the API now and then so a dead instance
+                        # is not probed until the timeout
+                        last_checked = current_time
+                        try:
+                            instance = self.api.get_instance(instance_id)
+                        except LambdaAPIError as e:
+                            console.print(f"[yellow]API error: {e}[/yellow]")
+                        else:
+                            if instance is None:
+                                console.print("[red]Instance not found[/red]")
+                                return None
+                            if instance.status in ["terminated", "unhealthy"]:
+                                console.print(f"[red]Instance in {instance.status} state[/red]")
+                                return None
+                            if instance.ip:
+                                probing = instance
+                                status_display.status = f"{instance.status}, waiting for port {probe_port}"
+
+                    if is_port_open(probing.ip, probe_port):
+                        live.update(Text.from_markup("[green]✓ Instance ready![/green]"))
+                        return self._refresh_instance(probing)
+                    time.sleep(self.PROBE_INTERVAL)
+                    continue
+
+                instance = None
                 try:
                     instance = self.api.get_instance(instance_id)
                     if instance is None:
@@ -109,6 +250,12 @@ class InstanceManager:
                     elif instance.status in ["terminated", "unhealthy"]:
                         console.print(f"[red]Instance in {instance.status} state[/red]")
                         return None
+                    elif probe_port and instance.ip:
+                        # IP assigned: check the host itself instead of the API
+                        probing = instance
+                        last_checked = current_time
+                        status_display.status = f"{instance.status}, waiting for port {probe_port}"
+                        continue
 
                     status_display.status = instance.status
 
@@ -116,6 +263,25 @@ class InstanceManager:
                     console.print(f"[yellow]API error: {e}[/yellow]")
 
                 time.sleep(poll_interval)
+                if instance is not None and instance.status == "active":
+                    # Booted but waiting on an IP; no need to poll quickly
+                    poll_interval = waiter.max
+                else:
+                    poll_interval = waiter.next_interval(poll_interval)
+
+    def _refresh_instance(self, instance: Instance) -> Instance:
+        """Re-fetch an instance, falling back to the given snapshot on failure.
+
+        Args:
+            instance: Last known state of the instance
+
+        Returns:
+            Current Instance from the API, or the snapshot if it can't be fetched
+        """
+        try:
+            return self.api.get_instance(instance.id) or instance
+        except LambdaAPIError:
+            return instance
 
     def wait_for_services(
         self,
@@ -135,11 +301,10 @@ class InstanceManager:
             True if services are healthy, False on timeout
         """
         start_time = time.time()
-        poll_interval = 10
         status_display = StatusDisplay(start_time)
         status_display.status = "waiting for services"
 
-        with Live(status_display, console=console, refresh_per_second=4) as live:
+        with Live(status_display, console=console, refresh_per_second=StatusDisplay.REFRESH_PER_SECOND) as live:
             while True:
                 elapsed = time.time() - start_time
 
@@ -154,7 +319,7 @@ class InstanceManager:
                     return True
 
                 status_display.status = f"waiting for services ({int(elapsed)}s)"
-                time.sleep(poll_interval)
+                time.sleep(self.HEALTH_INTERVAL)
 
     def get_active_instance(self) -> Optional[Instance]:
         """
@@ -164,7 +329,7 @@ class InstanceManager:
             Active instance or None
         """
         try:
-            instances = self.api.list_instances()
+            instances = self.list_instances()
             for instance in instances:
                 if instance.status == "active":
                     return instance
@@ -191,7 +356,7 @@ class InstanceManager:
         status_display = StatusDisplay(start_time)
         status_display.status = "terminating"
 
-        with Live(status_display, console=console, refresh_per_second=4) as live:
+        with Live(status_display, console=console, refresh_per_second=StatusDisplay.REFRESH_PER_SECOND) as live:
             while True:
                 elapsed = time.time() - start_time
 
@@ -1,11 +1,44 @@
 """Lambda Labs API client."""
 
-import time
-import requests
-from typing import Optional, List, Dict, Any
+import sys
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install soong[fast]
+    orjson = None
+
+if TYPE_CHECKING:
+    import requests
+
+
+# fromisoformat only accepts a "Z" suffix from Python 3.11
+_NEEDS_Z_REWRITE = sys.version_info < (3, 11)
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO-8601 timestamp as returned by the API.
+
+    Args:
+        value: Timestamp string, possibly with a trailing "Z"
+
+    Returns:
+        Timezone-aware datetime (UTC if no offset is given), or None if
+        value is missing or malformed
+    """
+    if not value or not isinstance(value, str):
+        return None
+    if _NEEDS_Z_REWRITE and value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
 
 @dataclass
 class InstanceType:
@@ -87,40 +120,53 @@ class Instance:
             lease_expires_at=data.get("lease_expires_at"),
         )
 
-    def is_lease_expired(self) -> bool:
-        """Check if the instance lease has expired."""
-        if not self.lease_expires_at:
-            return False
+    @property
+    def expires_at(self) -> Optional[datetime]:
+        """Lease expiry as an aware datetime, re-parsed only when lease_expires_at changes."""
+        cached = self.__dict__.get("_expires_at")
+        if cached is None or cached[0] != self.lease_expires_at:
+            # Kept out of the dataclass fields so asdict() and __eq__ ignore it
+            cached = self._expires_at = (
+                self.lease_expires_at,
+                parse_timestamp(self.lease_expires_at),
+            )
+        return cached[1]
 
-        try:
-            expires_at = datetime.fromisoformat(self.lease_expires_at.replace('Z', '+00:00'))
-            return datetime.now(timezone.utc).replace(tzinfo=expires_at.tzinfo) > expires_at
-        except (ValueError, AttributeError):
+    def is_lease_expired(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check if the instance lease has expired.
+
+        Args:
+            now: Current aware time; pass one in when checking many instances
+        """
+        expires_at = self.expires_at
+        if expires_at is None:
             return False
 
-    def lease_status_style(self) -> str:
+        return (now or datetime.now(timezone.utc)) > expires_at
+
+    def lease_status_style(self, now: Optional[datetime] = None) -> str:
         """
         Get rich style string for lease status.
 
+        Args:
+            now: Current aware time; pass one in when styling many instances
+
         Returns:
             "red" if expired, "yellow" if expiring soon (< 1 hour), "green" otherwise
         """
-        if not self.lease_expires_at:
+        expires_at = self.expires_at
+        if expires_at is None:
             return "white"
 
-        try:
-            expires_at = datetime.fromisoformat(self.lease_expires_at.replace('Z', '+00:00'))
-            now = datetime.now(timezone.utc).replace(tzinfo=expires_at.tzinfo)
-            time_left = expires_at - now
-
-            if time_left.total_seconds() < 0:
-                return "red"  # Expired
-            elif time_left.total_seconds() < 3600:
-                return "yellow"  # Expiring soon (< 1 hour)
-            else:
-                return "green"  # Safe
-        except (ValueError, AttributeError):
-            return "white"
+        seconds_left = (expires_at - (now or datetime.now(timezone.utc))).total_seconds()
+
+        if seconds_left < 0:
+            return "red"  # Expired
+        elif seconds_left < 3600:
+            return "yellow"  # Expiring soon (< 1 hour)
+        else:
+            return "green"  # Safe
 
 
 @dataclass
@@ -156,9 +202,19 @@ class FileSystem:
             raise ValueError(f"Failed to parse FileSystem from API response: {e}")
 
 
+def _response_json(resp: "requests.Response") -> Any:
+    """Decode a JSON response body, with orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
 class LambdaAPIError(Exception):
     """Lambda API error."""
-    pass
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class LambdaAPI:
@@ -167,9 +223,14 @@ class LambdaAPI:
     BASE_URL = "https://cloud.lambda.ai/api/v1"
     RETRY_MAX_ATTEMPTS = 3
     RETRY_BASE_DELAY = 1
-    RETRY_BACKOFF_MULTIPLIER = 2
+    # Worth asking again; anything else (4xx) fails on the first response
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
 
     def __init__(self, api_key: str):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         self.api_key = api_key
         self.session = requests.Session()
         self.session.headers.update({
@@ -177,28 +238,38 @@ class LambdaAPI:
             "Content-Type": "application/json",
         })
 
+        # Retries happen inside the connection pool: immediately, then after
+        # 2s, unless Retry-After asks for longer. urllib3's default
+        # allowed_methods excludes POST, so a launch is only retried when
+        # the connection could not be established.
+        retry = Retry(
+            total=self.RETRY_MAX_ATTEMPTS - 1,
+            backoff_factor=self.RETRY_BASE_DELAY,
+            status_forcelist=self.RETRY_STATUSES,
+            raise_on_status=False,
+        )
+        self.session.mount("https://", HTTPAdapter(max_retries=retry))
+
     def _request_with_retry(
         self, method: str, endpoint: str, **kwargs
-    ) -> requests.Response:
-        """Make API request with exponential backoff retry."""
-        url = f"{self.BASE_URL}/{endpoint}"
+    ) -> "requests.Response":
+        """Make API request, retrying transient failures with backoff."""
+        import requests
 
-        for attempt in range(1, self.RETRY_MAX_ATTEMPTS + 1):
-            try:
-                resp = self.session.request(method, url, **kwargs)
-                resp.raise_for_status()
-                return resp
-            except requests.exceptions.RequestException as e:
-                if attempt == self.RETRY_MAX_ATTEMPTS:
-                    raise LambdaAPIError(f"API request failed after {attempt} attempts: {e}")
+        url = f"{self.BASE_URL}/{endpoint}"
 
-                delay = self.RETRY_BASE_DELAY * (self.RETRY_BACKOFF_MULTIPLIER ** (attempt - 1))
-                time.sleep(delay)
+        try:
+            resp = self.session.request(method, url, **kwargs)
+            resp.raise_for_status()
+            return resp
+        except requests.exceptions.RequestException as e:
+            status_code = e.response.status_code if e.response is not None else None
+            raise LambdaAPIError(f"API request failed: {e}", status_code=status_code)
 
     def list_instances(self) -> List[Instance]:
         """List all instances."""
         resp = self._request_with_retry("GET", "instances")
-        data = resp.json()
+        data = _response_json(resp)
         return [Instance.from_api_response(item) for item in data.get("data", [])]
 
     def launch_instance(
@@ -227,7 +298,7 @@ class LambdaAPI:
             payload["name"] = name
 
         resp = self._request_with_retry("POST", "instance-operations/launch", json=payload)
-        data = resp.json()
+        data = _response_json(resp)
         instance_ids = data.get("data", {}).get("instance_ids", [])
 
         if not instance_ids:
@@ -241,23 +312,25 @@ class LambdaAPI:
         self._request_with_retry("POST", "instance-operations/terminate", json=payload)
 
     def get_instance(self, instance_id: str) -> Optional[Instance]:
-        """Get instance by ID."""
-        instances = self.list_instances()
-        for instance in instances:
-            if instance.id == instance_id:
-                return instance
-        return None
+        """Get instance by ID, or None if it doesn't exist."""
+        try:
+            resp = self._request_with_retry("GET", f"instances/{instance_id}")
+        except LambdaAPIError as e:
+            if e.status_code == 404:
+                return None
+            raise
+        return Instance.from_api_response(_response_json(resp)["data"])
 
     def list_ssh_keys(self) -> List[str]:
         """List SSH key names."""
         resp = self._request_with_retry("GET", "ssh-keys")
-        data = resp.json()
+        data = _response_json(resp)
         return [item["name"] for item in data.get("data", [])]
 
     def list_instance_types(self) -> List[InstanceType]:
         """List available instance types with pricing."""
         resp = self._request_with_retry("GET", "instance-types")
-        data = resp.json().get("data", {})
+        data = _response_json(resp).get("data", {})
         return [
             InstanceType.from_api_response(name, info)
             for name, info in data.items()
@@ -266,7 +339,7 @@ class LambdaAPI:
     def list_file_systems(self) -> List[FileSystem]:
         """List all filesystems."""
         resp = self._request_with_retry("GET", "file-systems")
-        data = resp.json()
+        data = _response_json(resp)
         return [FileSystem.from_api_response(item) for item in data.get("data", [])]
 
     def get_instance_type(self, name: str) -> Optional[InstanceType]:
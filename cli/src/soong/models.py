@@ -1,7 +1,10 @@
 """Model configurations and GPU requirements."""
 
+import bisect
+import functools
+import types
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Mapping
 from enum import Enum
 
 
@@ -15,13 +18,47 @@ class Quantization(Enum):
 
     @property
     def bytes_per_param(self) -> float:
-        return {
-            Quantization.FP32: 4.0,
-            Quantization.FP16: 2.0,
-            Quantization.BF16: 2.0,
-            Quantization.INT8: 1.0,
-            Quantization.INT4: 0.5,
-        }[self]
+        return _BYTES_PER_PARAM[self]
+
+
+_BYTES_PER_PARAM = {
+    Quantization.FP32: 4.0,
+    Quantization.FP16: 2.0,
+    Quantization.BF16: 2.0,
+    Quantization.INT8: 1.0,
+    Quantization.INT4: 0.5,
+}
+
+
+# Common GPU VRAM sizes (GB) and the estimate each can hold with 10% headroom
+_GPU_SIZES = (16, 24, 40, 48, 80, 160)
+_GPU_HEADROOM = tuple(size * 0.9 for size in _GPU_SIZES)
+
+
+def _kv_cache_gb(
+    context_length: int,
+    kv_quantization: Quantization = Quantization.FP16,
+    n_layers: Optional[int] = None,
+    n_kv_heads: Optional[int] = None,
+    head_dim: Optional[int] = None,
+) -> float:
+    """
+    Estimate KV cache size for one full-context sequence.
+
+    With the attention shape known this is exact: K and V for every layer,
+    KV head and head dimension, per token. Otherwise it falls back to ~1GB
+    per 2k tokens of FP16 cache, capped at 4GB.
+    """
+    bytes_per_elem = kv_quantization.bytes_per_param
+    if n_layers and n_kv_heads and head_dim:
+        return 2 * n_layers * n_kv_heads * head_dim * bytes_per_elem * context_length / 1e9
+    return min(4.0, context_length / 2048) * bytes_per_elem / 2.0
+
+
+def _round_up_vram(estimated_gb: float) -> int:
+    """Round an estimate up to the smallest common GPU size that fits it."""
+    idx = bisect.bisect_left(_GPU_HEADROOM, estimated_gb)
+    return _GPU_SIZES[idx] if idx < len(_GPU_SIZES) else 160  # Multi-GPU needed
 
 
 @dataclass
@@ -34,6 +71,10 @@ class ModelConfig:
     default_quantization: Quantization # Default quantization for SGLang
     context_length: int = 8192         # Default context length
     description: str = ""              # Short description
+    n_layers: Optional[int] = None     # Transformer layers (for exact KV cache size)
+    n_kv_heads: Optional[int] = None   # Key/value attention heads
+    head_dim: Optional[int] = None     # Dimension of each attention head
+    kv_quantization: Quantization = Quantization.FP16  # KV cache dtype
 
     @classmethod
     def from_dict(cls, model_id: str, data: dict) -> "ModelConfig":
@@ -44,7 +85,8 @@ class ModelConfig:
             model_id: Model identifier
             data: Dictionary with keys: hf_path, params_billions, quantization,
                   context_length, good_for (optional), not_good_for (optional),
-                  notes (optional)
+                  notes (optional), n_layers/n_kv_heads/head_dim (optional),
+                  kv_quantization (optional)
 
         Returns:
             ModelConfig instance
@@ -68,6 +110,19 @@ class ModelConfig:
                 f"Must be one of: {', '.join(quant_map.keys())}"
             )
 
+        kv_quant_str = str(data.get("kv_quantization") or "fp16").lower()
+        if kv_quant_str not in quant_map:
+            raise ValueError(
+                f"Invalid kv_quantization '{kv_quant_str}'. "
+                f"Must be one of: {', '.join(quant_map.keys())}"
+            )
+
+        # Optional attention shape; coerced like the other numeric fields
+        shape = {
+            name: int(data[name]) if data.get(name) is not None else None
+            for name in ("n_layers", "n_kv_heads", "head_dim")
+        }
+
         return cls(
             name=data.get("name", model_id),  # Use model_id as fallback
             model_id=model_id,
@@ -76,6 +131,8 @@ class ModelConfig:
             default_quantization=quant_map[quant_str],
             context_length=int(data.get("context_length", 8192)),
             description=data.get("notes", ""),  # Use notes as description
+            kv_quantization=quant_map[kv_quant_str],
+            **shape,
         )
 
     @property
@@ -84,32 +141,34 @@ class ModelConfig:
         return self.params_billions * self.default_quantization.bytes_per_param
 
     @property
+    def kv_cache_gb(self) -> float:
+        """Estimate KV cache for one sequence at the full context length."""
+        return _kv_cache_gb(
+            self.context_length, self.kv_quantization,
+            self.n_layers, self.n_kv_heads, self.head_dim,
+        )
+
+    @functools.cached_property
     def estimated_vram_gb(self) -> float:
         """
         Estimate total VRAM with overhead.
 
         Includes:
         - Model weights
-        - KV cache (~2-4GB depending on context)
+        - KV cache (exact when the attention shape is known)
         - CUDA/framework overhead (~2GB)
         - Activation memory (~10% of weights)
         """
         base = self.base_vram_gb
-        kv_cache = min(4.0, self.context_length / 2048)  # ~1GB per 2k context
+        kv_cache = self.kv_cache_gb
         overhead = 2.0  # CUDA, framework
         activations = base * 0.1  # ~10% for activations
         return base + kv_cache + overhead + activations
 
-    @property
+    @functools.cached_property
     def min_vram_gb(self) -> int:
         """Minimum VRAM needed (rounded up to common GPU sizes)."""
-        estimated = self.estimated_vram_gb
-        # Round up to common GPU VRAM sizes
-        gpu_sizes = [16, 24, 40, 48, 80, 160]
-        for size in gpu_sizes:
-            if estimated <= size * 0.9:  # 10% headroom
-                return size
-        return 160  # Multi-GPU needed
+        return _round_up_vram(self.estimated_vram_gb)
 
     def recommended_gpus(self, available_gpus: List[dict]) -> List[str]:
         """
@@ -132,6 +191,10 @@ def estimate_vram(
     params_billions: float,
     quantization: Quantization = Quantization.FP16,
     context_length: int = 8192,
+    kv_quantization: Quantization = Quantization.FP16,
+    n_layers: Optional[int] = None,
+    n_kv_heads: Optional[int] = None,
+    head_dim: Optional[int] = None,
 ) -> dict:
     """
     Estimate VRAM requirements for any model.
@@ -140,27 +203,26 @@ def estimate_vram(
         params_billions: Parameter count in billions
         quantization: Quantization level
         context_length: Context window size
+        kv_quantization: KV cache dtype
+        n_layers: Transformer layers (with n_kv_heads and head_dim, sizes
+                  the KV cache exactly instead of by the context heuristic)
+        n_kv_heads: Key/value attention heads
+        head_dim: Dimension of each attention head
 
     Returns:
         Dict with VRAM estimates and recommended GPU
     """
     base = params_billions * quantization.bytes_per_param
-    kv_cache = min(4.0, context_length / 2048)
+    kv_cache = _kv_cache_gb(context_length, kv_quantization, n_layers, n_kv_heads, head_dim)
     overhead = 2.0
     activations = base * 0.1
     total = base + kv_cache + overhead + activations
-
-    # Find minimum GPU size
-    gpu_sizes = [16, 24, 40, 48, 80, 160]
-    min_gpu = 160
-    for size in gpu_sizes:
-        if total <= size * 0.9:
-            min_gpu = size
-            break
+    min_gpu = _round_up_vram(total)
 
     return {
         "params_billions": params_billions,
         "quantization": quantization.value,
+        "kv_quantization": kv_quantization.value,
         "base_vram_gb": round(base, 1),
         "kv_cache_gb": round(kv_cache, 1),
         "overhead_gb": round(overhead, 1),
@@ -204,6 +266,10 @@ KNOWN_GPUS = {
     "gpu_8x_b200_sxm6": {"vram_gb": 1440, "description": "8x B200 (1440 GB SXM6)"},
 }
 
+# KNOWN_GPUS ordered by VRAM (ties keep declaration order), for bisecting
+_GPUS_BY_VRAM = sorted(KNOWN_GPUS, key=lambda name: KNOWN_GPUS[name]['vram_gb'])
+_GPU_VRAM_STEPS = [KNOWN_GPUS[name]['vram_gb'] for name in _GPUS_BY_VRAM]
+
 
 @dataclass
 class ModelInfo:
@@ -215,8 +281,11 @@ class ModelInfo:
 
 
 # Pre-configured models with their requirements
-KNOWN_MODELS: Dict[str, ModelConfig] = {}
-MODEL_INFO: Dict[str, ModelInfo] = {}
+# Read-only views; only _register_model adds entries, at import time
+_KNOWN_MODELS: Dict[str, ModelConfig] = {}
+_MODEL_INFO: Dict[str, ModelInfo] = {}
+KNOWN_MODELS: Mapping[str, ModelConfig] = types.MappingProxyType(_KNOWN_MODELS)
+MODEL_INFO: Mapping[str, ModelInfo] = types.MappingProxyType(_MODEL_INFO)
 
 
 def _register_model(
@@ -230,6 +299,9 @@ def _register_model(
     good_for: List[str],
     not_good_for: List[str],
     notes: str = "",
+    n_layers: Optional[int] = None,
+    n_kv_heads: Optional[int] = None,
+    head_dim: Optional[int] = None,
 ):
     """Register a model with full info."""
     config = ModelConfig(
@@ -240,9 +312,12 @@ def _register_model(
         default_quantization=quantization,
         context_length=context_length,
         description=description,
+        n_layers=n_layers,
+        n_kv_heads=n_kv_heads,
+        head_dim=head_dim,
     )
-    KNOWN_MODELS[model_id] = config
-    MODEL_INFO[model_id] = ModelInfo(
+    _KNOWN_MODELS[model_id] = config
+    _MODEL_INFO[model_id] = ModelInfo(
         config=config,
         good_for=good_for,
         not_good_for=not_good_for,
@@ -272,6 +347,9 @@ _register_model(
         "Speed-critical applications",
     ],
     notes="Chain-of-thought reasoning. Slower but more accurate.",
+    n_layers=80,
+    n_kv_heads=8,
+    head_dim=128,
 )
 
 _register_model(
@@ -294,6 +372,9 @@ _register_model(
         "Tasks requiring world knowledge",
     ],
     notes="Purpose-built for code. 4x longer context than DeepSeek.",
+    n_layers=64,
+    n_kv_heads=8,
+    head_dim=128,
 )
 
 _register_model(
@@ -314,6 +395,9 @@ _register_model(
         "Tasks where FP16 precision matters",
     ],
     notes="~5% quality loss vs FP16, but runs on cheaper GPUs.",
+    n_layers=64,
+    n_kv_heads=8,
+    head_dim=128,
 )
 
 _register_model(
@@ -336,6 +420,9 @@ _register_model(
         "Very long contexts",
     ],
     notes="Jack of all trades. Good baseline choice.",
+    n_layers=80,
+    n_kv_heads=8,
+    head_dim=128,
 )
 
 _register_model(
@@ -359,6 +446,9 @@ _register_model(
         "Multi-step tasks",
     ],
     notes="Use when speed/cost matters more than quality.",
+    n_layers=32,
+    n_kv_heads=8,
+    head_dim=128,
 )
 
 _register_model(
@@ -380,6 +470,9 @@ _register_model(
         "Non-code tasks",
     ],
     notes="Older but still capable. Consider Qwen for newer alternative.",
+    n_layers=48,
+    n_kv_heads=8,
+    head_dim=128,
 )
 
 _register_model(
@@ -400,6 +493,9 @@ _register_model(
         "Tasks needing large model capacity",
     ],
     notes="Great efficiency but limited capacity.",
+    n_layers=32,
+    n_kv_heads=8,
+    head_dim=128,
 )
 
 
@@ -414,23 +510,26 @@ def get_recommended_gpu(model_id: str) -> Optional[str]:
 
     Returns the cheapest GPU that can run the model.
     """
-    config = get_model_config(model_id)
-    if not config:
-        return None
+    return _RECOMMENDED_GPUS.get(model_id)
 
-    min_vram = config.min_vram_gb
 
-    # Sort GPUs by VRAM (ascending) to get cheapest viable option
-    sorted_gpus = sorted(
-        KNOWN_GPUS.items(),
-        key=lambda x: x[1]['vram_gb']
-    )
+def get_smallest_gpu(min_vram_gb: float) -> Optional[str]:
+    """
+    Get the known GPU with the least VRAM that still has min_vram_gb.
+
+    Returns None if no known GPU is large enough.
+    """
+    idx = bisect.bisect_left(_GPU_VRAM_STEPS, min_vram_gb)
+    if idx == len(_GPUS_BY_VRAM):
+        return None
+    return _GPUS_BY_VRAM[idx]
 
-    for gpu_name, gpu_info in sorted_gpus:
-        if gpu_info['vram_gb'] >= min_vram:
-            return gpu_name
 
-    return None
+# The registry is fixed at import, so each model's recommendation is too
+_RECOMMENDED_GPUS = {
+    model_id: get_smallest_gpu(config.min_vram_gb)
+    for model_id, config in KNOWN_MODELS.items()
+}
 
 
 def get_model_gpu_mapping() -> Dict[str, str]:
@@ -440,10 +539,7 @@ def get_model_gpu_mapping() -> Dict[str, str]:
     Returns:
         Dict mapping model_id to recommended gpu_name
     """
-    return {
-        model_id: get_recommended_gpu(model_id)
-        for model_id in KNOWN_MODELS
-    }
+    return dict(_RECOMMENDED_GPUS)
 
 
 def format_model_info(model: ModelConfig) -> str:
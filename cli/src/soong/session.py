@@ -0,0 +1,30 @@
+"""Shared HTTP session for status daemon and Worker requests."""
+
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def http_session() -> "requests.Session":
+    """Shared HTTP session for status daemon and Worker requests.
+
+    Keeps connections alive across calls and retries transient gateway
+    errors. urllib3's default allowed_methods excludes POST, so POSTs are
+    never retried. Failed connects and read timeouts are not retried either,
+    so an unreachable or hung host fails after one timeout and read timeouts
+    reach the caller as requests.exceptions.Timeout. Once retries run out
+    the last response is returned, and raise_for_status() turns it into the
+    usual HTTPError.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3, connect=0, read=False, backoff_factor=0.3,
+        status_forcelist=(502, 503, 504), raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
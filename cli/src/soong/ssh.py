@@ -1,6 +1,7 @@
 """SSH tunnel management."""
 
 import os
+import re
 import signal
 import socket
 import subprocess
@@ -11,6 +12,34 @@ from rich.console import Console
 
 console = Console()
 
+# Interactive sessions share one SSH connection per host, kept open for a
+# while after the last one exits, so repeat `soong ssh` calls skip the key
+# exchange. Anyone who can open a control socket can run commands over that
+# connection, so the sockets live in a directory only the user can read.
+CONTROL_DIR = Path.home() / ".ssh" / "soong-mux"
+CONTROL_PERSIST = "10m"
+
+
+def ssh_control_options() -> List[str]:
+    """
+    SSH options for connection sharing, creating the socket directory if needed.
+
+    Returns:
+        ssh argv options enabling ControlMaster multiplexing, or an empty
+        list if the socket directory can't be created
+    """
+    try:
+        CONTROL_DIR.parent.mkdir(mode=0o700, exist_ok=True)
+        CONTROL_DIR.mkdir(mode=0o700, exist_ok=True)
+    except OSError:
+        return []
+    return [
+        "-o", "ControlMaster=auto",
+        # %C is a hash of user, host and port, keeping socket paths short
+        "-o", f"ControlPath={CONTROL_DIR}/%C",
+        "-o", f"ControlPersist={CONTROL_PERSIST}",
+    ]
+
 
 def is_port_available(port: int) -> bool:
     """
@@ -249,7 +278,7 @@ class SSHTunnelManager:
             )
 
             # Find and store tunnel PID with port info
-            pid = self._find_tunnel_pid(instance_ip)
+            pid = self._find_tunnel_pid(instance_ip, forwarding_args[1::2])
             if pid:
                 self.tunnel_pid_file.parent.mkdir(parents=True, exist_ok=True)
                 # Store PID and ports as JSON for later retrieval
@@ -372,19 +401,29 @@ class SSHTunnelManager:
         except (json.JSONDecodeError, KeyError, ProcessLookupError, ValueError):
             return None
 
-    def _find_tunnel_pid(self, instance_ip: str) -> Optional[int]:
+    def _find_tunnel_pid(
+        self, instance_ip: str, forwards: Optional[List[str]] = None
+    ) -> Optional[int]:
         """
-        Find PID of SSH tunnel process by matching IP.
+        Find PID of SSH tunnel process by matching its command line.
+
+        Only an `ssh -N` process carrying the given -L forwards and ending at
+        the instance matches, so ControlMaster connections left behind by
+        health checks or `soong ssh` to the same host are never picked up.
 
         Args:
             instance_ip: Remote instance IP to match
+            forwards: -L forward specs the tunnel was started with
 
         Returns:
             PID of tunnel process or None
         """
+        pattern = "^ssh -N "
+        pattern += "".join(f".*-L {re.escape(forward)} " for forward in forwards or [])
+        pattern += f".*@{re.escape(instance_ip)}$"
         try:
             result = subprocess.run(
-                ["pgrep", "-f", f"ssh.*{instance_ip}"],
+                ["pgrep", "-f", pattern],
                 capture_output=True,
                 text=True,
                 timeout=5,
@@ -399,6 +438,7 @@ class SSHTunnelManager:
         self,
         instance_ip: str,
         username: str = "ubuntu",
+        replace_process: bool = False,
     ) -> bool:
         """
         Open interactive SSH session to instance.
@@ -406,6 +446,8 @@ class SSHTunnelManager:
         Args:
             instance_ip: Remote instance IP
             username: SSH username (default: ubuntu)
+            replace_process: Exec ssh in place of this process instead of
+                waiting on a child. Only returns if the exec itself fails.
 
         Returns:
             True if SSH session completed successfully
@@ -414,12 +456,17 @@ class SSHTunnelManager:
             "ssh",
             "-o", "StrictHostKeyChecking=no",
             "-o", "UserKnownHostsFile=/dev/null",
+            *ssh_control_options(),
             "-i", str(self.ssh_key_path),
             f"{username}@{instance_ip}",
         ]
 
         try:
             console.print(f"[cyan]Connecting to {instance_ip}...[/cyan]")
+            if replace_process:
+                console.file.flush()
+                os.execvp(ssh_command[0], ssh_command)
+
             result = subprocess.run(ssh_command)
 
             if result.returncode != 0:
@@ -25,6 +25,23 @@ from soong.models import ModelConfig, Quantization
 from soong.config import Config, LambdaConfig, StatusDaemonConfig, DefaultsConfig, SSHConfig
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk API cache out of the real home directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr("soong.cache.CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def fresh_api_clients():
+    """Don't let one test's (possibly patched) API client leak into the next."""
+    from soong.cli import _api_for
+    _api_for.cache_clear()
+    yield
+    _api_for.cache_clear()
+
+
 @pytest.fixture
 def sample_model_config():
     """Standard 70B INT4 model for testing."""
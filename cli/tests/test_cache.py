@@ -0,0 +1,78 @@
+"""Tests for cache.py on-disk TTL cache."""
+
+import time_machine
+from datetime import timedelta
+from soong.cache import read_cache, write_cache, clear_cache
+
+
+def test_read_cache_missing_returns_none():
+    """Test read_cache returns None when nothing has been cached."""
+    assert read_cache("instances", "key-1", ttl=15) is None
+
+
+def test_write_cache_then_read_returns_data():
+    """Test cached data round-trips while fresh."""
+    data = [{"id": "i-123", "status": "active"}]
+
+    write_cache("instances", "key-1", data)
+
+    assert read_cache("instances", "key-1", ttl=15) == data
+
+
+def test_read_cache_expired_returns_none():
+    """Test read_cache ignores entries older than the TTL."""
+    with time_machine.travel("2024-01-01 00:00:00", tick=False) as traveller:
+        write_cache("instances", "key-1", ["cached"])
+        traveller.shift(timedelta(seconds=16))
+
+        assert read_cache("instances", "key-1", ttl=15) is None
+
+
+def test_read_cache_other_api_key_returns_none():
+    """Test entries written for one API key are not served to another."""
+    write_cache("instances", "key-1", ["cached"])
+
+    assert read_cache("instances", "key-2", ttl=15) is None
+
+
+def test_write_cache_does_not_store_api_key(isolated_cache_dir):
+    """Test the raw API key never reaches disk."""
+    write_cache("instances", "secret_api_key_123", ["cached"])
+
+    contents = (isolated_cache_dir / "instances.json").read_text()
+    assert "secret_api_key_123" not in contents
+
+
+def test_read_cache_corrupt_file_returns_none(isolated_cache_dir):
+    """Test a corrupt cache file is treated as a miss."""
+    isolated_cache_dir.mkdir(parents=True)
+    (isolated_cache_dir / "instances.json").write_text("{not json")
+
+    assert read_cache("instances", "key-1", ttl=15) is None
+
+
+def test_write_cache_unserializable_data_is_ignored():
+    """Test write_cache does not raise on data json can't encode."""
+    write_cache("instances", "key-1", [object()])
+
+    assert read_cache("instances", "key-1", ttl=15) is None
+
+
+def test_clear_cache_removes_entry():
+    """Test clear_cache drops the cached value and tolerates a missing file."""
+    write_cache("instances", "key-1", ["cached"])
+
+    clear_cache("instances")
+    clear_cache("instances")
+
+    assert read_cache("instances", "key-1", ttl=15) is None
+
+
+def test_cache_round_trips_without_orjson(monkeypatch):
+    """Test the stdlib json fallback when orjson isn't installed."""
+    monkeypatch.setattr("soong.cache.orjson", None)
+    data = {"instances": [{"id": "i-123", "ip": None}]}
+
+    write_cache("instances", "key-1", data)
+
+    assert read_cache("instances", "key-1", ttl=15) == data
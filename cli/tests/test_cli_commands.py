@@ -76,7 +76,7 @@ class TestExtendCommand:
         mock_lambda_api.return_value = mock_api_instance
 
         mocker.patch("soong.cli.InstanceManager")
-        mock_questionary = mocker.patch("soong.cli.questionary.confirm")
+        mock_questionary = mocker.patch("questionary.confirm")
         mock_questionary.return_value.ask.return_value = True
 
         # Mock HTTP with responses library (Pattern #5 fix)
@@ -131,7 +131,7 @@ class TestExtendCommand:
         mock_mgr_instance.get_active_instance.return_value = mock_instance
         mock_instance_mgr.return_value = mock_mgr_instance
 
-        mock_questionary = mocker.patch("soong.cli.questionary.confirm")
+        mock_questionary = mocker.patch("questionary.confirm")
         mock_questionary.return_value.ask.return_value = True
 
         # Mock HTTP with responses library (Pattern #5 fix)
@@ -174,7 +174,7 @@ class TestExtendCommand:
         mock_lambda_api.return_value = mock_api_instance
 
         mocker.patch("soong.cli.InstanceManager")
-        mock_questionary = mocker.patch("soong.cli.questionary.confirm")
+        mock_questionary = mocker.patch("questionary.confirm")
         mock_questionary.return_value.ask.return_value = True
 
         # Mock HTTP with responses library
@@ -218,7 +218,7 @@ class TestExtendCommand:
         mock_lambda_api.return_value = mock_api_instance
 
         mocker.patch("soong.cli.InstanceManager")
-        mock_questionary = mocker.patch("soong.cli.questionary.confirm")
+        mock_questionary = mocker.patch("questionary.confirm")
 
         # Mock HTTP with responses library
         expected_url = f"http://{mock_instance.ip}:{sample_config.status_daemon.port}/extend"
@@ -259,7 +259,7 @@ class TestExtendCommand:
         mock_lambda_api.return_value = mock_api_instance
 
         mocker.patch("soong.cli.InstanceManager")
-        mock_questionary = mocker.patch("soong.cli.questionary.confirm")
+        mock_questionary = mocker.patch("questionary.confirm")
         mock_questionary.return_value.ask.return_value = False
 
         # Run command
@@ -435,6 +435,64 @@ class TestExtendCommand:
         assert result.exit_code == 1
         assert "Error" in result.stdout or "error" in result.stdout.lower()
 
+    def test_extend_http_session_is_shared_and_retries(self):
+        """Test the status daemon session is reused and retries gateway errors."""
+        from soong.cli import _http_session
+
+        session = _http_session()
+        assert _http_session() is session
+
+        retry = session.get_adapter("http://1.2.3.4:8080/extend").max_retries
+        assert retry.total == 3
+        assert 503 in retry.status_forcelist
+        # POST /extend is not idempotent: no retries on HTTP status
+        assert "POST" not in retry.allowed_methods
+        # Unreachable hosts fail fast; exhausted retries surface as HTTPError
+        assert retry.connect == 0
+        assert retry.raise_on_status is False
+
+    def test_http_session_read_timeout_is_not_retried(self):
+        """Test a host that never replies times out once, as requests Timeout."""
+        import socket
+        import threading
+        import requests as req_lib
+        from soong.cli import _http_session
+
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(8)
+        accepted = []
+
+        def accept():
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except OSError:
+                    return
+                accepted.append(conn)
+
+        threading.Thread(target=accept, daemon=True).start()
+        url = f"http://127.0.0.1:{server.getsockname()[1]}/status"
+        try:
+            with pytest.raises(req_lib.exceptions.Timeout):
+                _http_session().get(url, timeout=(1, 0.2))
+        finally:
+            server.close()
+            for conn in accepted:
+                conn.close()
+
+        assert len(accepted) == 1
+
+    def test_fetch_metrics_handles_exhausted_gateway_retries(self, mock_http, mocker):
+        """Test a status daemon stuck on 503 yields no metrics instead of RetryError."""
+        from soong.cli import fetch_status_daemon_metrics
+
+        mocker.patch("urllib3.util.retry.Retry.sleep")
+        mock_http.add(responses.GET, "http://1.2.3.4:8080/status", status=503)
+
+        assert fetch_status_daemon_metrics("1.2.3.4", "token") is None
+        assert len(mock_http.calls) == 4  # first try + 3 retries
+
 
 class TestStopCommand:
     """Test stop command functionality."""
@@ -673,7 +731,7 @@ class TestSSHCommand:
         mock_api_instance.get_instance.assert_called_once_with("inst_abc123xyz")
 
         # Verify connect_ssh was called with the instance's IP (Pattern #4 fix)
-        mock_ssh_instance.connect_ssh.assert_called_once_with(mock_instance.ip)
+        mock_ssh_instance.connect_ssh.assert_called_once_with(mock_instance.ip, replace_process=True)
         # Verify the IP matches what we expect
         assert mock_instance.ip == "192.168.1.100"
 
@@ -698,7 +756,7 @@ class TestSSHCommand:
         # Assertions
         assert result.exit_code == 0
         mock_mgr_instance.get_active_instance.assert_called_once()
-        mock_ssh_instance.connect_ssh.assert_called_once_with(mock_instance.ip)
+        mock_ssh_instance.connect_ssh.assert_called_once_with(mock_instance.ip, replace_process=True)
 
     def test_ssh_no_instance_found_with_id(self, sample_config, mocker):
         """Test SSH when instance ID not found."""
@@ -780,12 +838,74 @@ class TestSSHCommand:
         assert result.exit_code == 0
         mock_ssh_mgr.assert_called_once()
         assert mock_ssh_mgr.call_args[0][0] == sample_config.ssh.key_path
-        mock_ssh_instance.connect_ssh.assert_called_once_with(mock_instance.ip)
+        mock_ssh_instance.connect_ssh.assert_called_once_with(mock_instance.ip, replace_process=True)
 
 
 class TestAvailableCommand:
     """Test available command functionality."""
 
+    def test_available_format_json(self, sample_config, mocker):
+        """Test that available --format json emits instance types as JSON."""
+        import json
+
+        mocker.patch("soong.cli.get_config", return_value=sample_config)
+        mock_lambda_api = mocker.patch("soong.cli.LambdaAPI")
+        mock_lambda_api.return_value.list_instance_types.return_value = [
+            InstanceType(
+                name="gpu_1x_a10",
+                description="1x A10 (24 GB)",
+                price_cents_per_hour=75,
+                vcpus=30,
+                memory_gib=200,
+                storage_gib=1400,
+                regions_available=["us-west-1"],
+            ),
+        ]
+
+        result = runner.invoke(app, ["available", "--format", "json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data == [{
+            "name": "gpu_1x_a10",
+            "description": "1x A10 (24 GB)",
+            "price_cents_per_hour": 75,
+            "vcpus": 30,
+            "memory_gib": 200,
+            "storage_gib": 1400,
+            "regions_available": ["us-west-1"],
+        }]
+
+    def test_available_reuses_cached_types_until_refresh(self, sample_config, mocker):
+        """Test available serves a cached GPU type list and --refresh refetches it."""
+        mocker.patch("soong.cli.get_config", return_value=sample_config)
+        mock_api = mocker.patch("soong.cli.LambdaAPI").return_value
+        mock_api.api_key = sample_config.lambda_config.api_key
+        mock_api.list_instance_types.return_value = [
+            InstanceType(
+                name="gpu_1x_a10",
+                description="1x A10 (24 GB)",
+                price_cents_per_hour=75,
+                vcpus=30,
+                memory_gib=200,
+                storage_gib=1400,
+                regions_available=["us-west-1"],
+            ),
+        ]
+
+        first = runner.invoke(app, ["available"])
+        second = runner.invoke(app, ["available"])
+
+        assert first.exit_code == 0 and second.exit_code == 0
+        assert "gpu_1x_a10" in second.stdout
+        assert "us-west-1" in second.stdout
+        mock_api.list_instance_types.assert_called_once()
+
+        result = runner.invoke(app, ["available", "--refresh"])
+
+        assert result.exit_code == 0
+        assert mock_api.list_instance_types.call_count == 2
+
     def test_available_displays_gpu_types(self, sample_config, mocker):
         """Test that available command displays GPU types."""
         # Setup mocks
@@ -903,8 +1023,9 @@ class TestAvailableCommand:
         # Assertions
         assert result.exit_code == 0
         assert "Recommended Models" in result.stdout
-        assert "deepseek-r1-70b" in result.stdout
-        assert "qwen2.5-coder-32b" in result.stdout
+        # Hints follow the VRAM estimate rather than hardcoded GPU names
+        assert "deepseek-r1-70b: 1x A6000 (48 GB) or larger" in result.stdout
+        assert "qwen2.5-coder-32b: 2x H100 (160 GB SXM5) or larger" in result.stdout
 
     def test_available_api_error(self, sample_config, mocker):
         """Test handling of API error when listing instance types."""
@@ -999,3 +1120,33 @@ class TestAvailableCommand:
         # Should show only regions with available=True
         assert "us-west-1" in result.stdout
         assert "eu-central-1" in result.stdout
+
+
+def test_services_builds_each_member_once(mocker, sample_config):
+    """Test Services loads config and builds the API client only once."""
+    from soong.cli import Services
+
+    mock_get_config = mocker.patch("soong.cli.get_config", return_value=sample_config)
+    mock_lambda_api = mocker.patch("soong.cli.LambdaAPI")
+
+    services = Services()
+    assert services.instance_mgr is services.instance_mgr
+    assert services.api is services.api
+    assert services.config is sample_config
+
+    mock_get_config.assert_called_once_with()
+    mock_lambda_api.assert_called_once_with(sample_config.lambda_config.api_key)
+
+
+def test_get_api_reuses_client_per_key(mocker, sample_config):
+    """Test get_api shares one client per API key within a process."""
+    from soong.cli import get_api
+
+    mock_lambda_api = mocker.patch("soong.cli.LambdaAPI", side_effect=lambda key: Mock(api_key=key))
+
+    first = get_api(sample_config)
+    assert get_api(sample_config) is first
+
+    sample_config.lambda_config.api_key = "other_key"
+    assert get_api(sample_config) is not first
+    assert mock_lambda_api.call_count == 2
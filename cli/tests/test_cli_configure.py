@@ -1734,3 +1734,15 @@ class TestConfigureCloudflare:
 
         assert config.cloudflare.api_token == ""
         assert config.cloudflare.account_id == ""
+
+
+def test_get_config_manager_creates_single_instance_lazily(monkeypatch):
+    """Test the CLI's ConfigManager is only built on first use, then reused."""
+    import soong.cli as cli
+
+    monkeypatch.setattr(cli, "config_manager", None)
+
+    manager = cli.get_config_manager()
+
+    assert isinstance(manager, ConfigManager)
+    assert cli.get_config_manager() is manager
@@ -214,3 +214,45 @@ def test_start_command_format_matches_requirement(mocker, sample_config):
 
     # 5. Prompt asking to proceed
     # (This is handled by questionary.confirm, which we've mocked)
+
+
+def test_get_ssh_key_names_uses_cache_on_second_call():
+    """Test SSH key names are served from the on-disk cache once fetched."""
+    from soong.cli import get_ssh_key_names
+
+    mock_api = Mock(api_key="test_key_12345")
+    mock_api.list_ssh_keys.return_value = ["my-key"]
+
+    assert get_ssh_key_names(mock_api) == ["my-key"]
+    assert get_ssh_key_names(mock_api) == ["my-key"]
+
+    mock_api.list_ssh_keys.assert_called_once()
+
+
+def test_get_ssh_key_names_refetches_empty_cached_list():
+    """Test an empty cached key list is treated as a miss."""
+    from soong.cli import get_ssh_key_names
+
+    mock_api = Mock(api_key="test_key_12345")
+    mock_api.list_ssh_keys.side_effect = [[], ["new-key"]]
+
+    assert get_ssh_key_names(mock_api) == []
+    assert get_ssh_key_names(mock_api) == ["new-key"]
+
+
+def test_configure_refresh_keys_bypasses_cache(mocker, sample_config):
+    """Test 'configure --refresh-keys' refetches keys without running the wizard."""
+    from typer.testing import CliRunner
+    from soong.cli import app, get_ssh_key_names
+
+    mocker.patch("soong.cli.get_config", return_value=sample_config)
+    mock_api = mocker.patch("soong.cli.LambdaAPI").return_value
+    mock_api.api_key = sample_config.lambda_config.api_key
+    mock_api.list_ssh_keys.side_effect = [["old-key"], ["new-key"]]
+    get_ssh_key_names(mock_api)
+
+    result = CliRunner().invoke(app, ["configure", "--refresh-keys"])
+
+    assert result.exit_code == 0
+    assert "new-key" in result.stdout
+    assert get_ssh_key_names(mock_api) == ["new-key"]
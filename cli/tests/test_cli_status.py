@@ -156,6 +156,59 @@ def test_show_termination_history_lease_reason_orange(mocker):
     assert "Lease expired" in result or "lease" in result.lower()
 
 
+@pytest.mark.parametrize("seconds,text,style", [
+    (-1, "EXPIRED", "red"),
+    (0, "0m", "yellow"),
+    (59 * 60 + 59, "59m", "yellow"),
+    (3600, "1h 0m", "green"),
+    (2 * 3600 + 15 * 60 + 30, "2h 15m", "green"),
+])
+def test_format_time_left(seconds, text, style):
+    """Test format_time_left picks text and style by remaining time."""
+    from soong.cli import format_time_left
+
+    cell = format_time_left(seconds)
+    assert cell.plain == text
+    assert cell.style == style
+
+
+@pytest.mark.parametrize("reason,expected", [
+    ("Killed by watchdog", "red"),
+    ("Idle timeout exceeded", "yellow"),
+    ("Request TIMEOUT", "yellow"),
+    ("Lease expired", "orange1"),
+    ("User terminated", "white"),
+])
+def test_reason_style_matches_keywords(reason, expected):
+    """Test reason_style picks the style of the first matching keyword."""
+    from soong.cli import reason_style
+
+    assert reason_style(reason) == expected
+
+
+def test_show_termination_history_keeps_brackets_in_reason(mocker):
+    """Test show_termination_history prints reasons verbatim, not as markup."""
+    output = StringIO()
+    test_console = Console(file=output, width=200)
+    mocker.patch("soong.cli.console", test_console)
+
+    events = [
+        HistoryEvent(
+            timestamp="2026-01-01T10:00:00Z",
+            instance_id="test-instance-1",
+            event_type="termination",
+            reason="[bold]oom[/bold]",
+            uptime_minutes=60,
+            gpu_type="gpu_1x_a10",
+            region="us-west-1",
+        )
+    ]
+
+    show_termination_history(events, hours=24)
+
+    assert "[bold]oom[/bold]" in output.getvalue()
+
+
 def test_show_termination_history_formats_uptime_hours_and_minutes(mocker):
     """Test show_termination_history formats uptime with hours and minutes.
 
@@ -410,9 +463,9 @@ def test_status_displays_running_instances(mocker, sample_config):
         )
     ]
 
-    # Mock datetime.utcnow - need to mock the class to return our datetime
+    # Mock datetime.now - need to mock the class to return our datetime
     mock_datetime = mocker.patch("soong.cli.datetime")
-    mock_datetime.utcnow.return_value = now
+    mock_datetime.now.return_value = now
     mock_datetime.fromisoformat = datetime.fromisoformat
 
     result = runner.invoke(app, ["status"], catch_exceptions=False)
@@ -454,6 +507,55 @@ def test_status_no_instances_found(mocker, sample_config):
     assert "No instances found" in result.stdout
 
 
+def test_status_format_json_outputs_running_instances(mocker, sample_config):
+    """Test 'status --format json' emits running instances as plain JSON."""
+    import json
+
+    mock_manager = mocker.patch("soong.cli.config_manager")
+    mock_manager.load.return_value = sample_config
+
+    mock_api = mocker.patch("soong.cli.LambdaAPI").return_value
+    mock_api.list_instances.return_value = [
+        Instance(
+            id="running-instance-1",
+            name="runner",
+            ip="1.2.3.4",
+            status="active",
+            instance_type="gpu_1x_a10",
+            region="us-west-1",
+            created_at="2024-01-01T00:00:00Z",
+        ),
+        Instance(
+            id="stopped-instance-1",
+            name="stopped",
+            ip=None,
+            status="terminated",
+            instance_type="gpu_1x_a10",
+            region="us-west-1",
+        ),
+    ]
+
+    result = runner.invoke(app, ["status", "--format", "json"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout)
+    assert [i["id"] for i in data] == ["running-instance-1"]
+    assert data[0]["ip"] == "1.2.3.4"
+    assert "GPU Instances" not in result.stdout
+    mock_api.list_instance_types.assert_not_called()
+
+
+def test_status_rejects_unknown_format(mocker, sample_config):
+    """Test 'status --format' only accepts table or json."""
+    mock_manager = mocker.patch("soong.cli.config_manager")
+    mock_manager.load.return_value = sample_config
+
+    result = runner.invoke(app, ["status", "--format", "xml"])
+
+    assert result.exit_code == 1
+    assert "--format must be one of" in result.stdout
+
+
 def test_status_specific_instance_id(mocker, sample_config):
     """Test 'gpu-session status --instance-id' shows specific instance."""
     mock_manager = mocker.patch("soong.cli.config_manager")
@@ -478,7 +580,7 @@ def test_status_specific_instance_id(mocker, sample_config):
     mock_api.list_instance_types.return_value = []
 
     mock_datetime = mocker.patch("soong.cli.datetime")
-    mock_datetime.utcnow.return_value = now
+    mock_datetime.now.return_value = now
     mock_datetime.fromisoformat = datetime.fromisoformat
 
     result = runner.invoke(
@@ -517,8 +619,8 @@ def test_status_with_history_flag(mocker, sample_config):
     mock_api_class = mocker.patch("soong.cli.LambdaAPI")
     mock_api = mock_api_class.return_value
 
-    # Mock requests.get to simulate Worker response
-    mock_requests = mocker.patch("soong.cli.requests")
+    # Mock the shared HTTP session to simulate Worker response
+    mock_get = mocker.patch("soong.cli._http_session").return_value.get
     mock_response = mocker.Mock()
     mock_response.json.return_value = {
         "events": [
@@ -533,7 +635,7 @@ def test_status_with_history_flag(mocker, sample_config):
             }
         ]
     }
-    mock_requests.get.return_value = mock_response
+    mock_get.return_value = mock_response
 
     result = runner.invoke(app, ["status", "--history"], catch_exceptions=False)
 
@@ -542,13 +644,63 @@ def test_status_with_history_flag(mocker, sample_config):
     assert "test-instanc" in result.stdout  # Truncated to 12 chars
     assert "terminate" in result.stdout
     assert "$1.50" in result.stdout
-    mock_requests.get.assert_called_once_with(
+    mock_get.assert_called_once_with(
         "https://worker.example.com/events",
         params={"hours": 24},
         timeout=(5, 15),
     )
 
 
+def test_status_history_reports_worker_gateway_errors(mocker, sample_config, mock_http):
+    """Test 'status --history' exits cleanly when the Worker keeps returning 503."""
+    sample_config.cloudflare.worker_url = "https://worker.example.com"
+
+    mock_manager = mocker.patch("soong.cli.config_manager")
+    mock_manager.load.return_value = sample_config
+    mocker.patch("soong.cli.LambdaAPI")
+    mocker.patch("urllib3.util.retry.Retry.sleep")
+    mock_http.add(responses.GET, "https://worker.example.com/events", status=503)
+
+    result = runner.invoke(app, ["status", "--history"], catch_exceptions=False)
+
+    assert result.exit_code == 1
+    assert "Worker HTTP error 503" in result.stdout
+
+
+def test_status_history_limit_truncates_rows(mocker, sample_config):
+    """Test 'status --history --limit' caps rows and says how many were left out."""
+    sample_config.cloudflare.worker_url = "https://worker.example.com"
+
+    mock_manager = mocker.patch("soong.cli.config_manager")
+    mock_manager.load.return_value = sample_config
+    mocker.patch("soong.cli.LambdaAPI")
+
+    mock_get = mocker.patch("soong.cli._http_session").return_value.get
+    mock_get.return_value.json.return_value = {
+        "events": [
+            {
+                "timestamp": f"2026-01-01T1{n}:00:00Z",
+                "instance_id": f"instance-{n}",
+                "event_type": "terminate",
+                "gpu_type": "gpu_1x_a10",
+                "duration_minutes": 60,
+                "cost_dollars": 0.75,
+            }
+            for n in range(3)
+        ]
+    }
+
+    result = runner.invoke(app, ["status", "--history", "--limit", "2"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert "instance-0" in result.stdout
+    assert "instance-1" in result.stdout
+    assert "instance-2" not in result.stdout
+    assert "1 more not shown" in result.stdout
+    # The summary still covers every event
+    assert "3 sessions" in result.stdout
+
+
 def test_status_with_history_flag_no_worker(mocker, sample_config):
     """Test 'gpu-session status --history' fails gracefully when Worker not deployed."""
     # Ensure Worker URL is not configured
@@ -567,6 +719,47 @@ def test_status_with_history_flag_no_worker(mocker, sample_config):
     assert "soong worker deploy" in result.stdout
 
 
+def test_status_reuses_cached_pricing(mocker, sample_config):
+    """Test 'status' reads pricing from the cache and --refresh refetches it."""
+    mock_manager = mocker.patch("soong.cli.config_manager")
+    mock_manager.load.return_value = sample_config
+
+    mock_api = mocker.patch("soong.cli.LambdaAPI").return_value
+    mock_api.api_key = sample_config.lambda_config.api_key
+    mock_api.list_instances.return_value = [
+        Instance(
+            id="active-instance-1",
+            name="runner",
+            ip="1.2.3.4",
+            status="active",
+            instance_type="gpu_1x_a10",
+            region="us-west-1",
+            created_at="2024-01-01T00:00:00Z",
+        )
+    ]
+    mock_api.list_instance_types.return_value = [
+        InstanceType(
+            name="gpu_1x_a10",
+            description="1x A10 (24 GB)",
+            price_cents_per_hour=75,
+            vcpus=30,
+            memory_gib=200,
+            storage_gib=1400,
+            regions_available=["us-west-1"],
+        )
+    ]
+
+    runner.invoke(app, ["status"], catch_exceptions=False)
+    result = runner.invoke(app, ["status"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert "$" in result.stdout  # cost columns still priced from the cache
+    mock_api.list_instance_types.assert_called_once()
+
+    runner.invoke(app, ["status", "--refresh"], catch_exceptions=False)
+    assert mock_api.list_instance_types.call_count == 2
+
+
 def test_status_with_stopped_flag(mocker, sample_config):
     """Test 'gpu-session status --stopped' shows stopped instances."""
     mock_manager = mocker.patch("soong.cli.config_manager")
@@ -592,6 +785,8 @@ def test_status_with_stopped_flag(mocker, sample_config):
     assert result.exit_code == 0
     assert "Stopped Instances" in result.stdout
     assert "stopped-" in result.stdout or "stopped" in result.stdout.lower()
+    # Pricing is only fetched for the running-instances table
+    mock_api.list_instance_types.assert_not_called()
 
 
 def test_status_calculates_uptime_correctly(mocker, sample_config):
@@ -622,7 +817,7 @@ def test_status_calculates_uptime_correctly(mocker, sample_config):
     mock_api.list_instance_types.return_value = []
 
     mock_datetime = mocker.patch("soong.cli.datetime")
-    mock_datetime.utcnow.return_value = now
+    mock_datetime.now.return_value = now
     mock_datetime.fromisoformat = datetime.fromisoformat
 
     result = runner.invoke(app, ["status"])
@@ -661,7 +856,7 @@ def test_status_shows_expired_time_left_in_red(mocker, sample_config):
     mock_api.list_instance_types.return_value = []
 
     mock_datetime = mocker.patch("soong.cli.datetime")
-    mock_datetime.utcnow.return_value = now
+    mock_datetime.now.return_value = now
     mock_datetime.fromisoformat = datetime.fromisoformat
 
     result = runner.invoke(app, ["status"])
@@ -700,7 +895,7 @@ def test_status_shows_expiring_soon_in_yellow(mocker, sample_config):
     mock_api.list_instance_types.return_value = []
 
     mock_datetime = mocker.patch("soong.cli.datetime")
-    mock_datetime.utcnow.return_value = now
+    mock_datetime.now.return_value = now
     mock_datetime.fromisoformat = datetime.fromisoformat
 
     result = runner.invoke(app, ["status"])
@@ -739,7 +934,7 @@ def test_status_shows_safe_time_left_in_green(mocker, sample_config):
     mock_api.list_instance_types.return_value = []
 
     mock_datetime = mocker.patch("soong.cli.datetime")
-    mock_datetime.utcnow.return_value = now
+    mock_datetime.now.return_value = now
     mock_datetime.fromisoformat = datetime.fromisoformat
 
     result = runner.invoke(app, ["status"])
@@ -795,7 +990,7 @@ def test_status_calculates_current_cost(mocker, sample_config):
     ]
 
     mock_datetime = mocker.patch("soong.cli.datetime")
-    mock_datetime.utcnow.return_value = now
+    mock_datetime.now.return_value = now
     mock_datetime.fromisoformat = datetime.fromisoformat
 
     result = runner.invoke(app, ["status"])
@@ -856,7 +1051,7 @@ def test_status_calculates_total_cost(mocker, sample_config):
     ]
 
     mock_datetime = mocker.patch("soong.cli.datetime")
-    mock_datetime.utcnow.return_value = now
+    mock_datetime.now.return_value = now
     mock_datetime.fromisoformat = datetime.fromisoformat
 
     result = runner.invoke(app, ["status"])
@@ -934,7 +1129,7 @@ def test_status_multiple_instances_total_cost(mocker, sample_config):
     ]
 
     mock_datetime = mocker.patch("soong.cli.datetime")
-    mock_datetime.utcnow.return_value = now
+    mock_datetime.now.return_value = now
     mock_datetime.fromisoformat = datetime.fromisoformat
 
     result = runner.invoke(app, ["status"])
@@ -1029,7 +1224,7 @@ def test_status_filters_to_running_only(mocker, sample_config):
     mock_api.list_instance_types.return_value = []
 
     mock_datetime = mocker.patch("soong.cli.datetime")
-    mock_datetime.utcnow.return_value = now
+    mock_datetime.now.return_value = now
     mock_datetime.fromisoformat = datetime.fromisoformat
 
     result = runner.invoke(app, ["status"])
@@ -1083,7 +1278,7 @@ def test_status_handles_missing_pricing(mocker, sample_config):
     mock_api.list_instance_types.return_value = []
 
     mock_datetime = mocker.patch("soong.cli.datetime")
-    mock_datetime.utcnow.return_value = now
+    mock_datetime.now.return_value = now
     mock_datetime.fromisoformat = datetime.fromisoformat
 
     result = runner.invoke(app, ["status"])
@@ -1161,7 +1356,7 @@ def test_status_expired_cost_highlighted_in_red(mocker, sample_config):
     ]
 
     mock_datetime = mocker.patch("soong.cli.datetime")
-    mock_datetime.utcnow.return_value = now
+    mock_datetime.now.return_value = now
     mock_datetime.fromisoformat = datetime.fromisoformat
 
     result = runner.invoke(app, ["status"])
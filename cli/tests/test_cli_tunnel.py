@@ -574,6 +574,20 @@ def test_tunnel_status_calls_is_tunnel_running(mocker, sample_config):
     mock_ssh_mgr.return_value.is_tunnel_running.assert_called_once_with()
 
 
+def test_tunnel_status_does_not_create_api_client(mocker, sample_config):
+    """Test 'tunnel status' loads config once and never builds a Lambda client."""
+    mock_manager = mocker.patch("soong.cli.config_manager")
+    mock_manager.load.return_value = sample_config
+    mock_api = mocker.patch("soong.cli.LambdaAPI")
+    mocker.patch("soong.cli.SSHTunnelManager").return_value.is_tunnel_running.return_value = False
+
+    result = runner.invoke(app, ["tunnel", "status"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    mock_manager.load.assert_called_once()
+    mock_api.assert_not_called()
+
+
 # Port validation edge case tests (Pattern #8 - Branch Coverage)
 
 
@@ -41,7 +41,7 @@ def test_gpu_oversized_warning_shown(mocker):
         console=test_console,
         selected_vram=selected_vram,
         min_vram_needed=min_vram_needed,
-        viable_gpus=viable_gpus,
+        cheapest_viable=viable_gpus[0],
         selected_gpu=default_gpu,
     )
 
@@ -84,7 +84,7 @@ def test_no_warning_when_gpu_appropriately_sized(mocker):
         console=test_console,
         selected_vram=selected_vram,
         min_vram_needed=min_vram_needed,
-        viable_gpus=viable_gpus,
+        cheapest_viable=viable_gpus[0],
         selected_gpu=selected_gpu,
     )
 
@@ -305,3 +305,70 @@ def test_config_load_validates_custom_models(tmp_path, caplog):
 
     # Verify valid model is preserved
     assert "valid-model" in config.custom_models
+
+
+def test_config_load_reuses_parse_until_file_changes(tmp_path, mocker):
+    """Test ConfigManager.load() only re-parses YAML when the file changes."""
+    from soong.config import ConfigManager
+    import os
+    import yaml
+
+    config_file = tmp_path / "config.yaml"
+    with open(config_file, "w") as f:
+        yaml.dump({"lambda": {"api_key": "first-key"}, "status_daemon": {"token": "t"}}, f)
+
+    manager = ConfigManager()
+    manager.config_dir = tmp_path
+    manager.config_file = config_file
+    yaml_load = mocker.spy(yaml, "load")
+
+    first = manager.load()
+    second = manager.load()
+
+    assert yaml_load.call_count == 1
+    assert first is not second
+    assert second.lambda_config.api_key == "first-key"
+
+    # Mutating a loaded config must not leak into later loads
+    first.custom_models["scratch"] = {}
+    assert manager.load().custom_models == {}
+
+    with open(config_file, "w") as f:
+        yaml.dump({"lambda": {"api_key": "second-key"}, "status_daemon": {"token": "t"}}, f)
+    os.utime(config_file, ns=(0, 1))
+
+    assert manager.load().lambda_config.api_key == "second-key"
+    assert yaml_load.call_count == 2
+
+
+def test_validate_custom_model_accepts_attention_shape():
+    """Test validate_custom_model accepts optional KV cache sizing fields."""
+    validate_custom_model({
+        "hf_path": "org/model",
+        "params_billions": 8.0,
+        "quantization": "fp16",
+        "context_length": 131072,
+        "n_layers": 32,
+        "n_kv_heads": 8,
+        "head_dim": 128,
+        "kv_quantization": "int8",
+    })
+
+
+@pytest.mark.parametrize("field,value,match", [
+    ("n_layers", 0, "n_layers must be a positive integer"),
+    ("n_kv_heads", 8.5, "n_kv_heads must be a positive integer"),
+    ("kv_quantization", "fp4", "Invalid kv_quantization"),
+])
+def test_validate_custom_model_rejects_bad_attention_shape(field, value, match):
+    """Test validate_custom_model rejects invalid KV cache sizing fields."""
+    data = {
+        "hf_path": "org/model",
+        "params_billions": 8.0,
+        "quantization": "fp16",
+        "context_length": 8192,
+        field: value,
+    }
+
+    with pytest.raises(ValueError, match=match):
+        validate_custom_model(data)
@@ -3,6 +3,7 @@
 import pytest
 from soong.models import (
     get_recommended_gpu,
+    get_smallest_gpu,
     get_model_config,
     ModelConfig,
     Quantization,
@@ -13,23 +14,24 @@ from soong.models import (
 class TestGetRecommendedGpuDeepseekR170b:
     """Test GPU recommendation for DeepSeek-R1 70B model."""
 
-    def test_returns_80gb_gpu(self):
-        """DeepSeek-R1 70B should recommend 80GB GPU."""
+    def test_returns_48gb_gpu(self):
+        """DeepSeek-R1 70B should recommend 48GB GPU."""
         gpu = get_recommended_gpu("deepseek-r1-70b")
 
-        # Should return a GPU with at least 80GB (needs ~44.5GB + 10% headroom)
+        # Should return a GPU with at least 48GB (needs ~43.2GB incl. 10% headroom)
         assert gpu is not None
         gpu_info = KNOWN_GPUS[gpu]
-        assert gpu_info["vram_gb"] >= 80
+        assert gpu_info["vram_gb"] >= 48
 
     def test_returns_cheapest_viable_gpu(self):
         """Should return the cheapest GPU that can run the model."""
         gpu = get_recommended_gpu("deepseek-r1-70b")
 
-        # Should be 80GB GPU (smallest that fits with headroom)
+        # 35GB weights + 2.7GB KV (80 layers x 8 KV heads x 128 dim, 8K FP16)
+        # + 2GB overhead + 3.5GB activations = 43.2GB: the 48GB GPU just fits
         assert gpu is not None
         gpu_info = KNOWN_GPUS[gpu]
-        assert gpu_info["vram_gb"] == 80
+        assert gpu_info["vram_gb"] == 48
 
     def test_model_min_vram_matches_recommendation(self):
         """Recommended GPU VRAM should match model's min_vram_gb."""
@@ -44,6 +46,21 @@ class TestGetRecommendedGpuDeepseekR170b:
         assert gpu_info["vram_gb"] >= config.min_vram_gb
 
 
+    def test_default_model_estimate_is_pinned(self):
+        """Pin the default model's estimate, which clears 48GB by only 0.02GB.
+
+        A small change to the VRAM formula could silently move the default
+        model's recommendation between 48GB and 80GB GPUs. If this fails,
+        update the docs and the ``available`` hints along with it.
+        """
+        config = get_model_config("deepseek-r1-70b")
+
+        assert config is not None
+        # 35 + 2.684 (KV) + 2 + 3.5 = 43.184GB against 48 * 0.9 = 43.2GB
+        assert config.estimated_vram_gb == pytest.approx(43.184, abs=0.001)
+        assert config.min_vram_gb == 48
+
+
 class TestGetRecommendedGpuLlama8b:
     """Test GPU recommendation for Llama 8B model."""
 
@@ -54,9 +71,9 @@ class TestGetRecommendedGpuLlama8b:
         assert gpu is not None
         gpu_info = KNOWN_GPUS[gpu]
 
-        # 8B FP16: 16GB base + 4GB kv + 2GB overhead + 1.6GB activations = 23.6GB
-        # With 10% headroom needs 26.2GB, rounds up to 40GB
-        assert gpu_info["vram_gb"] == 40
+        # 8B FP16: 16GB base + 1.1GB kv + 2GB overhead + 1.6GB activations = 20.7GB
+        # With 10% headroom needs 23GB, fits a 24GB GPU
+        assert gpu_info["vram_gb"] == 24
 
     def test_does_not_over_provision(self):
         """Should recommend optimal GPU, not over-provision."""
@@ -250,15 +267,15 @@ class TestGpuRecommendationSorting:
     def test_returns_cheapest_not_largest(self):
         """Should return cheapest GPU, not largest."""
         # Small model should get small GPU, not 80GB
-        gpu_small = get_recommended_gpu("mistral-7b")  # Gets 24GB
-        gpu_large = get_recommended_gpu("deepseek-r1-70b")  # Gets 80GB
+        gpu_small = get_recommended_gpu("llama-3.1-8b")  # Gets 24GB
+        gpu_large = get_recommended_gpu("deepseek-r1-70b")  # Gets 48GB
 
         assert gpu_small is not None
         assert gpu_large is not None
 
-        # Small should be 24GB, large should be 80GB
+        # Small should be 24GB, large should be 48GB
         assert KNOWN_GPUS[gpu_small]["vram_gb"] == 24
-        assert KNOWN_GPUS[gpu_large]["vram_gb"] == 80
+        assert KNOWN_GPUS[gpu_large]["vram_gb"] == 48
 
     def test_consistent_recommendations_for_same_size(self):
         """Models with same VRAM needs should get same recommendation."""
@@ -271,3 +288,18 @@ class TestGpuRecommendationSorting:
 
         # Should have same VRAM capacity (though might be different GPU models)
         assert KNOWN_GPUS[gpu1]["vram_gb"] == KNOWN_GPUS[gpu2]["vram_gb"]
+
+
+class TestGetSmallestGpu:
+    """Test picking the smallest known GPU for a VRAM requirement."""
+
+    def test_matches_linear_scan(self):
+        """Should agree with scanning KNOWN_GPUS in VRAM order."""
+        by_vram = sorted(KNOWN_GPUS.items(), key=lambda x: x[1]["vram_gb"])
+        for min_vram in (0, 24, 25, 40, 41.5, 80, 96, 1000, 1440):
+            expected = next((name for name, info in by_vram if info["vram_gb"] >= min_vram), None)
+            assert get_smallest_gpu(min_vram) == expected
+
+    def test_returns_none_when_nothing_fits(self):
+        """Should return None when no known GPU has enough VRAM."""
+        assert get_smallest_gpu(10_000) is None
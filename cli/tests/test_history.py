@@ -119,6 +119,10 @@ class TestHistoryEventSerialization:
         assert dict1 == dict2
         assert dict1 is not dict2  # Different objects
 
+    def test_event_has_no_instance_dict(self, sample_history_event):
+        """HistoryEvent should be slotted to keep large histories compact."""
+        assert not hasattr(sample_history_event, "__dict__")
+
     def test_from_dict_creates_event(self):
         """from_dict() should create HistoryEvent from dictionary."""
         data = {
@@ -312,6 +316,47 @@ class TestHistoryManagerGetLocalHistory:
 
         assert result == []
 
+    def test_get_local_history_mixed_timestamp_formats(self, history_manager_with_temp_dir):
+        """get_local_history() should filter worker, offset, and non-UTC timestamps alike."""
+        now = datetime.now(timezone.utc)
+        recent_ms = (now - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%S.123Z")
+        recent_offset = (now - timedelta(hours=2)).isoformat()
+        # 20 hours ago in UTC, written in UTC-10: its string sorts as old but it is recent
+        recent_non_utc = (now - timedelta(hours=20)).astimezone(
+            timezone(timedelta(hours=-10))
+        ).isoformat()
+        old_ms = (now - timedelta(hours=30)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        base = {
+            "event_type": "termination",
+            "reason": "test",
+            "uptime_minutes": 60,
+            "gpu_type": "gpu_1x_a10",
+            "region": "us-west-1",
+        }
+        data = [
+            {**base, "timestamp": recent_ms, "instance_id": "i-ms"},
+            {**base, "timestamp": recent_offset, "instance_id": "i-offset"},
+            {**base, "timestamp": recent_non_utc, "instance_id": "i-non-utc"},
+            {**base, "timestamp": old_ms, "instance_id": "i-old"},
+        ]
+        history_manager_with_temp_dir.history_file.write_text(json.dumps(data))
+
+        result = history_manager_with_temp_dir.get_local_history(hours=24)
+
+        assert [event.instance_id for event in result] == ["i-ms", "i-offset", "i-non-utc"]
+
+    def test_get_local_history_parses_ties_within_cutoff_second(self):
+        """Timestamps in the same second as the cutoff are compared exactly."""
+        from soong.history import _is_after
+
+        cutoff = datetime(2025, 1, 15, 8, 30, 0, 500000, tzinfo=timezone.utc)
+        prefix = "2025-01-15T08:30:00"
+
+        assert _is_after("2025-01-15T08:30:00.750Z", cutoff, prefix)
+        assert not _is_after("2025-01-15T08:30:00.250Z", cutoff, prefix)
+        assert not _is_after("2025-01-15T08:30:00Z", cutoff, prefix)
+        assert _is_after("2025-01-15T08:30:01Z", cutoff, prefix)
+
     def test_get_local_history_handles_empty_file(self, history_manager_with_temp_dir):
         """get_local_history() should handle empty JSON file."""
         # Write empty array
@@ -390,6 +435,22 @@ class TestHistoryManagerSaveLocalHistory:
         # Should have indentation (pretty-printed)
         assert "\n  " in content  # 2-space indent
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_local_history_roundtrip_with_and_without_orjson(
+        self, history_manager_with_temp_dir, sample_history_events, monkeypatch, use_orjson
+    ):
+        """History files read and write the same whether or not orjson is installed."""
+        if not use_orjson:
+            monkeypatch.setattr("soong.history.orjson", None)
+
+        history_manager_with_temp_dir.save_local_history(sample_history_events)
+        content = history_manager_with_temp_dir.history_file.read_text()
+        result = history_manager_with_temp_dir.get_local_history(hours=24*365)
+
+        assert json.loads(content) == [event.to_dict() for event in sample_history_events]
+        assert "\n  " in content
+        assert result == sample_history_events
+
 
 class TestHistoryManagerFetchRemoteHistory:
     """Test fetch_remote_history() method."""
@@ -402,7 +463,7 @@ class TestHistoryManagerFetchRemoteHistory:
         }
         mock_response.raise_for_status = Mock()
 
-        mock_get = mocker.patch("requests.get", return_value=mock_response)
+        mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
 
         result = history_manager_with_temp_dir.fetch_remote_history(
             "https://worker.example.com", hours=24
@@ -425,7 +486,7 @@ class TestHistoryManagerFetchRemoteHistory:
         mock_response.json.return_value = {"events": []}
         mock_response.raise_for_status = Mock()
 
-        mock_get = mocker.patch("requests.get", return_value=mock_response)
+        mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
 
         history_manager_with_temp_dir.fetch_remote_history(
             "https://worker.example.com", hours=48
@@ -440,7 +501,7 @@ class TestHistoryManagerFetchRemoteHistory:
         mock_response.json.return_value = {"events": []}
         mock_response.raise_for_status = Mock()
 
-        mock_get = mocker.patch("requests.get", return_value=mock_response)
+        mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
 
         history_manager_with_temp_dir.fetch_remote_history("https://worker.example.com")
 
@@ -450,7 +511,7 @@ class TestHistoryManagerFetchRemoteHistory:
     def test_fetch_remote_history_network_error(self, history_manager_with_temp_dir, mocker):
         """fetch_remote_history() should return None on network error."""
         import requests
-        mocker.patch("requests.get", side_effect=requests.RequestException("Network error"))
+        mocker.patch("requests.Session.get", side_effect=requests.RequestException("Network error"))
 
         result = history_manager_with_temp_dir.fetch_remote_history("https://worker.example.com")
 
@@ -462,7 +523,7 @@ class TestHistoryManagerFetchRemoteHistory:
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         result = history_manager_with_temp_dir.fetch_remote_history("https://worker.example.com")
 
@@ -474,7 +535,7 @@ class TestHistoryManagerFetchRemoteHistory:
         mock_response.json.side_effect = json.JSONDecodeError("Invalid", "", 0)
         mock_response.raise_for_status = Mock()
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         result = history_manager_with_temp_dir.fetch_remote_history("https://worker.example.com")
 
@@ -486,7 +547,7 @@ class TestHistoryManagerFetchRemoteHistory:
         mock_response.json.return_value = {"status": "ok"}  # Missing 'events'
         mock_response.raise_for_status = Mock()
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         result = history_manager_with_temp_dir.fetch_remote_history("https://worker.example.com")
 
@@ -506,7 +567,7 @@ class TestHistoryManagerFetchRemoteHistory:
         }
         mock_response.raise_for_status = Mock()
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         result = history_manager_with_temp_dir.fetch_remote_history("https://worker.example.com")
 
@@ -518,7 +579,7 @@ class TestHistoryManagerFetchRemoteHistory:
         mock_response.json.return_value = {"events": []}
         mock_response.raise_for_status = Mock()
 
-        mock_get = mocker.patch("requests.get", return_value=mock_response)
+        mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
 
         history_manager_with_temp_dir.fetch_remote_history("https://worker.example.com")
 
@@ -526,6 +587,23 @@ class TestHistoryManagerFetchRemoteHistory:
         assert call_args[1]["timeout"] == 10
 
 
+    def test_fetch_remote_history_reuses_session(self, history_manager_with_temp_dir, mocker):
+        """Repeated fetches should share the CLI's pooled session."""
+        from soong.cli import _http_session
+        from soong.session import http_session
+
+        mock_response = Mock()
+        mock_response.json.return_value = {"events": []}
+        mock_response.raise_for_status = Mock()
+        mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
+
+        history_manager_with_temp_dir.fetch_remote_history("https://worker.example.com")
+        history_manager_with_temp_dir.fetch_remote_history("https://worker.example.com")
+
+        assert mock_get.call_count == 2
+        assert http_session() is _http_session()
+
+
 class TestHistoryManagerSyncFromWorker:
     """Test sync_from_worker() method."""
 
@@ -537,7 +615,7 @@ class TestHistoryManagerSyncFromWorker:
         }
         mock_response.raise_for_status = Mock()
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         result = history_manager_with_temp_dir.sync_from_worker("https://worker.example.com")
 
@@ -561,7 +639,7 @@ class TestHistoryManagerSyncFromWorker:
         }
         mock_response.raise_for_status = Mock()
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         result = history_manager_with_temp_dir.sync_from_worker("https://worker.example.com", hours=48)
 
@@ -575,7 +653,7 @@ class TestHistoryManagerSyncFromWorker:
 
         # Mock network failure
         import requests
-        mocker.patch("requests.get", side_effect=requests.RequestException("Network error"))
+        mocker.patch("requests.Session.get", side_effect=requests.RequestException("Network error"))
 
         result = history_manager_with_temp_dir.sync_from_worker("https://worker.example.com", hours=24)
 
@@ -591,7 +669,7 @@ class TestHistoryManagerSyncFromWorker:
 
         # Mock network failure
         import requests
-        mocker.patch("requests.get", side_effect=requests.RequestException())
+        mocker.patch("requests.Session.get", side_effect=requests.RequestException())
 
         # Get with longer time window
         result = history_manager_with_temp_dir.sync_from_worker("https://worker.example.com", hours=48)
@@ -605,7 +683,7 @@ class TestHistoryManagerSyncFromWorker:
 
         # Mock network failure
         import requests
-        mocker.patch("requests.get", side_effect=requests.RequestException())
+        mocker.patch("requests.Session.get", side_effect=requests.RequestException())
 
         result = history_manager_with_temp_dir.sync_from_worker("https://worker.example.com")
 
@@ -623,7 +701,7 @@ class TestHistoryManagerSyncFromWorker:
         }
         mock_response.raise_for_status = Mock()
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         result = history_manager_with_temp_dir.sync_from_worker("https://worker.example.com", hours=48)
 
@@ -655,7 +733,7 @@ class TestHistoryManagerIntegration:
         }
         mock_response.raise_for_status = Mock()
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         synced = history_manager_with_temp_dir.sync_from_worker("https://worker.example.com", hours=48)
         assert len(synced) == 1
@@ -682,7 +760,7 @@ class TestHistoryManagerIntegration:
         }
         mock_response.raise_for_status = Mock()
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         synced = history_manager_with_temp_dir.sync_from_worker("https://worker.example.com")
         assert len(synced) == 1
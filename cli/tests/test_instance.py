@@ -4,7 +4,9 @@ import pytest
 import time_machine
 from datetime import timedelta
 from unittest.mock import Mock, patch, call
-from soong.instance import InstanceManager
+from soong.instance import (
+    InstanceManager, StatusDisplay, WaiterConfig, check_service_health, read_cached_instance,
+)
 from soong.lambda_api import LambdaAPIError, Instance
 
 
@@ -278,6 +280,165 @@ def test_wait_for_ready_polls_at_10_second_intervals(
     assert mock_sleep.call_args_list[1] == call(10)
 
 
+@time_machine.travel("2024-01-01 00:00:00", tick=False)
+def test_wait_for_ready_backs_off_with_waiter_config(
+    instance_manager, mock_api, mock_pending_instance, mock_active_instance, mocker
+):
+    """Test wait_for_ready grows the poll interval up to the waiter maximum."""
+    mock_api.get_instance.side_effect = [mock_pending_instance] * 4 + [mock_active_instance]
+    mock_sleep = mocker.patch("time.sleep")
+
+    waiter = WaiterConfig(initial=2, max=5, multiplier=2.0)
+    result = instance_manager.wait_for_ready("i-pending-456", timeout_seconds=60, waiter=waiter)
+
+    assert result == mock_active_instance
+    assert mock_sleep.call_args_list == [call(2), call(4), call(5), call(5)]
+
+
+@time_machine.travel("2024-01-01 00:00:00", tick=False)
+def test_wait_for_ready_uses_max_interval_when_active_without_ip(
+    instance_manager, mock_api, mock_active_instance, mocker
+):
+    """Test wait_for_ready slows to the max interval once booted but IP-less."""
+    no_ip = Instance(
+        id="i-active-123",
+        name="test-instance",
+        ip=None,
+        status="active",
+        instance_type="gpu_1x_a100_sxm4_80gb",
+        region="us-west-1",
+        created_at="2024-01-01T00:00:00Z",
+    )
+    mock_api.get_instance.side_effect = [no_ip, no_ip, mock_active_instance]
+    mock_sleep = mocker.patch("time.sleep")
+
+    waiter = WaiterConfig(initial=2, max=20, multiplier=1.5)
+    result = instance_manager.wait_for_ready("i-active-123", timeout_seconds=60, waiter=waiter)
+
+    assert result == mock_active_instance
+    assert mock_sleep.call_args_list == [call(2), call(20)]
+
+
+@time_machine.travel("2024-01-01 00:00:00", tick=False)
+def test_wait_for_ready_probes_port_once_ip_assigned(
+    instance_manager, mock_api, mocker
+):
+    """Test wait_for_ready stops polling the API once an IP exists and probes the port."""
+    booting_with_ip = Instance(
+        id="i-booting-1",
+        name="test-instance",
+        ip="1.2.3.4",
+        status="booting",
+        instance_type="gpu_1x_a100_sxm4_80gb",
+        region="us-west-1",
+    )
+    mock_api.get_instance.return_value = booting_with_ip
+    mock_probe = mocker.patch("soong.instance.is_port_open", side_effect=[False, False, True])
+    mock_sleep = mocker.patch("time.sleep")
+
+    result = instance_manager.wait_for_ready("i-booting-1", timeout_seconds=60, probe_port=22)
+
+    assert result == booting_with_ip
+    # One poll to find the IP, one refresh once the port opens
+    assert mock_api.get_instance.call_args_list == [call("i-booting-1"), call("i-booting-1")]
+    assert mock_probe.call_count == 3
+    mock_probe.assert_called_with("1.2.3.4", 22)
+    assert mock_sleep.call_args_list == [call(2), call(2)]
+
+
+def test_wait_for_ready_probe_times_out(instance_manager, mock_api, mocker):
+    """Test wait_for_ready returns None if the probed port never opens."""
+    mock_api.get_instance.return_value = Instance(
+        id="i-booting-1",
+        name="test-instance",
+        ip="1.2.3.4",
+        status="booting",
+        instance_type="gpu_1x_a100_sxm4_80gb",
+        region="us-west-1",
+    )
+    mocker.patch("soong.instance.is_port_open", return_value=False)
+
+    with time_machine.travel("2024-01-01 00:00:00", tick=False) as traveller:
+        def mock_sleep(seconds):
+            traveller.shift(timedelta(seconds=seconds))
+
+        mocker.patch("time.sleep", side_effect=mock_sleep)
+
+        result = instance_manager.wait_for_ready("i-booting-1", timeout_seconds=30, probe_port=22)
+
+    assert result is None
+    # Initial poll, then a re-check every waiter.max (10s) while probing
+    assert mock_api.get_instance.call_count == 4
+
+
+def test_wait_for_ready_aborts_when_terminated_while_probing(
+    instance_manager, mock_api, mocker
+):
+    """Test wait_for_ready stops probing once the API reports the instance terminated."""
+    booting = Instance(
+        id="i-booting-1",
+        name="test-instance",
+        ip="1.2.3.4",
+        status="booting",
+        instance_type="gpu_1x_a100_sxm4_80gb",
+        region="us-west-1",
+    )
+    terminated = Instance(
+        id="i-booting-1",
+        name="test-instance",
+        ip="1.2.3.4",
+        status="terminated",
+        instance_type="gpu_1x_a100_sxm4_80gb",
+        region="us-west-1",
+    )
+    mock_api.get_instance.side_effect = [booting, terminated]
+    mock_probe = mocker.patch("soong.instance.is_port_open", return_value=False)
+
+    with time_machine.travel("2024-01-01 00:00:00", tick=False) as traveller:
+        def mock_sleep(seconds):
+            traveller.shift(timedelta(seconds=seconds))
+
+        mocker.patch("time.sleep", side_effect=mock_sleep)
+
+        result = instance_manager.wait_for_ready("i-booting-1", timeout_seconds=600, probe_port=22)
+
+    assert result is None
+    assert mock_api.get_instance.call_count == 2
+    # Probed every 2s until the 10s re-check saw the termination
+    assert mock_probe.call_count == 5
+
+
+@time_machine.travel("2024-01-01 00:00:00", tick=False)
+def test_wait_for_ready_returns_refreshed_instance_after_probe(
+    instance_manager, mock_api, mocker
+):
+    """Test wait_for_ready returns the instance's current state, not the probing snapshot."""
+    booting = Instance(
+        id="i-booting-1",
+        name="test-instance",
+        ip="1.2.3.4",
+        status="booting",
+        instance_type="gpu_1x_a100_sxm4_80gb",
+        region="us-west-1",
+    )
+    active = Instance(
+        id="i-booting-1",
+        name="test-instance",
+        ip="1.2.3.4",
+        status="active",
+        instance_type="gpu_1x_a100_sxm4_80gb",
+        region="us-west-1",
+    )
+    mock_api.get_instance.side_effect = [booting, active]
+    mocker.patch("soong.instance.is_port_open", return_value=True)
+    mocker.patch("time.sleep")
+
+    result = instance_manager.wait_for_ready("i-booting-1", timeout_seconds=60, probe_port=22)
+
+    assert result is active
+    assert result.status == "active"
+
+
 # get_active_instance() tests
 
 
@@ -373,6 +534,75 @@ def test_get_active_instance_ignores_non_active_statuses(
     assert result is None
 
 
+# list_instances() cache tests
+
+
+def test_list_instances_without_cache_always_hits_api(
+    instance_manager, mock_api, mock_active_instance
+):
+    """Test list_instances fetches every time when caching is disabled."""
+    mock_api.list_instances.return_value = [mock_active_instance]
+
+    instance_manager.list_instances()
+    instance_manager.list_instances()
+
+    assert mock_api.list_instances.call_count == 2
+
+
+def test_list_instances_reuses_cache_within_ttl(mock_api, mock_active_instance):
+    """Test a second manager reads the instance list written by the first."""
+    mock_api.api_key = "test_key_12345"
+    mock_api.list_instances.return_value = [mock_active_instance]
+
+    first = InstanceManager(mock_api, cache_ttl=15).list_instances()
+    second = InstanceManager(mock_api, cache_ttl=15).get_active_instance()
+
+    assert first == [mock_active_instance]
+    assert second == mock_active_instance
+    mock_api.list_instances.assert_called_once()
+
+
+def test_list_instances_refresh_bypasses_cache(mock_api, mock_active_instance):
+    """Test refresh=True fetches from the API even with a fresh cache."""
+    mock_api.api_key = "test_key_12345"
+    mock_api.list_instances.return_value = [mock_active_instance]
+    manager = InstanceManager(mock_api, cache_ttl=15)
+
+    manager.list_instances()
+    manager.list_instances(refresh=True)
+
+    assert mock_api.list_instances.call_count == 2
+
+
+def test_invalidate_cache_forces_refetch(mock_api, mock_active_instance):
+    """Test invalidate_cache drops the cached list."""
+    mock_api.api_key = "test_key_12345"
+    mock_api.list_instances.return_value = [mock_active_instance]
+    manager = InstanceManager(mock_api, cache_ttl=15)
+
+    manager.list_instances()
+    manager.invalidate_cache()
+    manager.list_instances()
+
+    assert mock_api.list_instances.call_count == 2
+
+
+def test_read_cached_instance_finds_id_in_cached_list(mock_api, mock_active_instance):
+    """Test read_cached_instance serves an ID from the cached list."""
+    mock_api.api_key = "test_key_12345"
+    mock_api.list_instances.return_value = [mock_active_instance]
+    InstanceManager(mock_api, cache_ttl=15).list_instances()
+
+    assert read_cached_instance("test_key_12345", "i-active-123", 15) == mock_active_instance
+    assert read_cached_instance("test_key_12345", "i-unknown", 15) is None
+    assert read_cached_instance("other-key", "i-active-123", 15) is None
+
+
+def test_read_cached_instance_without_cache_returns_none():
+    """Test read_cached_instance returns None when nothing is cached."""
+    assert read_cached_instance("test_key_12345", "i-active-123", 15) is None
+
+
 # poll_status() tests
 
 
@@ -630,3 +860,52 @@ def test_get_active_instance_handles_booting_without_created_at(
     assert result is not None
     assert result.id == "i-active"
     assert result.status == "active"
+
+
+def test_status_display_reuses_text_within_a_tick():
+    """Test StatusDisplay only rebuilds its Text when the tick or status changes."""
+    display = StatusDisplay(start_time=100.0)
+    now = [100.1]
+    display._time_func = lambda: now[0]
+
+    first = display.__rich__()
+    now[0] = 100.4
+    assert display.__rich__() is first
+    assert first.plain == "| Status: booting (elapsed: 0s)"
+
+    now[0] = 101.6
+    after_tick = display.__rich__()
+    assert after_tick is not first
+    assert after_tick.plain == "\\ Status: booting (elapsed: 1s)"
+
+    display.status = "active"
+    assert display.__rich__().plain == "\\ Status: active (elapsed: 1s)"
+
+
+def test_check_service_health_multiplexes_ssh(tmp_path, monkeypatch, mocker):
+    """Test health checks share one SSH control connection."""
+    control_dir = tmp_path / "ssh" / "soong-mux"
+    monkeypatch.setattr("soong.ssh.CONTROL_DIR", control_dir)
+    mock_run = mocker.patch("soong.instance.subprocess.run", return_value=Mock(returncode=0))
+
+    assert check_service_health("10.0.0.5", "/keys/id_ed25519")
+    assert check_service_health("10.0.0.5", "/keys/id_ed25519")
+
+    first, second = (c.args[0] for c in mock_run.call_args_list)
+    assert first == second
+    assert "ControlMaster=auto" in first
+    assert f"ControlPath={control_dir}/%C" in first
+    assert first[-2:] == ["ubuntu@10.0.0.5", "curl -sf http://localhost:8080/health"]
+
+
+def test_wait_for_services_polls_at_health_interval(instance_manager, mocker):
+    """Test wait_for_services rechecks health every HEALTH_INTERVAL seconds."""
+    mock_health = mocker.patch(
+        "soong.instance.check_service_health", side_effect=[False, False, True]
+    )
+    mock_sleep = mocker.patch("soong.instance.time.sleep")
+
+    assert instance_manager.wait_for_services("10.0.0.5", "/keys/id_ed25519")
+
+    assert mock_health.call_count == 3
+    assert mock_sleep.call_args_list == [call(InstanceManager.HEALTH_INTERVAL)] * 2
@@ -1,18 +1,44 @@
 """Tests for lambda_api.py Lambda Labs API client."""
 
+import json
 import pytest
 import requests
 import responses
+from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch, MagicMock
+from soong import lambda_api
 from soong.lambda_api import (
     InstanceType,
     Instance,
     LambdaAPI,
     LambdaAPIError,
+    parse_timestamp,
 )
 
 
+class TestParseTimestamp:
+    """Test parse_timestamp helper."""
+
+    def test_parse_timestamp_z_suffix(self):
+        """Test a trailing Z is read as UTC."""
+        assert parse_timestamp("2026-01-01T10:00:00Z") == datetime(2026, 1, 1, 10, tzinfo=timezone.utc)
+
+    def test_parse_timestamp_with_offset(self):
+        """Test an explicit offset is kept."""
+        parsed = parse_timestamp("2026-01-01T10:00:00+02:00")
+        assert parsed.utcoffset() == timedelta(hours=2)
+
+    def test_parse_timestamp_without_offset_is_utc(self):
+        """Test a timestamp without an offset is taken as UTC."""
+        assert parse_timestamp("2026-01-01T10:00:00") == datetime(2026, 1, 1, 10, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize("value", [None, "", "not-a-date", 12345])
+    def test_parse_timestamp_invalid_returns_none(self, value):
+        """Test missing or malformed values return None instead of raising."""
+        assert parse_timestamp(value) is None
+
+
 class TestInstanceType:
     """Test InstanceType dataclass and methods."""
 
@@ -561,6 +587,62 @@ class TestInstance:
 
         assert instance.lease_status_style() == "white"
 
+    def test_lease_checks_use_given_now(self):
+        """Test lease checks compare against a caller-supplied time."""
+        instance = Instance(
+            id="instance-123",
+            name="test",
+            ip="192.168.1.100",
+            status="active",
+            instance_type="gpu_1x_a100_sxm4_80gb",
+            region="us-west-1",
+            lease_expires_at="2025-01-01T14:00:00Z",
+        )
+        now = datetime(2025, 1, 1, 13, 30, tzinfo=timezone.utc)
+
+        assert instance.is_lease_expired(now) is False
+        assert instance.lease_status_style(now) == "yellow"
+        assert instance.lease_status_style(now - timedelta(hours=2)) == "green"
+
+    def test_lease_expiry_parsed_once(self, mocker):
+        """Test lease checks share one parse of lease_expires_at."""
+        parse = mocker.spy(lambda_api, "parse_timestamp")
+        instance = Instance(
+            id="instance-123",
+            name="test",
+            ip="192.168.1.100",
+            status="active",
+            instance_type="gpu_1x_a100_sxm4_80gb",
+            region="us-west-1",
+            lease_expires_at="2025-01-01T14:00:00Z",
+        )
+
+        assert instance.is_lease_expired() is True
+        assert instance.lease_status_style() == "red"
+        assert instance.expires_at == datetime(2025, 1, 1, 14, 0, tzinfo=timezone.utc)
+        assert parse.call_count == 1
+
+    def test_lease_expiry_follows_reassignment(self):
+        """Test reassigning lease_expires_at is reflected in lease checks."""
+        instance = Instance(
+            id="instance-123",
+            name="test",
+            ip="192.168.1.100",
+            status="active",
+            instance_type="gpu_1x_a100_sxm4_80gb",
+            region="us-west-1",
+            lease_expires_at="2025-01-01T14:00:00Z",
+        )
+        now = datetime(2025, 1, 1, 15, 0, tzinfo=timezone.utc)
+        assert instance.is_lease_expired(now) is True
+
+        instance.lease_expires_at = "2025-01-01T18:00:00Z"
+
+        assert instance.expires_at == datetime(2025, 1, 1, 18, 0, tzinfo=timezone.utc)
+        assert instance.is_lease_expired(now) is False
+        assert asdict(instance)["lease_expires_at"] == "2025-01-01T18:00:00Z"
+        assert "_expires_at" not in asdict(instance)
+
 
 class TestLambdaAPIError:
     """Test LambdaAPIError exception."""
@@ -644,67 +726,72 @@ class TestLambdaAPIRequestWithRetry:
             timeout=30
         )
 
-    def test_request_with_retry_retries_on_failure(self, mocker):
-        """Test _request_with_retry retries after failure."""
+    def test_request_with_retry_retries_transient_status(self, mock_http, lambda_api_base_url):
+        """Test transient 5xx responses are retried until one succeeds."""
+        url = f"{lambda_api_base_url}/instances"
+        mock_http.add(responses.GET, url, status=503)
+        mock_http.add(responses.GET, url, status=502)
+        mock_http.add(responses.GET, url, json={"data": []}, status=200)
+
         api = LambdaAPI("test-key")
+        result = api._request_with_retry("GET", "instances")
 
-        # First call fails, second succeeds
-        mock_failure = Mock()
-        mock_failure.raise_for_status.side_effect = requests.exceptions.RequestException("Failure")
+        assert result.json() == {"data": []}
+        assert len(mock_http.calls) == 3
 
-        mock_success = Mock()
-        mock_success.raise_for_status = Mock()
+    def test_session_retry_policy(self):
+        """Test the mounted retry policy backs off and honors Retry-After."""
+        api = LambdaAPI("test-key")
+        retry = api.session.get_adapter(api.BASE_URL).max_retries
 
-        mock_session = mocker.patch.object(
-            api.session,
-            "request",
-            side_effect=[mock_failure, mock_success]
-        )
-        mock_sleep = mocker.patch("time.sleep")
+        assert retry.total == api.RETRY_MAX_ATTEMPTS - 1
+        assert retry.respect_retry_after_header
+        assert 429 in retry.status_forcelist
+        assert "POST" not in retry.allowed_methods
 
-        result = api._request_with_retry("GET", "instances")
+        retry = retry.increment("GET", "/instances")
+        assert retry.get_backoff_time() == 0
+        retry = retry.increment("GET", "/instances")
+        assert retry.get_backoff_time() == 2 * api.RETRY_BASE_DELAY
 
-        assert result == mock_success
-        assert mock_session.call_count == 2
-        mock_sleep.assert_called_once_with(1)  # First retry delay
+    def test_request_with_retry_max_retries_exceeded(self, mock_http, lambda_api_base_url, mocker):
+        """Test _request_with_retry raises once retries are used up."""
+        mocker.patch("time.sleep")
+        mock_http.add(responses.GET, f"{lambda_api_base_url}/instances", status=500)
 
-    def test_request_with_retry_exponential_backoff(self, mocker):
-        """Test _request_with_retry uses exponential backoff."""
         api = LambdaAPI("test-key")
 
-        # Fail twice, succeed on third
-        mock_failure = Mock()
-        mock_failure.raise_for_status.side_effect = requests.exceptions.RequestException("Failure")
+        with pytest.raises(LambdaAPIError, match="API request failed") as exc_info:
+            api._request_with_retry("GET", "instances")
 
-        mock_success = Mock()
-        mock_success.raise_for_status = Mock()
+        assert exc_info.value.status_code == 500
+        assert len(mock_http.calls) == api.RETRY_MAX_ATTEMPTS
 
-        mocker.patch.object(
-            api.session,
-            "request",
-            side_effect=[mock_failure, mock_failure, mock_success]
-        )
+    def test_request_with_retry_client_error_not_retried(self, mock_http, lambda_api_base_url, mocker):
+        """Test 4xx responses fail on the first attempt."""
         mock_sleep = mocker.patch("time.sleep")
+        mock_http.add(responses.GET, f"{lambda_api_base_url}/instance-types", status=401)
 
-        api._request_with_retry("GET", "instances")
+        api = LambdaAPI("bad-key")
 
-        # Verify exponential backoff delays: 1s, 2s
-        assert mock_sleep.call_count == 2
-        assert mock_sleep.call_args_list[0][0][0] == 1  # First retry: 1s
-        assert mock_sleep.call_args_list[1][0][0] == 2  # Second retry: 2s
+        with pytest.raises(LambdaAPIError) as exc_info:
+            api._request_with_retry("GET", "instance-types")
 
-    def test_request_with_retry_max_retries_exceeded(self, mocker):
-        """Test _request_with_retry raises after max retries."""
-        api = LambdaAPI("test-key")
-
-        mock_failure = Mock()
-        mock_failure.raise_for_status.side_effect = requests.exceptions.RequestException("Failure")
+        assert exc_info.value.status_code == 401
+        assert len(mock_http.calls) == 1
+        mock_sleep.assert_not_called()
 
-        mocker.patch.object(api.session, "request", return_value=mock_failure)
+    def test_request_with_retry_post_not_retried_on_status(self, mock_http, lambda_api_base_url, mocker):
+        """Test a POST that reached the server is never sent twice."""
         mocker.patch("time.sleep")
+        mock_http.add(responses.POST, f"{lambda_api_base_url}/instance-operations/launch", status=503)
 
-        with pytest.raises(LambdaAPIError, match="API request failed after 3 attempts"):
-            api._request_with_retry("GET", "instances")
+        api = LambdaAPI("test-key")
+
+        with pytest.raises(LambdaAPIError):
+            api._request_with_retry("POST", "instance-operations/launch", json={})
+
+        assert len(mock_http.calls) == 1
 
     def test_request_with_retry_includes_original_error(self, mocker):
         """Test _request_with_retry includes original error in exception."""
@@ -870,23 +957,22 @@ class TestInstanceFromApiResponseIntegration:
     def test_get_instance_with_booting_response(self, mock_http, lambda_api_base_url):
         """Integration test: get_instance works with booting instance response.
 
-        This is the exact call path that crashed: get_instance -> list_instances.
+        wait_for_ready polls get_instance, so it must parse the same sparse
+        payload while the instance boots.
         """
         booting_response = {
-            "data": [
-                {
-                    "id": "target-instance-xyz",
-                    "status": "booting",
-                    "region": {"name": "us-east-3", "description": "US East"},
-                    "instance_type": {"name": "gpu_1x_gh200"}
-                    # No created_at, ip, name, lease_expires_at
-                }
-            ]
+            "data": {
+                "id": "target-instance-xyz",
+                "status": "booting",
+                "region": {"name": "us-east-3", "description": "US East"},
+                "instance_type": {"name": "gpu_1x_gh200"}
+                # No created_at, ip, name, lease_expires_at
+            }
         }
 
         mock_http.add(
             responses.GET,
-            f"{lambda_api_base_url}/instances",
+            f"{lambda_api_base_url}/instances/target-instance-xyz",
             json=booting_response,
             status=200,
         )
@@ -929,6 +1015,7 @@ class TestLambdaAPIListInstances:
                 }
             ]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -948,6 +1035,7 @@ class TestLambdaAPIListInstances:
 
         mock_response = Mock()
         mock_response.json.return_value = {"data": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -961,6 +1049,7 @@ class TestLambdaAPIListInstances:
 
         mock_response = Mock()
         mock_response.json.return_value = {}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -968,6 +1057,19 @@ class TestLambdaAPIListInstances:
 
         assert instances == []
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_list_instances_decodes_with_and_without_orjson(
+        self, mock_lambda_http, monkeypatch, use_orjson
+    ):
+        """Test responses decode the same whether or not orjson is installed."""
+        if not use_orjson:
+            monkeypatch.setattr("soong.lambda_api.orjson", None)
+
+        instances = LambdaAPI("test-key").list_instances()
+
+        assert [i.id for i in instances] == ["inst_abc123xyz"]
+        assert instances[0].ip == "1.2.3.4"
+
 
 class TestLambdaAPILaunchInstance:
     """Test LambdaAPI.launch_instance method."""
@@ -982,6 +1084,7 @@ class TestLambdaAPILaunchInstance:
         mock_response.json.return_value = {
             "data": {"instance_ids": [unique_instance_id]}
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mock_request = mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -1012,6 +1115,7 @@ class TestLambdaAPILaunchInstance:
         mock_response.json.return_value = {
             "data": {"instance_ids": ["instance-123"]}
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mock_request = mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -1033,6 +1137,7 @@ class TestLambdaAPILaunchInstance:
         mock_response.json.return_value = {
             "data": {"instance_ids": ["instance-123"]}
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mock_request = mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -1054,6 +1159,7 @@ class TestLambdaAPILaunchInstance:
         mock_response.json.return_value = {
             "data": {"instance_ids": []}
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -1072,6 +1178,7 @@ class TestLambdaAPILaunchInstance:
         mock_response.json.return_value = {
             "data": {"instance_ids": ["instance-1", "instance-2"]}
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -1096,6 +1203,7 @@ class TestLambdaAPITerminateInstance:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": {"terminated_instances": [unique_terminate_id]}}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_request = mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
         api.terminate_instance(unique_terminate_id)
@@ -1126,69 +1234,71 @@ class TestLambdaAPIGetInstance:
     """Test LambdaAPI.get_instance method."""
 
     def test_get_instance_found(self, mocker):
-        """Test get_instance returns instance when found."""
+        """Test get_instance fetches a single instance by ID."""
         api = LambdaAPI("test-key")
 
-        mock_instances = [
-            Instance(
-                id="instance-1",
-                name="first",
-                ip="192.168.1.100",
-                status="active",
-                instance_type="gpu_1x_a100_sxm4_80gb",
-                region="us-west-1",
-                created_at="2025-01-01T10:00:00Z"
-            ),
-            Instance(
-                id="instance-2",
-                name="second",
-                ip="192.168.1.101",
-                status="active",
-                instance_type="gpu_1x_a10",
-                region="us-east-1",
-                created_at="2025-01-01T11:00:00Z"
-            )
-        ]
-
-        mocker.patch.object(api, "list_instances", return_value=mock_instances)
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "data": {
+                "id": "instance-2",
+                "name": "second",
+                "ip": "192.168.1.101",
+                "status": "active",
+                "instance_type": {"name": "gpu_1x_a10"},
+                "region": {"name": "us-east-1"},
+                "created_at": "2025-01-01T11:00:00Z",
+            }
+        }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        request = mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
         instance = api.get_instance("instance-2")
 
+        request.assert_called_once_with("GET", "instances/instance-2")
         assert instance is not None
         assert instance.id == "instance-2"
         assert instance.name == "second"
 
     def test_get_instance_not_found(self, mocker):
-        """Test get_instance returns None when not found."""
+        """Test get_instance returns None when the API reports 404."""
         api = LambdaAPI("test-key")
 
-        mock_instances = [
-            Instance(
-                id="instance-1",
-                name="first",
-                ip="192.168.1.100",
-                status="active",
-                instance_type="gpu_1x_a100_sxm4_80gb",
-                region="us-west-1",
-                created_at="2025-01-01T10:00:00Z"
-            )
-        ]
-
-        mocker.patch.object(api, "list_instances", return_value=mock_instances)
+        mocker.patch.object(
+            api, "_request_with_retry",
+            side_effect=LambdaAPIError("404 Not Found", status_code=404),
+        )
 
         instance = api.get_instance("nonexistent-id")
 
         assert instance is None
 
-    def test_get_instance_empty_list(self, mocker):
-        """Test get_instance handles empty instance list."""
+    def test_get_instance_other_errors_propagate(self, mocker):
+        """Test get_instance doesn't mistake other failures for a missing instance."""
         api = LambdaAPI("test-key")
 
-        mocker.patch.object(api, "list_instances", return_value=[])
+        mocker.patch.object(
+            api, "_request_with_retry",
+            side_effect=LambdaAPIError("500 Server Error", status_code=500),
+        )
 
-        instance = api.get_instance("instance-123")
+        with pytest.raises(LambdaAPIError):
+            api.get_instance("instance-123")
 
-        assert instance is None
+    def test_get_instance_404_not_retried(self, mock_http, lambda_api_base_url, mocker):
+        """Test a 404 fails fast instead of backing off and retrying."""
+        mock_sleep = mocker.patch("time.sleep")
+        mock_http.add(
+            responses.GET,
+            f"{lambda_api_base_url}/instances/gone-instance",
+            json={"error": {"code": "global/object-does-not-exist"}},
+            status=404,
+        )
+
+        api = LambdaAPI("test-key")
+
+        assert api.get_instance("gone-instance") is None
+        assert len(mock_http.calls) == 1
+        mock_sleep.assert_not_called()
 
 
 class TestLambdaAPIListSSHKeys:
@@ -1208,6 +1318,7 @@ class TestLambdaAPIListSSHKeys:
                 {"name": unique_keys[2], "public_key": "ssh-rsa AAAAB3NzaC1...unique3"}
             ]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -1226,6 +1337,7 @@ class TestLambdaAPIListSSHKeys:
 
         mock_response = Mock()
         mock_response.json.return_value = {"data": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -1239,6 +1351,7 @@ class TestLambdaAPIListSSHKeys:
 
         mock_response = Mock()
         mock_response.json.return_value = {}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -1285,6 +1398,7 @@ class TestLambdaAPIListInstanceTypes:
                 }
             }
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -1304,6 +1418,7 @@ class TestLambdaAPIListInstanceTypes:
 
         mock_response = Mock()
         mock_response.json.return_value = {"data": {}}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
@@ -1317,6 +1432,7 @@ class TestLambdaAPIListInstanceTypes:
 
         mock_response = Mock()
         mock_response.json.return_value = {}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         mocker.patch.object(api, "_request_with_retry", return_value=mock_response)
 
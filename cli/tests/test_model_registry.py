@@ -234,6 +234,13 @@ class TestGetModelGpuMapping:
                 f"Mapping contains unknown model {model_id}"
             )
 
+    def test_returns_independent_copy(self):
+        """Editing the returned mapping must not change later recommendations."""
+        mapping = get_model_gpu_mapping()
+        mapping["mistral-7b"] = "not-a-gpu"
+
+        assert get_model_gpu_mapping()["mistral-7b"] != "not-a-gpu"
+
 
 class TestModelRegistryConsistency:
     """Test consistency between KNOWN_MODELS and MODEL_INFO."""
@@ -265,3 +272,10 @@ class TestModelRegistryConsistency:
         assert any(p < 10 for p in params), "No small models"
         assert any(10 <= p <= 40 for p in params), "No medium models"
         assert any(p > 40 for p in params), "No large models"
+
+    def test_registry_is_read_only(self):
+        """KNOWN_MODELS and MODEL_INFO should reject edits after import."""
+        with pytest.raises(TypeError):
+            KNOWN_MODELS["scratch"] = KNOWN_MODELS["mistral-7b"]
+        with pytest.raises(TypeError):
+            del MODEL_INFO["mistral-7b"]
@@ -1,6 +1,7 @@
 """Tests for ssh.py SSH tunnel management."""
 
 import pytest
+import re
 import signal
 from pathlib import Path
 from unittest.mock import Mock, MagicMock
@@ -16,6 +17,14 @@ def ssh_key_path(tmp_path):
     return str(key_path)
 
 
+@pytest.fixture(autouse=True)
+def control_dir(tmp_path, monkeypatch):
+    """Keep SSH control sockets out of the real ~/.ssh."""
+    path = tmp_path / "ssh" / "soong-mux"
+    monkeypatch.setattr("soong.ssh.CONTROL_DIR", path)
+    return path
+
+
 @pytest.fixture
 def tunnel_manager(ssh_key_path, tmp_path):
     """SSHTunnelManager instance with temporary PID file location."""
@@ -426,10 +435,38 @@ def test_find_tunnel_pid_success(tunnel_manager, instance_ip, mocker):
 
     # Verify pgrep command (Pattern #2 & #5 fix)
     call_args = mock_subprocess.call_args[0][0]
-    expected_cmd = ["pgrep", "-f", f"ssh.*{instance_ip}"]
+    expected_cmd = ["pgrep", "-f", r"^ssh -N .*@203\.0\.113\.42$"]
     assert_exact_command(call_args, expected_cmd)
 
 
+def test_find_tunnel_pid_matches_tunnel_not_control_master(
+    tunnel_manager, instance_ip, mocker
+):
+    """Test _find_tunnel_pid's pattern skips mux masters to the same host."""
+    mock_subprocess = mocker.patch("soong.ssh.subprocess.run")
+    mock_subprocess.return_value = Mock(returncode=0, stdout="4242\n")
+    forwards = ["8000:localhost:8000", "5678:localhost:5678"]
+
+    tunnel_manager._find_tunnel_pid(instance_ip, forwards)
+
+    pattern = mock_subprocess.call_args[0][0][2]
+    tunnel = (
+        "ssh -N -f -o StrictHostKeyChecking=no -i /key "
+        f"-L 8000:localhost:8000 -L 5678:localhost:5678 ubuntu@{instance_ip}"
+    )
+    master = (
+        "ssh -o ControlMaster=auto -o ControlPath=/home/u/.ssh/soong-mux/ab12 "
+        f"-o ControlPersist=10m ubuntu@{instance_ip} curl -s localhost:8000/health"
+    )
+    other_tunnel = (
+        "ssh -N -f -L 8001:localhost:8000 -L 5678:localhost:5678 "
+        f"ubuntu@{instance_ip}"
+    )
+    assert re.search(pattern, tunnel)
+    assert not re.search(pattern, master)
+    assert not re.search(pattern, other_tunnel)
+
+
 def test_find_tunnel_pid_multiple_pids(tunnel_manager, instance_ip, mocker):
     """Test _find_tunnel_pid returns first PID when multiple found."""
     mock_subprocess = mocker.patch("soong.ssh.subprocess.run")
@@ -507,7 +544,7 @@ def test_find_tunnel_pid_invalid_output(tunnel_manager, instance_ip, mocker):
 # connect_ssh() Tests
 
 
-def test_connect_ssh_success(tunnel_manager, instance_ip, mocker):
+def test_connect_ssh_success(tunnel_manager, instance_ip, control_dir, mocker):
     """Test connect_ssh opens interactive SSH session successfully."""
     mock_subprocess = mocker.patch("soong.ssh.subprocess.run")
     mock_subprocess.return_value = Mock(returncode=0)
@@ -528,6 +565,9 @@ def test_connect_ssh_success(tunnel_manager, instance_ip, mocker):
         "ssh",
         "-o", "StrictHostKeyChecking=no",
         "-o", "UserKnownHostsFile=/dev/null",
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={control_dir}/%C",
+        "-o", "ControlPersist=10m",
         "-i", str(tunnel_manager.ssh_key_path),
         f"testuser@{instance_ip}"
     ]
@@ -537,7 +577,7 @@ def test_connect_ssh_success(tunnel_manager, instance_ip, mocker):
     assert "capture_output" not in mock_subprocess.call_args[1]
 
 
-def test_connect_ssh_default_username(tunnel_manager, instance_ip, mocker):
+def test_connect_ssh_default_username(tunnel_manager, instance_ip, control_dir, mocker):
     """Test connect_ssh uses default username 'ubuntu'."""
     mock_subprocess = mocker.patch("soong.ssh.subprocess.run")
     mock_subprocess.return_value = Mock(returncode=0)
@@ -553,12 +593,25 @@ def test_connect_ssh_default_username(tunnel_manager, instance_ip, mocker):
         "ssh",
         "-o", "StrictHostKeyChecking=no",
         "-o", "UserKnownHostsFile=/dev/null",
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={control_dir}/%C",
+        "-o", "ControlPersist=10m",
         "-i", str(tunnel_manager.ssh_key_path),
         f"ubuntu@{instance_ip}"
     ]
     assert_exact_command(call_args, expected_cmd)
 
 
+def test_connect_ssh_control_dir_private(tunnel_manager, instance_ip, control_dir, mocker):
+    """Test the control socket directory is created readable only by the user."""
+    mocker.patch("soong.ssh.subprocess.run", return_value=Mock(returncode=0))
+
+    tunnel_manager.connect_ssh(instance_ip=instance_ip)
+
+    assert control_dir.is_dir()
+    assert control_dir.stat().st_mode & 0o777 == 0o700
+
+
 def test_connect_ssh_failure(tunnel_manager, instance_ip, mocker):
     """Test connect_ssh handles SSH failure."""
     mock_subprocess = mocker.patch("soong.ssh.subprocess.run")
@@ -589,6 +642,31 @@ def test_connect_ssh_keyboard_interrupt(tunnel_manager, instance_ip, mocker):
     assert result is False
 
 
+def test_connect_ssh_replace_process_execs_ssh(tunnel_manager, instance_ip, mocker):
+    """Test connect_ssh execs ssh in place of the CLI when asked."""
+    mock_execvp = mocker.patch("soong.ssh.os.execvp")
+    mock_subprocess = mocker.patch("soong.ssh.subprocess.run")
+
+    tunnel_manager.connect_ssh(instance_ip=instance_ip, replace_process=True)
+
+    mock_execvp.assert_called_once()
+    program, argv = mock_execvp.call_args[0]
+    assert program == "ssh"
+    assert argv[0] == "ssh"
+    assert argv[-1] == f"ubuntu@{instance_ip}"
+
+
+def test_connect_ssh_replace_process_exec_failure(tunnel_manager, instance_ip, mocker):
+    """Test connect_ssh reports failure when ssh cannot be exec'd."""
+    mocker.patch("soong.ssh.os.execvp", side_effect=FileNotFoundError("ssh"))
+    mock_subprocess = mocker.patch("soong.ssh.subprocess.run")
+
+    result = tunnel_manager.connect_ssh(instance_ip=instance_ip, replace_process=True)
+
+    assert result is False
+    mock_subprocess.assert_not_called()
+
+
 # Edge Cases and Integration Tests
 
 
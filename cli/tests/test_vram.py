@@ -31,6 +31,11 @@ class TestQuantizationBytesPerParam:
         """INT4 should be 0.5 bytes per parameter."""
         assert Quantization.INT4.bytes_per_param == 0.5
 
+    def test_every_quantization_has_bytes_per_param(self):
+        """Every quantization level must have a bytes-per-param entry."""
+        for quant in Quantization:
+            assert quant.bytes_per_param > 0
+
 
 class TestEstimateVramLlama70bInt4:
     """Test VRAM estimation for Llama 70B with INT4 quantization."""
@@ -204,6 +209,119 @@ class TestModelConfigVramProperties:
         assert config.min_vram_gb == 80
 
 
+class TestEstimateVramKvCache:
+    """Test KV cache sizing from the model's attention shape."""
+
+    LLAMA_8B_SHAPE = {"n_layers": 32, "n_kv_heads": 8, "head_dim": 128}
+
+    def test_exact_kv_cache_at_long_context(self):
+        """KV cache should be 2 x layers x KV heads x head dim x bytes x tokens."""
+        result = estimate_vram(
+            params_billions=8.0,
+            quantization=Quantization.FP16,
+            context_length=131072,
+            **self.LLAMA_8B_SHAPE,
+        )
+        # 2 * 32 * 8 * 128 * 2 bytes * 131072 tokens = 17.18GB, far past the 4GB cap
+        assert result["kv_cache_gb"] == 17.2
+        # 16 + 17.2 + 2 + 1.6 = 36.8GB, just over a 40GB GPU's 36GB headroom
+        assert result["min_vram_gb"] == 48
+
+    @pytest.mark.parametrize("kv_quantization,expected", [
+        (Quantization.FP16, 17.2),
+        (Quantization.INT8, 8.6),
+        (Quantization.INT4, 4.3),
+    ])
+    def test_kv_quantization_scales_cache(self, kv_quantization, expected):
+        """Quantizing the KV cache should shrink it by its bytes per element."""
+        result = estimate_vram(
+            params_billions=8.0,
+            quantization=Quantization.FP16,
+            context_length=131072,
+            kv_quantization=kv_quantization,
+            **self.LLAMA_8B_SHAPE,
+        )
+        assert result["kv_cache_gb"] == expected
+        assert result["kv_quantization"] == kv_quantization.value
+
+    def test_unknown_shape_keeps_context_heuristic(self):
+        """Without an attention shape the KV cache falls back to the capped heuristic."""
+        result = estimate_vram(
+            params_billions=8.0,
+            quantization=Quantization.FP16,
+            context_length=131072,
+        )
+        assert result["kv_cache_gb"] == 4.0
+
+    def test_model_config_uses_attention_shape(self):
+        """ModelConfig estimates should match estimate_vram for the same shape."""
+        config = ModelConfig(
+            name="Test Model 8B",
+            model_id="test-model-8b",
+            hf_path="test-org/test-model-8b",
+            params_billions=8.0,
+            default_quantization=Quantization.FP16,
+            context_length=131072,
+            kv_quantization=Quantization.INT8,
+            **self.LLAMA_8B_SHAPE,
+        )
+        result = estimate_vram(
+            8.0, Quantization.FP16, 131072,
+            kv_quantization=Quantization.INT8, **self.LLAMA_8B_SHAPE,
+        )
+
+        assert round(config.kv_cache_gb, 1) == result["kv_cache_gb"]
+        assert round(config.estimated_vram_gb, 1) == result["total_estimated_gb"]
+        assert config.min_vram_gb == result["min_vram_gb"]
+
+    def test_from_dict_reads_attention_shape(self):
+        """Custom models can declare their attention shape and KV cache dtype."""
+        config = ModelConfig.from_dict("custom-8b", {
+            "hf_path": "org/custom-8b",
+            "params_billions": 8.0,
+            "quantization": "fp16",
+            "context_length": 131072,
+            "kv_quantization": "int4",
+            **self.LLAMA_8B_SHAPE,
+        })
+
+        assert config.n_layers == 32
+        assert config.kv_quantization == Quantization.INT4
+        assert round(config.kv_cache_gb, 1) == 4.3
+
+    def test_from_dict_coerces_string_shape_and_null_kv_quantization(self):
+        """String shape values are coerced and a null kv_quantization means FP16."""
+        config = ModelConfig.from_dict("custom-8b", {
+            "hf_path": "org/custom-8b",
+            "params_billions": 8.0,
+            "quantization": "fp16",
+            "context_length": 131072,
+            "n_layers": "32",
+            "n_kv_heads": "8",
+            "head_dim": None,
+            "kv_quantization": None,
+        })
+
+        assert config.n_layers == 32
+        assert config.n_kv_heads == 8
+        assert config.head_dim is None
+        assert config.kv_quantization == Quantization.FP16
+        # Incomplete shape falls back to the capped heuristic
+        assert config.kv_cache_gb == 4.0
+        assert config.estimated_vram_gb > 0
+
+    def test_from_dict_rejects_invalid_kv_quantization(self):
+        """An unknown kv_quantization should be reported under its own name."""
+        with pytest.raises(ValueError, match="Invalid kv_quantization 'fp4'"):
+            ModelConfig.from_dict("custom-8b", {
+                "hf_path": "org/custom-8b",
+                "params_billions": 8.0,
+                "quantization": "fp16",
+                "context_length": 8192,
+                "kv_quantization": "fp4",
+            })
+
+
 class TestEstimateVramEdgeCases:
     """Test edge cases in VRAM estimation."""
 
@@ -254,3 +372,11 @@ class TestEstimateVramEdgeCases:
         assert result["total_estimated_gb"] > 0
         assert isinstance(result["min_vram_gb"], int)
         assert result["min_vram_gb"] > 0
+
+    def test_estimate_on_headroom_boundary_fits(self):
+        """An estimate exactly at a size's 90% headroom still fits that size."""
+        from soong.models import _round_up_vram
+
+        assert _round_up_vram(24 * 0.9) == 24
+        assert _round_up_vram(24 * 0.9 + 0.01) == 40
+        assert _round_up_vram(160 * 0.9 + 0.01) == 160